@@ -0,0 +1,243 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from streamlit.testing.v1 import AppTest
+
+from runtime_stats import peak_rss_mb
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_FILE = os.path.join(APP_DIR, 'benchmark_baseline.json')
+BENCHMARK_RERUNS = 5
+APP_TIMEOUT = 120
+# A metric regresses when it grows past the baseline by this fraction and by more than its noise floor
+REGRESSION_THRESHOLD = 0.25
+METRICS = ['cold_start_s', 'first_render_s', 'rerun_s', 'peak_rss_mb', 'payload_kb']
+NOISE_FLOORS = {'cold_start_s': 0.1, 'first_render_s': 0.05, 'rerun_s': 0.02, 'peak_rss_mb': 10, 'payload_kb': 2}
+
+ORG_INFO = {
+    'name': 'Benchmark Org', 'industry': 'Technology', 'size': '201-1000 employees', 'geography': 'Europe',
+    'ai_state': 'AI in production use', 'ai_budget': '€1M - €5M', 'eu_operations': 'Yes - Primary market',
+    'timeline': 'Within 12 months'
+}
+
+
+def _compliance_codes():
+    """Every question answered, cycling through the four answer options"""
+    import numpy as np
+    from assessment_catalog import build_catalog
+    return (np.arange(len(build_catalog()['questions'])) % 4).astype(np.int8)
+
+
+def _maturity_scores():
+    """Mid-range scores on every Gartner maturity dimension"""
+    from assessment_catalog import maturity_dimensions
+    return {dimension: {'score': 3.2, 'weight': data['weight'], 'weighted_score': 3.2 * data['weight']}
+            for dimension, data in maturity_dimensions.items()}
+
+
+def _rerun(at):
+    at.run()
+
+
+def _toggle_theme(at):
+    theme = next(radio for radio in at.radio if radio.label == "🎨 Theme")
+    theme.set_value('dark' if theme.value == 'light' else 'light').run()
+
+
+def _nudge_slider(label, values):
+    """Interaction that moves a slider back and forth between two values"""
+    def interact(at):
+        slider = next(slider for slider in at.slider if slider.label == label)
+        slider.set_value(values[1] if slider.value == values[0] else values[0]).run()
+    return interact
+
+
+def _click(label):
+    """Interaction that clicks the first button whose label contains the text"""
+    def interact(at):
+        next(button for button in at.button if label in button.label).click().run()
+    return interact
+
+
+def _answer_first_question(at):
+    selectbox = next(box for box in at.selectbox if box.key and box.key.startswith('compliance_'))
+    selectbox.set_value("No - Not Compliant" if selectbox.value == "Yes - Fully Compliant"
+                        else "Yes - Fully Compliant").run()
+
+
+def _enhanced_results_state(at):
+    """Answer every question on the enhanced tool's assessment page, cycling Yes, Partial and No"""
+    at.session_state['page'] = 'assessment'
+    at.session_state['assessment_type'] = 'general'
+    at.run()
+    answers = {box.key: ["Yes", "Partial", "No"][index % 3] for index, box in enumerate(at.selectbox)}
+    return {'page': 'results', 'user_answers': answers, 'org_name': 'Benchmark Org', 'industry': 'Technology'}
+
+
+# Each scenario puts one app on one page, then repeats a typical widget interaction.
+# State is a dict or a function of the AppTest that returns one; dict values may be
+# callables so their imports are not charged to the cold start.
+SCENARIOS = {
+    'atlan_landing': ('atlan-simulator-prod_4.py', {'page': 'landing'}, _toggle_theme),
+    'atlan_rollout': ('atlan-simulator-prod_4.py', {'page': 'rollout'},
+                      _nudge_slider("Number of Data Domains", (5, 6))),
+    'atlan_maturity': ('atlan_simulator_dark.py', {'page': 'maturity'}, _toggle_theme),
+    'atlan_planner': ('atlan-simulator-prod_4.py', {'page': 'implementation'},
+                      _click("Generate Implementation Plan")),
+    'eu_assessment': ('eu-ai-act-assessment.py',
+                      {'current_page': 'compliance_assessment', 'org_info': ORG_INFO, 'ai_role': 'provider',
+                       'assessment_type': 'compliance'}, _answer_first_question),
+    'eu_results': ('eu-ai-act-assessment.py',
+                   {'current_page': 'results', 'org_info': ORG_INFO, 'ai_role': 'both',
+                    'compliance_codes': _compliance_codes}, _rerun),
+    'complete_results': ('complete_fixed_assessment_tool.py',
+                         {'current_page': 'results', 'org_info': ORG_INFO, 'ai_role': 'both',
+                          'assessment_type': 'compliance', 'compliance_codes': _compliance_codes}, _rerun),
+    'combined_results': ('combined-ai-maturity-tool.py',
+                         {'current_page': 'results', 'org_info': ORG_INFO, 'ai_role': 'both',
+                          'assessment_type': 'maturity', 'maturity_scores': _maturity_scores}, _rerun),
+    'enhanced_results': ('enhanced-ai-compliance-tool_3.py', _enhanced_results_state, _rerun)
+}
+
+
+def payload_bytes(node):
+    """Serialized size of every element and block proto in the rendered tree"""
+    proto = getattr(node, 'proto', None)
+    size = proto.ByteSize() if hasattr(proto, 'ByteSize') else 0
+    return size + sum(payload_bytes(child) for child in getattr(node, 'children', {}).values())
+
+
+def _check(at, name, step):
+    """Fail the scenario if the app raised during a run"""
+    if at.exception:
+        raise RuntimeError(f"{name}: {step} raised {at.exception[0].value}")
+
+
+def run_scenario(name, reruns=BENCHMARK_RERUNS):
+    """Measure one scenario in this process; call it from a fresh interpreter for a true cold start"""
+    app, state, interact = SCENARIOS[name]
+    at = AppTest.from_file(os.path.join(APP_DIR, app), default_timeout=APP_TIMEOUT)
+
+    # The landing run imports the app and its modules, which is the cold start a new server pays
+    began = time.perf_counter()
+    at.run()
+    cold_start = time.perf_counter() - began
+    _check(at, name, 'cold start')
+
+    if callable(state):
+        state = state(at)
+    for key, value in state.items():
+        at.session_state[key] = value() if callable(value) else value
+    began = time.perf_counter()
+    at.run()
+    first_render = time.perf_counter() - began
+    _check(at, name, 'first render')
+
+    timings = []
+    for _ in range(reruns):
+        began = time.perf_counter()
+        interact(at)
+        timings.append(time.perf_counter() - began)
+        _check(at, name, 'rerun')
+
+    return {
+        'app': app,
+        'cold_start_s': round(cold_start, 4),
+        'first_render_s': round(first_render, 4),
+        'rerun_s': round(statistics.median(timings), 4),
+        'peak_rss_mb': round(peak_rss_mb(), 1),
+        'payload_kb': round(payload_bytes(at._tree) / 1024, 1)
+    }
+
+
+def measure(name, reruns=BENCHMARK_RERUNS):
+    """Run a scenario in a child interpreter so imports and peak memory start from nothing"""
+    completed = subprocess.run([sys.executable, os.path.abspath(__file__), '--child', name, '--reruns', str(reruns)],
+                               cwd=APP_DIR, capture_output=True, text=True)
+    if completed.returncode:
+        raise RuntimeError(f"{name} failed:\n{completed.stderr.strip()[-2000:]}")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def find_regressions(results, baseline, threshold=REGRESSION_THRESHOLD):
+    """(scenario, metric, baseline, current) for every metric past the threshold and its noise floor"""
+    regressions = []
+    for name, metrics in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        for metric in METRICS:
+            before, after = previous.get(metric), metrics[metric]
+            if before is not None and after > before * (1 + threshold) and after - before > NOISE_FLOORS[metric]:
+                regressions.append((name, metric, before, after))
+    return regressions
+
+
+def load_baseline(path):
+    """Scenario metrics from a baseline file, or nothing if it does not exist yet"""
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as handle:
+        return json.load(handle)['scenarios']
+
+
+def write_baseline(path, results, reruns):
+    """Record the results with the interpreter they were measured on"""
+    with open(path, 'w', encoding='utf-8') as handle:
+        json.dump({'python': sys.version.split()[0], 'platform': sys.platform, 'reruns': reruns,
+                   'scenarios': results}, handle, indent=2, sort_keys=True)
+        handle.write('\n')
+
+
+def main(argv=None):
+    """Benchmark cold start, rerun time, peak memory and payload size of the Streamlit apps"""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument('scenarios', nargs='*', help=f"Scenarios to run (default: all of {', '.join(SCENARIOS)})")
+    parser.add_argument('--reruns', type=int, default=BENCHMARK_RERUNS, help="Interactions timed per scenario")
+    parser.add_argument('--baseline', default=BASELINE_FILE, help="Baseline JSON to compare against")
+    parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD,
+                        help="Allowed growth over the baseline, as a fraction")
+    parser.add_argument('--update-baseline', action='store_true', help="Write these results as the new baseline")
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(run_scenario(args.child, args.reruns)))
+        return 0
+
+    unknown = sorted(set(args.scenarios) - set(SCENARIOS))
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+
+    results = {}
+    print(f"{'scenario':<18}" + ''.join(f"{metric:>16}" for metric in METRICS))
+    for name in args.scenarios or SCENARIOS:
+        results[name] = measure(name, args.reruns)
+        print(f"{name:<18}" + ''.join(f"{results[name][metric]:>16}" for metric in METRICS))
+
+    if args.update_baseline:
+        # Keep entries for scenarios that were not part of this run
+        write_baseline(args.baseline, dict(load_baseline(args.baseline), **results), args.reruns)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    if not baseline:
+        print(f"No baseline at {args.baseline}; run with --update-baseline to record one")
+        return 0
+
+    regressions = find_regressions(results, baseline, args.threshold)
+    for name, metric, before, after in regressions:
+        print(f"REGRESSION {name} {metric}: {before} -> {after} (+{(after / before - 1) * 100 if before else 0:.0f}%)")
+    if not regressions:
+        print(f"No regressions beyond {args.threshold:.0%} of the baseline")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,246 @@
+import plotly.graph_objects as go
+import streamlit as st
+
+from figure_cache import cached_figure
+
+# Custom CSS for better styling
+LIGHT_CSS = """
+<style>
+    .main-header {
+        font-size: 3rem;
+        color: #1f2937;
+        text-align: center;
+        margin-bottom: 1rem;
+    }
+    .sub-header {
+        font-size: 1.2rem;
+        color: #6b7280;
+        text-align: center;
+        margin-bottom: 2rem;
+    }
+    .metric-card {
+        background-color: #f3f4f6;
+        padding: 1.5rem;
+        border-radius: 0.5rem;
+        border: 1px solid #e5e7eb;
+        margin-bottom: 1rem;
+    }
+    .risk-high {
+        color: #dc2626;
+        font-weight: bold;
+    }
+    .risk-medium {
+        color: #f59e0b;
+        font-weight: bold;
+    }
+    .risk-low {
+        color: #10b981;
+        font-weight: bold;
+    }
+    .recommendation-box {
+        background-color: #fef3c7;
+        padding: 1rem;
+        border-radius: 0.5rem;
+        border-left: 4px solid #f59e0b;
+        margin-bottom: 0.5rem;
+    }
+</style>
+"""
+
+# Dark Mode Compatible Custom CSS
+DARK_CSS = """
+<style>
+    /* Use CSS variables for theme-aware colors */
+    :root {
+        --bg-primary: #ffffff;
+        --bg-secondary: #f3f4f6;
+        --bg-card: #ffffff;
+        --text-primary: #1f2937;
+        --text-secondary: #6b7280;
+        --border-color: #e5e7eb;
+        --shadow-color: rgba(0, 0, 0, 0.1);
+        --link-color: #3b82f6;
+        --success-color: #10b981;
+        --warning-color: #f59e0b;
+        --error-color: #ef4444;
+        --info-bg: #e0f2fe;
+        --warning-bg: #fef3c7;
+        --success-bg: #d1fae5;
+        --error-bg: #fee2e2;
+    }
+    
+    /* Dark mode overrides */
+    @media (prefers-color-scheme: dark) {
+        :root {
+            --bg-primary: #0e1117;
+            --bg-secondary: #262730;
+            --bg-card: #1a1d25;
+            --text-primary: #fafafa;
+            --text-secondary: #b8bcc8;
+            --border-color: #30333d;
+            --shadow-color: rgba(0, 0, 0, 0.3);
+            --link-color: #58a6ff;
+            --success-color: #3fb950;
+            --warning-color: #d29922;
+            --error-color: #f85149;
+            --info-bg: #1f2937;
+            --warning-bg: #2d2006;
+            --success-bg: #0d2818;
+            --error-bg: #2d0f0f;
+        }
+    }
+    
+    /* Streamlit specific dark mode detection */
+    [data-theme="dark"] {
+        --bg-primary: #0e1117;
+        --bg-secondary: #262730;
+        --bg-card: #1a1d25;
+        --text-primary: #fafafa;
+        --text-secondary: #b8bcc8;
+        --border-color: #30333d;
+        --shadow-color: rgba(0, 0, 0, 0.3);
+        --link-color: #58a6ff;
+        --success-color: #3fb950;
+        --warning-color: #d29922;
+        --error-color: #f85149;
+        --info-bg: #1f2937;
+        --warning-bg: #2d2006;
+        --success-bg: #0d2818;
+        --error-bg: #2d0f0f;
+    }
+    
+    .main-header {
+        font-size: 3rem;
+        color: var(--text-primary);
+        text-align: center;
+        margin-bottom: 1rem;
+    }
+    
+    .sub-header {
+        font-size: 1.2rem;
+        color: var(--text-secondary);
+        text-align: center;
+        margin-bottom: 2rem;
+    }
+    
+    .metric-card {
+        background-color: var(--bg-card);
+        padding: 1.5rem;
+        border-radius: 0.5rem;
+        border: 1px solid var(--border-color);
+        margin-bottom: 1rem;
+        box-shadow: 0 1px 3px var(--shadow-color);
+    }
+    
+    .metric-card h3 {
+        color: var(--text-primary);
+    }
+    
+    .metric-card p {
+        color: var(--text-secondary);
+    }
+    
+    .risk-high {
+        color: var(--error-color);
+        font-weight: bold;
+    }
+    
+    .risk-medium {
+        color: var(--warning-color);
+        font-weight: bold;
+    }
+    
+    .risk-low {
+        color: var(--success-color);
+        font-weight: bold;
+    }
+    
+    .recommendation-box {
+        background-color: var(--warning-bg);
+        padding: 1rem;
+        border-radius: 0.5rem;
+        border-left: 4px solid var(--warning-color);
+        margin-bottom: 0.5rem;
+        color: var(--text-primary);
+    }
+    
+    .recommendation-box h4 {
+        color: var(--text-primary);
+    }
+    
+    /* Fix for Streamlit native elements */
+    .stApp {
+        background-color: var(--bg-primary);
+        color: var(--text-primary);
+    }
+    
+    /* Tab styling for dark mode */
+    .stTabs [data-baseweb="tab-list"] {
+        background-color: var(--bg-secondary);
+        border-radius: 0.5rem;
+    }
+    
+    .stTabs [data-baseweb="tab"] {
+        color: var(--text-secondary);
+    }
+    
+    .stTabs [aria-selected="true"] {
+        color: var(--text-primary) !important;
+        background-color: var(--bg-card);
+    }
+    
+    /* Expander styling */
+    .streamlit-expanderHeader {
+        background-color: var(--bg-secondary) !important;
+        color: var(--text-primary) !important;
+        border: 1px solid var(--border-color) !important;
+    }
+    
+    /* Metric styling */
+    [data-testid="metric-container"] {
+        background-color: var(--bg-card);
+        border: 1px solid var(--border-color);
+        padding: 1rem;
+        border-radius: 0.5rem;
+        box-shadow: 0 1px 3px var(--shadow-color);
+    }
+</style>
+"""
+
+# Layout patches applied to theme-agnostic figures at render time
+DARK_LAYOUT = dict(
+    plot_bgcolor='rgba(0,0,0,0)',
+    paper_bgcolor='rgba(0,0,0,0)',
+    xaxis=dict(
+        gridcolor='rgba(128,128,128,0.2)',
+        zerolinecolor='rgba(128,128,128,0.2)',
+    ),
+    yaxis=dict(
+        gridcolor='rgba(128,128,128,0.2)',
+        zerolinecolor='rgba(128,128,128,0.2)',
+    ),
+    colorway=['#3b82f6', '#10b981', '#f59e0b', '#8b5cf6', '#ef4444', '#14b8a6', '#6366f1', '#f97316']
+)
+
+LIGHT_THEME = {'name': 'light', 'label': '☀️ Light', 'css': LIGHT_CSS, 'layout': {}}
+DARK_THEME = {'name': 'dark', 'label': '🌙 Dark', 'css': DARK_CSS, 'layout': DARK_LAYOUT}
+THEMES = {theme['name']: theme for theme in [LIGHT_THEME, DARK_THEME]}
+
+
+def current_theme():
+    """Theme selected for this session"""
+    return THEMES[st.session_state.get('theme', LIGHT_THEME['name'])]
+
+
+def themed_figure(fig, theme):
+    """Copy of a figure with the theme's layout patch applied; the source figure is left untouched"""
+    if not theme['layout']:
+        return fig
+    return go.Figure(fig).update_layout(theme['layout'])
+
+
+def show_figure(builder, *inputs, **kwargs):
+    """Render builder(*inputs) in the session's theme, reusing the cached figure while the inputs are unchanged"""
+    theme = current_theme()
+    fig = cached_figure(builder, inputs, theme['name'], lambda base: themed_figure(base, theme))
+    st.plotly_chart(fig, use_container_width=True, **kwargs)
@@ -0,0 +1,396 @@
+from functools import lru_cache
+from types import MappingProxyType
+
+from assessment_catalog import freeze
+
+# DAMA-DMBOK Aligned Maturity Framework with Atlan Implementation Focus
+MATURITY_LEVELS = {
+    "Level 0: Non-existent": {
+        "description": "No awareness of data management needs",
+        "characteristics": [
+            "No data management practices",
+            "Data managed in silos",
+            "No data governance awareness",
+            "High risk of data incidents"
+        ],
+        "dama_dimensions": {
+            "Data Governance": "Non-existent",
+            "Data Architecture": "Ad-hoc",
+            "Data Quality": "Unmanaged",
+            "Metadata": "None"
+        },
+        "atlan_readiness": {
+            "implementation_focus": "Basic catalog setup - Start with asset inventory",
+            "day_1_requirements": ["Executive sponsorship", "3-5 pilot data sources", "Basic team structure"],
+            "ps_hours_estimate": "200-250 hours",
+            "ps_focus": "Foundation setup & migration",
+            "data_marketplace_readiness": "Not ready - Build foundation first"
+        }
+    },
+    "Level 1: Initial/Ad-hoc": {
+        "description": "Limited awareness, reactive approach",
+        "characteristics": [
+            "Inconsistent data practices",
+            "Individual heroics",
+            "Reactive problem solving",
+            "Limited documentation"
+        ],
+        "dama_dimensions": {
+            "Data Governance": "Informal",
+            "Data Architecture": "Basic documentation",
+            "Data Quality": "Issue-based",
+            "Metadata": "Spreadsheet-based"
+        },
+        "atlan_readiness": {
+            "implementation_focus": "Data Domains setup - Establish organizational structure",
+            "day_1_requirements": ["Domain boundaries defined", "Data stewards identified", "Basic glossary"],
+            "ps_hours_estimate": "150-200 hours",
+            "ps_focus": "Domain setup & basic governance",
+            "data_marketplace_readiness": "Basic discovery only"
+        }
+    },
+    "Level 2: Repeatable": {
+        "description": "Developing awareness, some processes",
+        "characteristics": [
+            "Some documented procedures",
+            "Basic roles defined",
+            "Emerging standards",
+            "Project-based governance"
+        ],
+        "dama_dimensions": {
+            "Data Governance": "Steering committee formed",
+            "Data Architecture": "Logical models exist",
+            "Data Quality": "Basic profiling",
+            "Metadata": "Repository implemented (Atlan)"
+        },
+        "atlan_readiness": {
+            "implementation_focus": "Data Products creation - Package domains into consumable products",
+            "day_1_requirements": ["Business glossary", "Access policies", "Quality metrics", "Workflows"],
+            "ps_hours_estimate": "120-150 hours",
+            "ps_focus": "Product thinking & workflows",
+            "data_marketplace_readiness": "Ready for basic self-service"
+        }
+    },
+    "Level 3: Defined Process": {
+        "description": "Formal standards and procedures",
+        "characteristics": [
+            "Enterprise standards defined",
+            "Clear accountability",
+            "Proactive management",
+            "Integrated processes"
+        ],
+        "dama_dimensions": {
+            "Data Governance": "Charter & policies active",
+            "Data Architecture": "Enterprise models",
+            "Data Quality": "Automated monitoring",
+            "Metadata": "Active management"
+        },
+        "atlan_readiness": {
+            "implementation_focus": "Full Data Marketplace - Self-service with governance",
+            "day_1_requirements": ["Product catalog", "Automated workflows", "Quality SLAs", "Request management"],
+            "ps_hours_estimate": "80-120 hours",
+            "ps_focus": "Marketplace & automation",
+            "data_marketplace_readiness": "Full self-service marketplace"
+        }
+    },
+    "Level 4: Managed and Measurable": {
+        "description": "Quantitative management and control",
+        "characteristics": [
+            "Metrics-driven decisions",
+            "Predictable outcomes",
+            "Risk-based approach",
+            "Continuous monitoring"
+        ],
+        "dama_dimensions": {
+            "Data Governance": "Metrics & KPIs tracked",
+            "Data Architecture": "Impact analysis capable",
+            "Data Quality": "SLA-driven",
+            "Metadata": "Automated lineage"
+        },
+        "atlan_readiness": {
+            "implementation_focus": "Advanced marketplace with analytics - Insights-driven governance",
+            "day_1_requirements": ["Usage analytics", "API integrations", "Custom workflows", "Compliance automation"],
+            "ps_hours_estimate": "60-80 hours",
+            "ps_focus": "Advanced use cases",
+            "data_marketplace_readiness": "Analytics-driven marketplace"
+        }
+    },
+    "Level 5: Optimized": {
+        "description": "Continuous improvement culture",
+        "characteristics": [
+            "Innovation in practices",
+            "Self-organizing teams",
+            "Predictive capabilities",
+            "Business value focus"
+        ],
+        "dama_dimensions": {
+            "Data Governance": "Value-driven optimization",
+            "Data Architecture": "Adaptive architecture",
+            "Data Quality": "Predictive quality",
+            "Metadata": "AI-enhanced discovery"
+        },
+        "atlan_readiness": {
+            "implementation_focus": "AI-powered marketplace - Predictive and proactive",
+            "day_1_requirements": ["AI recommendations", "Predictive governance", "Data mesh", "Value optimization"],
+            "ps_hours_estimate": "40-60 hours",
+            "ps_focus": "Innovation & optimization",
+            "data_marketplace_readiness": "AI-powered predictive marketplace"
+        }
+    }
+}
+
+# Atlan Feature Implementation Journey
+ATLAN_FEATURE_JOURNEY = {
+    "foundation": {
+        "name": "Foundation Layer",
+        "features": [
+            "Asset discovery & cataloging",
+            "Basic search functionality",
+            "Connector setup",
+            "User authentication (SSO)"
+        ],
+        "maturity_level": "Level 0-1",
+        "timeline": "Weeks 1-4"
+    },
+    "data_domains": {
+        "name": "Data Domains",
+        "description": "Organizational structure for data ownership",
+        "features": [
+            "Domain boundaries definition",
+            "Domain ownership assignment",
+            "Domain-specific glossaries",
+            "Domain-based access control"
+        ],
+        "prerequisites": ["Foundation layer complete", "Stewards identified"],
+        "maturity_level": "Level 1-2",
+        "timeline": "Weeks 4-8"
+    },
+    "data_products": {
+        "name": "Data Products",
+        "description": "Curated, packaged data assets for consumption",
+        "features": [
+            "Product templates & schemas",
+            "Product ownership & SLAs",
+            "Quality scorecards",
+            "Consumer feedback loops"
+        ],
+        "prerequisites": ["Domains established", "Quality metrics defined"],
+        "maturity_level": "Level 2-3",
+        "timeline": "Weeks 8-12"
+    },
+    "governance_workflows": {
+        "name": "Governance Workflows",
+        "description": "Automated processes for data governance",
+        "features": [
+            "Access request workflows",
+            "Data quality issue workflows",
+            "Change approval processes",
+            "Compliance workflows"
+        ],
+        "prerequisites": ["Policies defined", "Roles established"],
+        "maturity_level": "Level 2-3",
+        "timeline": "Weeks 6-10"
+    },
+    "data_marketplace": {
+        "name": "Data Marketplace",
+        "description": "Self-service data discovery and consumption",
+        "features": [
+            "Searchable product catalog",
+            "Self-service access requests",
+            "Usage analytics",
+            "Consumer ratings & reviews"
+        ],
+        "prerequisites": ["Products created", "Workflows automated"],
+        "maturity_level": "Level 3+",
+        "timeline": "Weeks 12-16"
+    }
+}
+
+# Professional Services Components
+PS_COMPONENTS = {
+    "TAM (Technical Account Manager)": {
+        "responsibilities": [
+            "Strategic planning & roadmap",
+            "Stakeholder alignment",
+            "Change management",
+            "Adoption strategy",
+            "Success metrics tracking"
+        ],
+        "hours_by_phase": {
+            "Planning": 20,
+            "Implementation": 40,
+            "Rollout": 30,
+            "Optimization": 10
+        }
+    },
+    "CSA (Customer Solution Architect)": {
+        "responsibilities": [
+            "Technical architecture",
+            "Integration design",
+            "Migration strategy",
+            "Best practices advisory",
+            "Technical enablement"
+        ],
+        "hours_by_phase": {
+            "Planning": 30,
+            "Implementation": 50,
+            "Rollout": 20,
+            "Optimization": 20
+        }
+    },
+    "Implementation Engineer": {
+        "responsibilities": [
+            "Connector setup",
+            "Lineage configuration",
+            "Custom integrations",
+            "Technical troubleshooting",
+            "Performance optimization"
+        ],
+        "hours_by_phase": {
+            "Planning": 10,
+            "Implementation": 60,
+            "Rollout": 20,
+            "Optimization": 10
+        }
+    }
+}
+
+# Day 1 Requirements for Data Marketplace
+DAY_1_MARKETPLACE = {
+    "technical_prerequisites": [
+        "Atlan instance provisioned",
+        "SSO/Azure AD integrated",
+        "3-5 core data sources connected",
+        "Basic lineage established",
+        "Search functionality configured"
+    ],
+    "governance_prerequisites": [
+        "Data stewards identified",
+        "Basic access policies defined",
+        "Business glossary started (50+ terms)",
+        "Certification process defined",
+        "Request workflows configured"
+    ],
+    "organizational_prerequisites": [
+        "Executive sponsorship secured",
+        "Communication plan launched",
+        "Training schedule defined",
+        "Success metrics identified",
+        "Change champions appointed"
+    ],
+    "self_service_capabilities": [
+        "Data discovery via search",
+        "Business context understanding",
+        "Access request workflows",
+        "Basic quality indicators",
+        "Collaboration features"
+    ]
+}
+
+# DAMA-DMBOK Knowledge Area Progression
+MATURITY_PROGRESSION = {
+    "Level 0 → Level 1": [
+        "Recognize data as an asset requiring management",
+        "Identify key data stakeholders and pain points",
+        "Document critical data elements and sources",
+        "Establish basic data inventory",
+        "Create awareness of data governance need"
+    ],
+    "Level 1 → Level 2": [
+        "Form Data Governance Steering Committee",
+        "Define data governance charter and scope",
+        "Implement Atlan as metadata repository",
+        "Create initial business glossary (50+ terms)",
+        "Establish data steward roles",
+        "Document data quality issues and impacts",
+        "Create high-level data architecture diagrams"
+    ],
+    "Level 2 → Level 3": [
+        "Develop comprehensive data policies and standards",
+        "Implement data quality dimensions (Completeness, Accuracy, Timeliness, etc.)",
+        "Build enterprise data models in Atlan",
+        "Establish data lineage for critical data flows",
+        "Create data security classification scheme",
+        "Implement master data management for key domains",
+        "Define data lifecycle management procedures"
+    ],
+    "Level 3 → Level 4": [
+        "Implement automated data quality scorecards",
+        "Establish data governance metrics and KPIs",
+        "Deploy data observability and monitoring",
+        "Create self-service data catalog with Atlan",
+        "Implement reference data management",
+        "Establish data privacy compliance framework",
+        "Integrate metadata management with DevOps"
+    ],
+    "Level 4 → Level 5": [
+        "Deploy ML-driven data quality predictions",
+        "Implement real-time data governance",
+        "Create data mesh/fabric architecture",
+        "Establish data marketplace and monetization",
+        "Implement automated compliance monitoring",
+        "Enable citizen data steward programs",
+        "Create innovation lab for data practices"
+    ]
+}
+
+# DAMA-DMBOK Knowledge Areas for Assessment
+DAMA_KNOWLEDGE_AREAS = {
+    "Data Governance": {
+        "description": "Overall management of data assets",
+        "key_activities": ["Strategy", "Policy", "Standards", "Oversight", "Compliance"]
+    },
+    "Data Architecture": {
+        "description": "Overall structure of data and data-related resources",
+        "key_activities": ["Enterprise models", "Standards", "Integration", "Alignment"]
+    },
+    "Data Modeling & Design": {
+        "description": "Analysis, design, building, testing, and maintenance",
+        "key_activities": ["Conceptual models", "Logical models", "Physical models"]
+    },
+    "Data Storage & Operations": {
+        "description": "Design, implementation, and support of stored data",
+        "key_activities": ["Database operations", "Performance", "Retention", "Backup"]
+    },
+    "Data Security": {
+        "description": "Ensuring privacy, confidentiality and appropriate access",
+        "key_activities": ["Access control", "Encryption", "Monitoring", "Classification"]
+    },
+    "Data Integration & Interoperability": {
+        "description": "Acquisition, extraction, transformation, movement",
+        "key_activities": ["ETL/ELT", "Virtualization", "Replication", "CDC"]
+    },
+    "Document & Content Management": {
+        "description": "Managing data found in unstructured sources",
+        "key_activities": ["Capture", "Storage", "Access", "Retention"]
+    },
+    "Reference & Master Data": {
+        "description": "Managing shared data to meet organizational goals",
+        "key_activities": ["Golden records", "Hierarchies", "Cross-reference", "Distribution"]
+    },
+    "Data Warehousing & Business Intelligence": {
+        "description": "Managing analytical data and enabling access",
+        "key_activities": ["Design", "Development", "Analytics", "Reporting"]
+    },
+    "Metadata Management": {
+        "description": "Managing data about data and data processes",
+        "key_activities": ["Business metadata", "Technical metadata", "Lineage", "Impact analysis"]
+    },
+    "Data Quality": {
+        "description": "Planning and implementation of quality management techniques",
+        "key_activities": ["Profiling", "Monitoring", "Cleansing", "Reporting"]
+    }
+}
+
+
+@lru_cache(maxsize=None)
+def maturity_catalog():
+    """Frozen maturity page data, built once per process on the first visit to the page"""
+    return MappingProxyType({
+        'maturity_levels': freeze(MATURITY_LEVELS),
+        'feature_journey': freeze(ATLAN_FEATURE_JOURNEY),
+        'ps_components': freeze(PS_COMPONENTS),
+        'day_1_marketplace': freeze(DAY_1_MARKETPLACE),
+        'maturity_progression': freeze(MATURITY_PROGRESSION),
+        'knowledge_areas': freeze(DAMA_KNOWLEDGE_AREAS)
+    })
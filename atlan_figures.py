@@ -0,0 +1,410 @@
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+# Figure builders for the Atlan simulator. Each one depends only on its
+# arguments, so show_figure can cache the result by the arguments' content.
+
+SEQUENCE_COLORS = ['#3B82F6', '#10B981', '#F59E0B', '#8B5CF6', '#EF4444']
+CRITICAL_COLOR = '#EF4444'
+FLEXIBLE_COLOR = '#3B82F6'
+TIMELINE_ORIGIN = pd.Timestamp('2024-01-01')
+MILESTONES = [
+    (2, "Instance Live"), (4, "First Source"), (6, "Pilot Live"), (8, "Glossary Launch"),
+    (12, "50% Adoption"), (16, "Full Coverage"), (20, "ROI Demo")
+]
+
+
+def _month_dates(months):
+    """Calendar dates for month offsets, counting 30 days per month"""
+    return [TIMELINE_ORIGIN + pd.Timedelta(days=int(d*30)) for d in months]
+
+
+def knowledge_radar_figure(categories, values):
+    """Current vs target maturity across the DAMA knowledge areas"""
+    fig_radar = go.Figure()
+
+    fig_radar.add_trace(go.Scatterpolar(
+        r=values,
+        theta=categories,
+        fill='toself',
+        name='Current State',
+        line_color='#3b82f6'
+    ))
+
+    # Add target state (example: all at level 3)
+    target_values = [3] * len(categories)
+    fig_radar.add_trace(go.Scatterpolar(
+        r=target_values,
+        theta=categories,
+        fill='toself',
+        name='Target State',
+        line_color='#10b981',
+        opacity=0.3
+    ))
+
+    fig_radar.update_layout(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 5],
+                ticktext=["Non-existent", "Initial", "Repeatable", "Defined", "Managed", "Optimized"],
+                tickvals=[0, 1, 2, 3, 4, 5]
+            )),
+        showlegend=True,
+        title="DAMA Knowledge Areas Maturity Assessment"
+    )
+    return fig_radar
+
+
+def maturity_gap_figure(gap_df):
+    """Gap to the target level for each knowledge area"""
+    fig_gap = px.bar(gap_df, x="Knowledge Area", y="Gap",
+                     title="Maturity Gap by Knowledge Area",
+                     color="Gap",
+                     color_continuous_scale="Reds")
+    fig_gap.update_layout(xaxis_tickangle=-45)
+    return fig_gap
+
+
+def maturity_journey_figure(levels, current_idx, target_idx):
+    """Sankey of the levels between the current and target maturity"""
+    fig = go.Figure(data=[go.Sankey(
+        node=dict(
+            pad=15,
+            thickness=20,
+            line=dict(color="black", width=0.5),
+            label=[level.split(":")[0] for level in levels],
+            color=["#ef4444" if i == current_idx else "#10b981" if i == target_idx else "#6b7280" for i in range(len(levels))]
+        ),
+        link=dict(
+            source=[i for i in range(current_idx, target_idx)],
+            target=[i+1 for i in range(current_idx, target_idx)],
+            value=[1] * (target_idx - current_idx)
+        )
+    )])
+
+    fig.update_layout(
+        title_text="Your Data Governance Maturity Journey (DAMA-DMBOK Framework)",
+        font_size=12,
+        height=400
+    )
+    return fig
+
+
+def implementation_sequence_figure(sequence_df):
+    """Atlan feature phases laid out by start week"""
+    fig_sequence = go.Figure()
+
+    for idx, row in sequence_df.iterrows():
+        fig_sequence.add_trace(go.Bar(
+            name=row['Phase'],
+            y=[row['Phase']],
+            x=[row['Duration']],
+            base=[row['Start_Week']],
+            orientation='h',
+            marker_color=SEQUENCE_COLORS[idx],
+            text=f"Weeks {row['Start_Week']}-{row['Start_Week']+row['Duration']}",
+            textposition='inside',
+            hovertemplate=f"<b>{row['Phase']}</b><br>" +
+                          f"Start: Week {row['Start_Week']}<br>" +
+                          f"Duration: {row['Duration']} weeks<br>" +
+                          f"End: Week {row['Start_Week'] + row['Duration']}<br>" +
+                          f"Maturity Level: {row['Maturity_Required']}+<extra></extra>"
+        ))
+
+    fig_sequence.update_layout(
+        title="Atlan Feature Implementation Timeline",
+        xaxis_title="Weeks",
+        yaxis_title="Features",
+        barmode='stack',
+        showlegend=False,
+        height=300,
+        xaxis=dict(range=[0, 20])
+    )
+
+    # Add phase markers
+    for week in (4, 8, 12, 16):
+        fig_sequence.add_vline(x=week, line_dash="dot", line_color="gray", opacity=0.5)
+    return fig_sequence
+
+
+def team_allocation_figure(team_hours):
+    """Share of PS hours by role"""
+    fig_team = go.Figure(data=[
+        go.Pie(labels=list(team_hours.keys()),
+               values=list(team_hours.values()),
+               hole=.3)
+    ])
+    fig_team.update_layout(title="PS Hours by Role")
+    return fig_team
+
+
+def maturity_timeline_figure(timeline_df):
+    """Gantt of the maturity transitions"""
+    fig_timeline = px.timeline(
+        timeline_df,
+        x_start=_month_dates(timeline_df['Start']),
+        x_end=_month_dates(timeline_df['End']),
+        y="Transition",
+        title="Maturity Progression Timeline"
+    )
+
+    fig_timeline.update_yaxes(categoryorder="total ascending")
+    return fig_timeline
+
+
+def benefits_figure(benefits_df):
+    """Expected improvement per benefit category over three years"""
+    return px.bar(benefits_df, x='Benefit Category', y=['Year 1', 'Year 2', 'Year 3'],
+                  title="Expected Improvement by Category (%)",
+                  barmode='group')
+
+
+def _binned_bars(counts, edges, name, unit="%{y:,} runs"):
+    """Histogram bars from server-side counts, so the payload does not grow with the number of runs"""
+    return go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=np.diff(edges),
+        name=name,
+        marker_color='lightblue',
+        opacity=0.7,
+        hovertemplate=f"%{{x:.1f}}: {unit}<extra></extra>"
+    )
+
+
+def rollout_histogram_figure(counts, bin_edges, timeline, expected_duration, simulations, density=None):
+    """Distribution of rollout durations against the target; simulations is None for the closed-form shares"""
+    fig = go.Figure()
+
+    analytic = simulations is None
+    fig.add_trace(_binned_bars(counts, bin_edges, 'Outcome Share' if analytic else 'Simulated Outcomes',
+                               "%{y:.1f}% of outcomes" if analytic else "%{y:,} runs"))
+    if density is not None:
+        fig.add_trace(go.Scatter(x=density[0], y=density[1], mode='lines',
+                                 name='Density' if analytic else 'Smoothed Density',
+                                 line=dict(color='#3b82f6', width=2), hoverinfo='skip'))
+
+    fig.add_vline(x=timeline, line_dash="dash", line_color="red",
+                  annotation_text=f"Target: {timeline} months")
+    fig.add_vline(x=expected_duration, line_dash="dash", line_color="green",
+                  annotation_text=f"Expected: {expected_duration:.1f} months")
+
+    fig.update_layout(
+        title=("Closed-Form Distribution of Rollout Timeline" if analytic
+               else f"Monte Carlo Simulation of Rollout Timeline ({simulations:,} runs)"),
+        xaxis_title="Duration (months)",
+        yaxis_title="Share of Outcomes (%)" if analytic else "Frequency",
+        bargap=0,
+        showlegend=False
+    )
+    return fig
+
+
+def sensitivity_tornado_figure(attribution, p50):
+    """Duration swing per factor, largest at the top"""
+    attribution = attribution.iloc[::-1]
+
+    fig_tornado = go.Figure()
+    fig_tornado.add_trace(go.Bar(
+        y=attribution["Factor"],
+        x=attribution["Swing"],
+        base=attribution["Low Duration"],
+        orientation='h',
+        marker_color='#f59e0b',
+        text=[f"{share:.0f}% of variance" for share in attribution["Variance Share (%)"]],
+        textposition='outside'
+    ))
+    fig_tornado.add_vline(x=p50, line_dash="dash", line_color="green",
+                          annotation_text=f"P50: {p50:.1f} months")
+    fig_tornado.update_layout(
+        title="Duration Range When Each Factor Is in Its Bottom vs Top Decile",
+        xaxis_title="Duration (months)",
+        showlegend=False,
+        height=450
+    )
+    return fig_tornado
+
+
+def roadmap_figure(roadmap_df):
+    """Gantt of the suggested rollout phases"""
+    fig_gantt = px.timeline(
+        roadmap_df,
+        x_start=_month_dates(roadmap_df['Start']),
+        x_end=_month_dates(roadmap_df['End']),
+        y="Phase",
+        title="Implementation Timeline"
+    )
+
+    fig_gantt.update_yaxes(categoryorder="total ascending")
+    return fig_gantt
+
+
+def schedule_gantt_figure(schedule):
+    """CPM schedule: bars at the earliest start, critical tasks in red, slack as a faint tail"""
+    tasks = schedule['Task']
+    colors = np.where(schedule['Critical'], CRITICAL_COLOR, FLEXIBLE_COLOR)
+    end = float(schedule['Latest Finish'].max()) if len(schedule) else 0.0
+
+    fig_timeline = go.Figure()
+    fig_timeline.add_trace(go.Bar(
+        name='Scheduled',
+        y=tasks,
+        x=schedule['Duration'],
+        base=schedule['Earliest Start'],
+        orientation='h',
+        marker_color=colors,
+        text=[f"{duration:g} weeks" for duration in schedule['Duration']],
+        textposition='inside',
+        customdata=np.column_stack([schedule['Earliest Finish'], schedule['Slack'], schedule['Depends On']]),
+        hovertemplate="<b>%{y}</b><br>" +
+                      "Start: Week %{base:g}<br>" +
+                      "Duration: %{x:g} weeks<br>" +
+                      "End: Week %{customdata[0]:g}<br>" +
+                      "Slack: %{customdata[1]:g} weeks<br>" +
+                      "Depends on: %{customdata[2]}<extra></extra>"
+    ))
+    fig_timeline.add_trace(go.Bar(
+        name='Slack',
+        y=tasks,
+        x=schedule['Slack'],
+        base=schedule['Earliest Finish'],
+        orientation='h',
+        marker_color=FLEXIBLE_COLOR,
+        opacity=0.25,
+        hoverinfo='skip'
+    ))
+
+    # Add milestone markers
+    for week, label in MILESTONES:
+        fig_timeline.add_vline(x=week, line_dash="dot", line_color="red", opacity=0.5)
+        fig_timeline.add_annotation(x=week, y=1, yref='paper', text=label, showarrow=False,
+                                    textangle=-45, font_size=10, yanchor='bottom')
+
+    fig_timeline.update_layout(
+        title="Critical Path Schedule",
+        xaxis_title="Weeks",
+        yaxis_title="Workstreams",
+        yaxis=dict(autorange='reversed'),
+        barmode='overlay',
+        showlegend=False,
+        height=max(400, 160 + 24 * len(schedule)),
+        xaxis=dict(range=[0, max(25, end + 1)])
+    )
+    return fig_timeline
+
+
+def schedule_risk_figure(counts, edges, target_weeks, p80):
+    """Simulated finish weeks, pre-binned, against the target duration"""
+    fig = go.Figure(_binned_bars(counts, edges, 'Simulated Finish'))
+    fig.add_vline(x=target_weeks, line_dash="dash", line_color="red",
+                  annotation_text=f"Target: {target_weeks:.0f} weeks")
+    fig.add_vline(x=p80, line_dash="dash", line_color="green", annotation_text=f"P80: {p80:.1f} weeks")
+    fig.update_layout(
+        title=f"Simulated Finish Week ({int(counts.sum()):,} runs)",
+        xaxis_title="Finish (weeks)",
+        yaxis_title="Runs",
+        bargap=0,
+        showlegend=False
+    )
+    return fig
+
+
+def criticality_figure(criticality_df):
+    """Share of simulated runs in which each task is on the critical path"""
+    criticality_df = criticality_df.iloc[::-1]
+    fig = go.Figure(go.Bar(
+        y=criticality_df['Task'],
+        x=criticality_df['Criticality Index (%)'],
+        orientation='h',
+        marker_color=np.where(criticality_df['Criticality Index (%)'] >= 50, CRITICAL_COLOR, FLEXIBLE_COLOR),
+        text=[f"{share:.0f}%" for share in criticality_df['Criticality Index (%)']],
+        textposition='outside'
+    ))
+    fig.update_layout(
+        title="Criticality Index (% of runs on the critical path)",
+        xaxis=dict(range=[0, 110]),
+        showlegend=False,
+        height=max(300, 120 + 28 * len(criticality_df))
+    )
+    return fig
+
+
+def resource_figure(resource_data):
+    """FTEs required per workstream, with the leveled week of peak team load in the hover"""
+    return px.bar(resource_data, x="Workstream", y="FTEs Required",
+                  title="Resource Requirements by Workstream",
+                  hover_data=["Peak Week"],
+                  color="FTEs Required", color_continuous_scale="Blues")
+
+
+def phase_timeline_figure(timeline_df):
+    """Sequential phases laid end to end"""
+    fig_timeline = go.Figure()
+
+    for idx, row in timeline_df.iterrows():
+        fig_timeline.add_trace(go.Bar(
+            x=[row['Duration']],
+            y=[row['Phase']],
+            base=[row['Start']],
+            orientation='h',
+            name=row['Phase'],
+            text=f"{row['Duration']} weeks",
+            textposition='inside'
+        ))
+
+    fig_timeline.update_layout(
+        title="Sequential Phase Timeline",
+        xaxis_title="Weeks",
+        barmode='stack',
+        showlegend=False,
+        height=300
+    )
+    return fig_timeline
+
+
+def ps_workstream_figure(ps_workstream_hours):
+    """PS hours per workstream stacked by role"""
+    fig_ps_ws = go.Figure()
+
+    workstreams = list(ps_workstream_hours.keys())
+    roles = [role for role in next(iter(ps_workstream_hours.values()), {}) if role != 'Total']
+    for role in roles:
+        fig_ps_ws.add_trace(go.Bar(name=role, x=workstreams, y=[ps_workstream_hours[ws][role] for ws in workstreams]))
+
+    fig_ps_ws.update_layout(
+        title="PS Hours by Workstream and Role",
+        xaxis_title="Workstreams",
+        yaxis_title="Hours",
+        barmode='stack'
+    )
+    return fig_ps_ws
+
+
+def ps_loading_figure(ps_timeline_df):
+    """Weekly PS hours stacked by role"""
+    return px.area(ps_timeline_df, x='Week', y=[column for column in ps_timeline_df.columns if column != 'Week'],
+                   title="PS Hours per Week (Stacked)")
+
+
+def utilization_figure(utilization):
+    """Share of each role's weekly capacity booked by the leveled schedule"""
+    roles = [column for column in utilization.columns if column != 'Week']
+    fig_utilization = go.Figure(go.Heatmap(
+        z=utilization[roles].to_numpy().T,
+        x=utilization['Week'],
+        y=roles,
+        zmin=0,
+        zmax=100,
+        colorscale='Blues',
+        colorbar=dict(title='%'),
+        hovertemplate="%{y}, week %{x}: %{z:.0f}% of capacity<extra></extra>"
+    ))
+    fig_utilization.update_layout(
+        title="Weekly Utilization by Role (% of capacity)",
+        xaxis_title="Weeks",
+        height=150 + 40 * len(roles)
+    )
+    return fig_utilization
@@ -0,0 +1,207 @@
+import streamlit as st
+
+
+# Landing Page
+def landing_page():
+    st.markdown('<h1 class="main-header">🚀 Atlan Rollout & Implementation Simulator</h1>', unsafe_allow_html=True)
+    st.markdown('<p class="sub-header">Transform your data governance journey with DAMA-DMBOK aligned planning and Atlan Professional Services</p>', unsafe_allow_html=True)
+    
+    # Key Questions Banner
+    st.warning("🤔 **Key Questions Answered:** What's the right implementation sequence? How many PS hours do you need? When can you launch a self-service data marketplace?")
+    
+    # DAMA Badge
+    st.info("📘 **Aligned with DAMA-DMBOK Framework** - Industry standard for data management best practices")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("""
+        <div class="metric-card">
+        <h3>📈 Rollout Simulator</h3>
+        <p>Predict timeline, estimate PS hours, and identify risks for your Atlan implementation</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div class="metric-card">
+        <h3>📊 DAMA Maturity Assessment</h3>
+        <p>Feature sequence guidance, PS requirements, and marketplace readiness assessment</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown("""
+        <div class="metric-card">
+        <h3>🏗️ Implementation Planner</h3>
+        <p>Create parallel workstreams with PS allocation across TAM, CSA, and Engineers</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # New Section: Implementation Journey
+    st.header("🛤️ Typical Atlan Implementation Journey")
+    
+    journey_col1, journey_col2, journey_col3, journey_col4, journey_col5 = st.columns(5)
+    
+    with journey_col1:
+        st.markdown("""
+        **📦 Foundation**
+        (Weeks 1-4)
+        - Asset catalog
+        - Connectors
+        - Basic search
+        - SSO setup
+        """)
+    
+    with journey_col2:
+        st.markdown("""
+        **🏢 Data Domains**
+        (Weeks 4-8)
+        - Org structure
+        - Ownership
+        - Stewardship
+        - Boundaries
+        """)
+    
+    with journey_col3:
+        st.markdown("""
+        **⚡ Workflows**
+        (Weeks 6-10)
+        - Access requests
+        - Approvals
+        - Quality issues
+        - Automation
+        """)
+    
+    with journey_col4:
+        st.markdown("""
+        **🎯 Data Products**
+        (Weeks 8-12)
+        - Package assets
+        - Define SLAs
+        - Quality scores
+        - Templates
+        """)
+    
+    with journey_col5:
+        st.markdown("""
+        **🏪 Marketplace**
+        (Weeks 12-16)
+        - Self-service
+        - Discovery
+        - Analytics
+        - Reviews
+        """)
+    
+    st.markdown("---")
+    
+    # Quick Insights
+    st.header("💡 Quick Insights")
+    
+    insight_col1, insight_col2, insight_col3 = st.columns(3)
+    
+    with insight_col1:
+        st.markdown("""
+        **🚀 Implementation Sequence**
+        1. Foundation setup (mandatory)
+        2. Data Domains (organization)
+        3. Governance Workflows
+        4. Data Products (packaging)
+        5. Data Marketplace (self-service)
+        """)
+    
+    with insight_col2:
+        st.markdown("""
+        **👥 Typical PS Hours**
+        - **Foundation**: 70 hours
+        - **Domain Implementation**: 120 hours
+        - **Training & Adoption**: 10 hours
+        - **Total**: ~200 hours
+        """)
+    
+    with insight_col3:
+        st.markdown("""
+        **🏪 Marketplace Prerequisites**
+        - ✓ Domains established
+        - ✓ Products defined
+        - ✓ Workflows automated
+        - ✓ 50+ glossary terms
+        - ✓ Training complete
+        """)
+    
+    st.markdown("---")
+    
+    # Professional Services Overview
+    st.header("👥 Atlan Professional Services Team")
+    
+    ps_col1, ps_col2, ps_col3 = st.columns(3)
+    
+    with ps_col1:
+        st.markdown("""
+        **Technical Account Manager (TAM)**
+        - Strategic planning
+        - Stakeholder alignment
+        - Change management
+        - Adoption strategy
+        - ~100 hours typical
+        """)
+    
+    with ps_col2:
+        st.markdown("""
+        **Customer Solution Architect (CSA)**
+        - Architecture design
+        - Migration strategy
+        - Best practices
+        - Technical enablement
+        - ~120 hours typical
+        """)
+    
+    with ps_col3:
+        st.markdown("""
+        **Implementation Engineer**
+        - Connector setup
+        - Lineage configuration
+        - Custom integrations
+        - Performance tuning
+        - ~80 hours typical
+        """)
+    
+    st.markdown("---")
+    
+    # Success Metrics
+    st.header("📊 Success Metrics from Real Implementations")
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Time to Foundation", "4 weeks", "Basic catalog ready")
+    with col2:
+        st.metric("Time to Marketplace", "12-16 weeks", "Full self-service")
+    with col3:
+        st.metric("PS Investment", "$75-200K", "Based on scope")
+    with col4:
+        st.metric("User Adoption", "78%", "Within 6 months")
+    
+    # Navigation
+    st.markdown("---")
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        if st.button("🚀 Start Rollout Simulation", use_container_width=True):
+            st.session_state.page = 'rollout'
+            st.rerun()
+    
+    with col2:
+        if st.button("📊 Assess DAMA Maturity", use_container_width=True):
+            st.session_state.page = 'maturity'
+            st.rerun()
+    
+    with col3:
+        if st.button("🏗️ Plan Implementation", use_container_width=True):
+            st.session_state.page = 'implementation'
+            st.rerun()
+    
+    # Footer
+    st.markdown("---")
+    st.caption("📘 Based on DAMA-DMBOK v2 Framework | 💰 PS pricing at $375/hour (typical Atlan rate)")
@@ -0,0 +1,687 @@
+import streamlit as st
+import pandas as pd
+from app_theme import show_figure
+from atlan_catalog import maturity_catalog
+from atlan_figures import (benefits_figure, implementation_sequence_figure, knowledge_radar_figure,
+                           maturity_gap_figure, maturity_journey_figure, maturity_timeline_figure,
+                           team_allocation_figure)
+
+
+# Maturity Assessment Page
+def maturity_assessment():
+    catalog = maturity_catalog()
+    maturity_levels = catalog['maturity_levels']
+    feature_journey = catalog['feature_journey']
+    day_1_marketplace = catalog['day_1_marketplace']
+    maturity_progression = catalog['maturity_progression']
+    knowledge_areas = catalog['knowledge_areas']
+    
+    st.title("📊 DAMA-DMBOK Maturity Assessment")
+    
+    # Back button
+    if st.button("← Back to Home"):
+        st.session_state.page = 'landing'
+        st.rerun()
+    
+    st.markdown("""
+    This assessment aligns with DAMA-DMBOK (Data Management Body of Knowledge) framework, 
+    evaluating your organization across 11 knowledge areas of data management.
+    """)
+    
+    st.markdown("---")
+    
+    # Assessment Mode Selection
+    assessment_mode = st.radio(
+        "Choose Assessment Mode",
+        ["Quick Assessment", "Detailed DAMA Knowledge Area Assessment"],
+        horizontal=True
+    )
+    
+    if assessment_mode == "Detailed DAMA Knowledge Area Assessment":
+        st.header("📋 DAMA Knowledge Area Assessment")
+        
+        # Create assessment for each knowledge area
+        knowledge_scores = {}
+        
+        with st.expander("📊 Rate your maturity in each DAMA Knowledge Area", expanded=True):
+            for area, details in knowledge_areas.items():
+                st.markdown(f"**{area}**")
+                st.caption(details["description"])
+                score = st.select_slider(
+                    f"Current maturity",
+                    options=["Non-existent", "Initial", "Repeatable", "Defined", "Managed", "Optimized"],
+                    value="Initial",
+                    key=f"ka_{area}"
+                )
+                knowledge_scores[area] = ["Non-existent", "Initial", "Repeatable", "Defined", "Managed", "Optimized"].index(score)
+                st.markdown("---")
+        
+        # Calculate overall maturity
+        avg_score = sum(knowledge_scores.values()) / len(knowledge_scores)
+        current_maturity = list(maturity_levels.keys())[int(avg_score)]
+        
+        # Visualization of knowledge areas
+        st.header("🎯 Knowledge Area Maturity Radar")
+        
+        # Create radar chart
+        categories = list(knowledge_areas.keys())
+        values = list(knowledge_scores.values())
+        
+        show_figure(knowledge_radar_figure, categories, values)
+        
+        # Gap Analysis
+        st.header("📊 Gap Analysis")
+        
+        gap_data = []
+        for area, score in knowledge_scores.items():
+            gap = 3 - score  # Assuming target is level 3 (Defined)
+            gap_data.append({
+                "Knowledge Area": area,
+                "Current": score,
+                "Target": 3,
+                "Gap": gap
+            })
+        
+        gap_df = pd.DataFrame(gap_data)
+        gap_df = gap_df.sort_values("Gap", ascending=False)
+        
+        show_figure(maturity_gap_figure, gap_df)
+        
+    else:
+        # Quick Assessment Mode
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            current_maturity = st.selectbox(
+                "Current Maturity Level",
+                list(maturity_levels.keys()),
+                help="Select your organization's current data governance maturity based on DAMA-DMBOK"
+            )
+        
+        with col2:
+            target_maturity = st.selectbox(
+                "Target Maturity Level",
+                list(maturity_levels.keys()),
+                index=3,
+                help="Select your desired maturity level"
+            )
+    
+    # Maturity Visualization
+    st.header("🎯 Maturity Journey Visualization")
+    
+    # Create progression chart
+    levels = list(maturity_levels.keys())
+    current_idx = levels.index(current_maturity)
+    target_idx = levels.index(target_maturity)
+    
+    if current_idx < target_idx:
+        # Create Sankey diagram for progression
+        show_figure(maturity_journey_figure, levels, current_idx, target_idx)
+        
+        # Show current and target maturity details with Atlan-specific guidance
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("### 📍 Current State")
+            current_level = maturity_levels[current_maturity]
+            st.markdown(f"**{current_maturity}**")
+            st.markdown(f"*{current_level['description']}*")
+            
+            with st.expander("Characteristics"):
+                for char in current_level['characteristics']:
+                    st.markdown(f"• {char}")
+            
+            if 'dama_dimensions' in current_level:
+                with st.expander("DAMA Dimensions"):
+                    for dim, status in current_level['dama_dimensions'].items():
+                        st.markdown(f"**{dim}:** {status}")
+            
+            if 'atlan_readiness' in current_level:
+                with st.expander("🚀 Atlan Implementation Focus", expanded=True):
+                    ar = current_level['atlan_readiness']
+                    st.markdown(f"**Focus Area:** {ar['implementation_focus']}")
+                    st.markdown("**Day 1 Requirements:**")
+                    for req in ar['day_1_requirements']:
+                        st.markdown(f"• {req}")
+                    st.metric("PS Hours Needed", ar['ps_hours_estimate'])
+                    st.info(f"**PS Focus:** {ar['ps_focus']}")
+                    st.warning(f"**Marketplace Readiness:** {ar['data_marketplace_readiness']}")
+        
+        with col2:
+            st.markdown("### 🎯 Target State")
+            target_level = maturity_levels[target_maturity]
+            st.markdown(f"**{target_maturity}**")
+            st.markdown(f"*{target_level['description']}*")
+            
+            with st.expander("Characteristics"):
+                for char in target_level['characteristics']:
+                    st.markdown(f"• {char}")
+            
+            if 'dama_dimensions' in target_level:
+                with st.expander("DAMA Dimensions"):
+                    for dim, status in target_level['dama_dimensions'].items():
+                        st.markdown(f"**{dim}:** {status}")
+            
+            if 'atlan_readiness' in target_level:
+                with st.expander("🎯 Target Capabilities"):
+                    ar = target_level['atlan_readiness']
+                    st.markdown(f"**Implementation:** {ar['implementation_focus']}")
+                    st.markdown("**Key Capabilities:**")
+                    for req in ar['day_1_requirements']:
+                        st.markdown(f"• {req}")
+                    st.success(f"**Marketplace Status:** {ar['data_marketplace_readiness']}")
+        
+        # Atlan Feature Implementation Journey
+        st.header("🚀 Atlan Feature Implementation Journey")
+        
+        st.info("**Key Insight:** Data Domains and Data Products are complementary features in Atlan, not alternatives. Here's the typical implementation sequence:")
+        
+        # Create visual journey
+        journey_tabs = st.tabs(["📦 Foundation", "🏢 Data Domains", "🎯 Data Products", "⚡ Workflows", "🏪 Marketplace"])
+        
+        with journey_tabs[0]:
+            foundation = feature_journey["foundation"]
+            st.markdown(f"### {foundation['name']}")
+            st.markdown(f"**Maturity Required:** {foundation['maturity_level']}")
+            st.markdown(f"**Timeline:** {foundation['timeline']}")
+            st.markdown("**Features to Implement:**")
+            for feature in foundation['features']:
+                st.checkbox(feature, key=f"found_{feature}")
+            
+            progress = sum([st.session_state.get(f"found_{feature}", False) for feature in foundation['features']])
+            st.progress(progress / len(foundation['features']))
+            
+        with journey_tabs[1]:
+            domains = feature_journey["data_domains"]
+            st.markdown(f"### {domains['name']}")
+            st.markdown(f"*{domains['description']}*")
+            st.markdown(f"**Maturity Required:** {domains['maturity_level']}")
+            st.markdown(f"**Timeline:** {domains['timeline']}")
+            
+            st.warning("**Prerequisites:**")
+            for prereq in domains['prerequisites']:
+                st.markdown(f"• {prereq}")
+            
+            st.success("**What You'll Implement:**")
+            for feature in domains['features']:
+                st.markdown(f"✓ {feature}")
+            
+            st.metric("PS Hours for Domains", "40-60 hours", "TAM + CSA focus")
+            
+        with journey_tabs[2]:
+            products = feature_journey["data_products"]
+            st.markdown(f"### {products['name']}")
+            st.markdown(f"*{products['description']}*")
+            st.markdown(f"**Maturity Required:** {products['maturity_level']}")
+            st.markdown(f"**Timeline:** {products['timeline']}")
+            
+            st.warning("**Prerequisites:**")
+            for prereq in products['prerequisites']:
+                st.markdown(f"• {prereq}")
+            
+            st.success("**What You'll Implement:**")
+            for feature in products['features']:
+                st.markdown(f"✓ {feature}")
+            
+            st.metric("PS Hours for Products", "60-80 hours", "CSA + Engineer focus")
+            
+        with journey_tabs[3]:
+            workflows = feature_journey["governance_workflows"]
+            st.markdown(f"### {workflows['name']}")
+            st.markdown(f"*{workflows['description']}*")
+            st.markdown(f"**Maturity Required:** {workflows['maturity_level']}")
+            st.markdown(f"**Timeline:** {workflows['timeline']}")
+            
+            st.warning("**Prerequisites:**")
+            for prereq in workflows['prerequisites']:
+                st.markdown(f"• {prereq}")
+            
+            st.success("**What You'll Implement:**")
+            for feature in workflows['features']:
+                st.markdown(f"✓ {feature}")
+            
+            st.metric("PS Hours for Workflows", "30-40 hours", "TAM + Engineer focus")
+            
+        with journey_tabs[4]:
+            marketplace = feature_journey["data_marketplace"]
+            st.markdown(f"### {marketplace['name']}")
+            st.markdown(f"*{marketplace['description']}*")
+            st.markdown(f"**Maturity Required:** {marketplace['maturity_level']}")
+            st.markdown(f"**Timeline:** {marketplace['timeline']}")
+            
+            st.warning("**Prerequisites:**")
+            for prereq in marketplace['prerequisites']:
+                st.markdown(f"• {prereq}")
+            
+            st.success("**What You'll Get:**")
+            for feature in marketplace['features']:
+                st.markdown(f"✓ {feature}")
+            
+            st.metric("PS Hours for Marketplace", "20-30 hours", "Full team collaboration")
+        
+        # Implementation Sequence Visualization
+        st.header("📊 Typical Implementation Sequence")
+        
+        sequence_df = pd.DataFrame({
+            'Phase': ['Foundation', 'Data Domains', 'Governance Workflows', 'Data Products', 'Data Marketplace'],
+            'Start_Week': [0, 4, 6, 8, 12],
+            'Duration': [4, 4, 4, 4, 4],
+            'Maturity_Required': [0, 1, 2, 2, 3]
+        })
+        
+        show_figure(implementation_sequence_figure, sequence_df)
+        
+        # Key Insights
+        st.markdown("""
+        ### 💡 Key Implementation Insights:
+        
+        1. **Foundation First** (Weeks 1-4): Basic catalog setup is non-negotiable
+        2. **Domains Before Products** (Weeks 4-8): Establish organizational structure before packaging
+        3. **Workflows Enable Self-Service** (Weeks 6-10): Automation is key to marketplace success
+        4. **Products Package Value** (Weeks 8-12): Transform domains into consumable assets
+        5. **Marketplace Crowns It All** (Weeks 12-16): Full self-service requires all prior elements
+        
+        > **Note:** While phases overlap, each builds on the previous. Attempting to jump directly to marketplace without foundation will fail.
+        """)
+        
+        # Professional Services Estimation
+        st.header("👥 Professional Services Requirements")
+        
+        # Get more context for accurate PS estimation
+        col1_context, col2_context = st.columns(2)
+        
+        with col1_context:
+            target_timeline = st.select_slider(
+                "Target Go-Live Timeline",
+                options=["3 months", "6 months", "9 months", "12 months"],
+                value="6 months",
+                help="Faster timelines require more concentrated PS support"
+            )
+            
+            num_data_sources = st.number_input(
+                "Number of Data Sources",
+                min_value=1,
+                max_value=50,
+                value=5,
+                help="More sources = more integration complexity"
+            )
+        
+        with col2_context:
+            implementation_scope = st.multiselect(
+                "Implementation Scope",
+                ["Basic Catalog", "Data Domains", "Data Products", "Governance Workflows", 
+                 "Data Quality", "Data Marketplace", "API Integrations", "Custom Solutions"],
+                default=["Basic Catalog", "Data Domains", "Governance Workflows"],
+                help="Select all features you plan to implement"
+            )
+            
+            existing_tool_migration = st.radio(
+                "Migrating from existing tool?",
+                ["No", "Yes - Simple tool", "Yes - Complex tool (e.g., Collibra)"],
+                help="Migration adds complexity"
+            )
+        
+        # Calculate PS hours based on real factors
+        base_hours = 200  # Standard SOW baseline
+        
+        # Timeline multiplier
+        timeline_multipliers = {
+            "3 months": 1.4,   # Rushed = more parallel PS support needed
+            "6 months": 1.0,   # Standard pace
+            "9 months": 0.9,   # Relaxed pace
+            "12 months": 0.85  # Very relaxed, can optimize PS usage
+        }
+        timeline_mult = timeline_multipliers[target_timeline]
+        
+        # Scope multiplier
+        scope_hours = {
+            "Basic Catalog": 0,  # Included in base
+            "Data Domains": 0,   # Included in base
+            "Data Products": 40,
+            "Governance Workflows": 0,  # Included in base
+            "Data Quality": 30,
+            "Data Marketplace": 50,
+            "API Integrations": 40,
+            "Custom Solutions": 60
+        }
+        additional_scope_hours = sum(scope_hours.get(item, 0) for item in implementation_scope)
+        
+        # Data source complexity
+        source_multiplier = 1.0
+        if num_data_sources > 5:
+            source_multiplier += (num_data_sources - 5) * 0.02  # 2% per additional source
+        
+        # Migration complexity
+        migration_hours = {
+            "No": 0,
+            "Yes - Simple tool": 30,
+            "Yes - Complex tool (e.g., Collibra)": 70  # Matches SOW
+        }
+        migration_add = migration_hours[existing_tool_migration]
+        
+        # Maturity gap multiplier
+        maturity_gap = target_idx - current_idx
+        maturity_multiplier = 1.0 + (maturity_gap - 1) * 0.15 if maturity_gap > 1 else 1.0
+        
+        # Calculate total
+        calculated_hours = int((base_hours + additional_scope_hours + migration_add) * 
+                              timeline_mult * source_multiplier * maturity_multiplier)
+        
+        # Display calculation breakdown
+        st.markdown("### 📊 PS Hours Calculation")
+        
+        with st.expander("See detailed calculation", expanded=True):
+            calc_df = pd.DataFrame({
+                "Component": [
+                    "Base Package (Catalog + Domains + Workflows)",
+                    "Additional Scope",
+                    "Migration Effort",
+                    "Timeline Factor",
+                    "Source Complexity Factor",
+                    "Maturity Gap Factor"
+                ],
+                "Hours/Factor": [
+                    f"{base_hours} hours",
+                    f"+{additional_scope_hours} hours",
+                    f"+{migration_add} hours",
+                    f"×{timeline_mult}",
+                    f"×{source_multiplier:.2f}",
+                    f"×{maturity_multiplier:.2f}"
+                ],
+                "Running Total": [
+                    base_hours,
+                    base_hours + additional_scope_hours,
+                    base_hours + additional_scope_hours + migration_add,
+                    int((base_hours + additional_scope_hours + migration_add) * timeline_mult),
+                    int((base_hours + additional_scope_hours + migration_add) * timeline_mult * source_multiplier),
+                    calculated_hours
+                ]
+            })
+            st.dataframe(calc_df, use_container_width=True)
+        
+        # Investment summary
+        hourly_rate = 375
+        total_investment = calculated_hours * hourly_rate
+        
+        col1_inv, col2_inv, col3_inv = st.columns(3)
+        with col1_inv:
+            st.metric("Total PS Hours", f"{calculated_hours}", 
+                     f"{'+' if calculated_hours > 200 else ''}{calculated_hours - 200} vs standard")
+        with col2_inv:
+            st.metric("Investment", f"${total_investment:,}", "at $375/hour")
+        with col3_inv:
+            package_type = "Standard" if calculated_hours <= 220 else "Extended" if calculated_hours <= 350 else "Enterprise"
+            st.metric("Package Type", package_type)
+        
+        # Team allocation based on actual needs
+        st.markdown("### 👥 Recommended Team Allocation")
+        
+        # Dynamic allocation based on scope
+        tam_pct = 0.35 if "Data Marketplace" in implementation_scope else 0.30
+        csa_pct = 0.45 if migration_add > 0 else 0.40
+        eng_pct = 1 - tam_pct - csa_pct
+        
+        team_hours = {
+            "TAM": int(calculated_hours * tam_pct),
+            "CSA": int(calculated_hours * csa_pct),
+            "Engineer": int(calculated_hours * eng_pct)
+        }
+        
+        col1_team, col2_team = st.columns([1, 1])
+        with col1_team:
+            show_figure(team_allocation_figure, team_hours)
+        
+        with col2_team:
+            st.markdown("### Hours by Role")
+            for role, hours in team_hours.items():
+                st.metric(role, f"{hours} hours", f"${hours * hourly_rate:,}")
+        
+        # Day 1 Data Marketplace Requirements
+        st.header("🏪 Day 1: Data Marketplace & Self-Service")
+        
+        st.info("**Goal:** Enable self-service data discovery and access from Day 1")
+        
+        day1_tabs = st.tabs(["Technical Setup", "Governance Setup", "Organization Setup", "Self-Service Features"])
+        
+        with day1_tabs[0]:
+            st.markdown("#### Technical Prerequisites")
+            for item in day_1_marketplace["technical_prerequisites"]:
+                st.checkbox(item, key=f"tech_{item}")
+            
+            progress = sum([st.session_state.get(f"tech_{item}", False) for item in day_1_marketplace["technical_prerequisites"]])
+            st.progress(progress / len(day_1_marketplace["technical_prerequisites"]))
+        
+        with day1_tabs[1]:
+            st.markdown("#### Governance Prerequisites")
+            for item in day_1_marketplace["governance_prerequisites"]:
+                st.checkbox(item, key=f"gov_{item}")
+            
+            progress = sum([st.session_state.get(f"gov_{item}", False) for item in day_1_marketplace["governance_prerequisites"]])
+            st.progress(progress / len(day_1_marketplace["governance_prerequisites"]))
+        
+        with day1_tabs[2]:
+            st.markdown("#### Organizational Prerequisites")
+            for item in day_1_marketplace["organizational_prerequisites"]:
+                st.checkbox(item, key=f"org_{item}")
+            
+            progress = sum([st.session_state.get(f"org_{item}", False) for item in day_1_marketplace["organizational_prerequisites"]])
+            st.progress(progress / len(day_1_marketplace["organizational_prerequisites"]))
+        
+        with day1_tabs[3]:
+            st.markdown("#### Self-Service Capabilities Available Day 1")
+            for item in day_1_marketplace["self_service_capabilities"]:
+                st.markdown(f"✅ {item}")
+            
+            st.success("These capabilities enable immediate value realization and user adoption")
+        
+        # Show progression requirements
+        st.header("📋 Requirements for Each Transition")
+        
+        for i in range(current_idx, target_idx):
+            transition = f"{levels[i].split(':')[0]} → {levels[i+1].split(':')[0]}"
+            with st.expander(f"**{transition}**", expanded=(i == current_idx)):
+                requirements = maturity_progression.get(transition, [])
+                
+                # Group requirements by DAMA knowledge area
+                st.markdown("#### Key Actions:")
+                for j, req in enumerate(requirements, 1):
+                    if "Atlan" in req:
+                        st.markdown(f"{j}. **{req}** 🚀")
+                    else:
+                        st.markdown(f"{j}. {req}")
+                
+                # Add Atlan-specific capabilities for this level
+                st.markdown("#### Atlan Capabilities to Leverage:")
+                if i == 0:  # Level 0 to 1
+                    st.markdown("""
+                    - Basic metadata cataloging
+                    - Asset discovery and inventory
+                    - Simple search capabilities
+                    """)
+                elif i == 1:  # Level 1 to 2
+                    st.markdown("""
+                    - Business glossary management
+                    - Data lineage visualization
+                    - Collaboration features
+                    - Basic data quality tracking
+                    """)
+                elif i == 2:  # Level 2 to 3
+                    st.markdown("""
+                    - Automated metadata harvesting
+                    - Policy enforcement
+                    - Data quality scorecards
+                    - Integration with data platforms
+                    """)
+                elif i == 3:  # Level 3 to 4
+                    st.markdown("""
+                    - Advanced analytics on metadata
+                    - Automated compliance monitoring
+                    - Self-service data discovery
+                    - API-driven governance
+                    """)
+                elif i == 4:  # Level 4 to 5
+                    st.markdown("""
+                    - AI-powered recommendations
+                    - Predictive data quality
+                    - Real-time governance metrics
+                    - Data mesh enablement
+                    """)
+        
+        # Timeline estimation
+        st.header("⏱️ Estimated Timeline")
+        
+        # More sophisticated timeline based on DAMA experience
+        transition_times = {
+            "Level 0 → Level 1": 2,
+            "Level 1 → Level 2": 3,
+            "Level 2 → Level 3": 4,
+            "Level 3 → Level 4": 6,
+            "Level 4 → Level 5": 6
+        }
+        
+        total_time = 0
+        timeline_details = []
+        
+        for i in range(current_idx, target_idx):
+            transition = f"{levels[i].split(':')[0]} → {levels[i+1].split(':')[0]}"
+            time = transition_times.get(transition, 3)
+            total_time += time
+            timeline_details.append((transition, time))
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.metric("Total Duration", f"{total_time} months")
+        with col2:
+            st.metric("Levels to Progress", target_idx - current_idx)
+        with col3:
+            st.metric("Key Milestones", (target_idx - current_idx) * 5)
+        
+        # Create timeline visualization
+        if timeline_details:
+            timeline_df = pd.DataFrame(timeline_details, columns=["Transition", "Duration"])
+            timeline_df["Start"] = timeline_df["Duration"].cumsum() - timeline_df["Duration"]
+            timeline_df["End"] = timeline_df["Duration"].cumsum()
+            
+            show_figure(maturity_timeline_figure, timeline_df)
+        
+        # Action Plan with DAMA focus
+        st.header("🎯 DAMA-Aligned Action Plan")
+        
+        st.markdown("""
+        <div class="recommendation-box">
+        <h4>Phase 1: Foundation (Months 1-3)</h4>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        if current_idx == 0:  # Level 0
+            st.markdown("""
+            1. **Data Governance**
+               - Establish executive sponsorship
+               - Form initial governance team
+               - Create data governance charter
+            
+            2. **Metadata Management with Atlan**
+               - Deploy Atlan platform
+               - Connect 3-5 critical data sources
+               - Begin asset documentation
+            
+            3. **Data Architecture**
+               - Document high-level data landscape
+               - Identify critical data flows
+               - Map key systems and interfaces
+            """)
+        elif current_idx == 1:  # Level 1
+            st.markdown("""
+            1. **Data Governance**
+               - Formalize governance operating model
+               - Define RACI for data decisions
+               - Establish data council meetings
+            
+            2. **Data Quality**
+               - Define quality dimensions
+               - Implement basic profiling in Atlan
+               - Create issue tracking process
+            
+            3. **Master Data Management**
+               - Identify master data domains
+               - Define golden record sources
+               - Build initial business glossary
+            """)
+        elif current_idx == 2:  # Level 2
+            st.markdown("""
+            1. **Data Architecture**
+               - Create enterprise data models
+               - Implement data integration standards
+               - Design target state architecture
+            
+            2. **Data Security**
+               - Implement classification scheme
+               - Define access control policies
+               - Enable monitoring in Atlan
+            
+            3. **Business Intelligence**
+               - Establish self-service analytics
+               - Create certified datasets
+               - Build KPI dashboards
+            """)
+        
+        # ROI Projection aligned with DAMA metrics
+        st.header("💰 Expected Benefits (DAMA-Aligned)")
+        
+        benefits_data = {
+            'Benefit Category': ['Reduced Data Incidents', 'Faster Decision Making', 'Compliance Readiness', 
+                               'Productivity Gains', 'Data Quality Improvement'],
+            'Year 1': [20, 15, 25, 30, 10],
+            'Year 2': [35, 30, 40, 45, 25],
+            'Year 3': [50, 45, 60, 60, 40]
+        }
+        
+        benefits_df = pd.DataFrame(benefits_data)
+        
+        show_figure(benefits_figure, benefits_df)
+        
+        # Knowledge Area Priority
+        st.header("📊 Recommended Knowledge Area Priority")
+        
+        priority_areas = {
+            0: ["Data Governance", "Metadata Management", "Data Architecture"],
+            1: ["Data Quality", "Data Security", "Master Data Management"],
+            2: ["Data Integration", "Business Intelligence", "Data Modeling"],
+            3: ["Reference Data", "Document Management", "Data Warehousing"],
+            4: ["Advanced Analytics", "Data Science", "Real-time Processing"]
+        }
+        
+        current_priorities = priority_areas.get(current_idx, [])
+        
+        st.info(f"**Focus Areas for {current_maturity.split(':')[0]}:**")
+        for i, area in enumerate(current_priorities, 1):
+            st.markdown(f"{i}. **{area}** - Critical for progression")
+        
+        # Success Factors
+        st.header("✅ Critical Success Factors")
+        
+        col1_sf, col2_sf = st.columns(2)
+        
+        with col1_sf:
+            st.markdown("**Organizational Factors**")
+            st.markdown("""
+            - Executive sponsorship and visibility
+            - Dedicated data governance team
+            - Clear communication strategy
+            - Change management program
+            - Regular training and education
+            """)
+        
+        with col2_sf:
+            st.markdown("**Technical Factors**")
+            st.markdown("""
+            - Atlan platform optimization
+            - Integration with key systems
+            - Automated metadata collection
+            - Data quality monitoring
+            - Self-service enablement
+            """)
+        
+    else:
+        st.warning("Please select a target maturity level higher than your current level to see the progression path.")
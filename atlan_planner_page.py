@@ -0,0 +1,685 @@
+import streamlit as st
+import pandas as pd
+from datetime import datetime, timedelta
+from app_theme import show_figure
+from atlan_catalog import maturity_catalog
+from atlan_figures import (criticality_figure, phase_timeline_figure, ps_loading_figure, ps_workstream_figure,
+                           resource_figure, schedule_gantt_figure, schedule_risk_figure, utilization_figure)
+from plan_export import (ICS_MIME, XLSX_MIME, dependency_table, file_stem, milestone_table, milestones_ics,
+                         plan_pdf, schedule_csv, schedule_table, workbook_xlsx)
+from resource_leveling import leveled_schedule, peak_weeks, task_hours, task_loads
+from rollout_engine import PS_HOURLY_RATE
+from schedule_engine import ScheduleError, dependency_frame, schedule_insights, update_schedule
+from schedule_simulation import (DEFAULT_SCHEDULE_RUNS, finish_percentile, finish_probability, simulate_schedule,
+                                 three_point_estimates)
+
+WEEKS_PER_MONTH = 52 / 12
+
+# Short labels of the PS roles, as used in the hours tables and charts
+PS_ROLE_LABELS = {
+    "TAM (Technical Account Manager)": "TAM",
+    "CSA (Customer Solution Architect)": "CSA",
+    "Implementation Engineer": "Engineer"
+}
+
+# Client FTEs each workstream occupies while it runs, and the PS hours it consumes in total
+WORKSTREAM_RESOURCES = {
+    "Technical Foundation": {"FTEs": 2, "TAM": 10, "CSA": 30, "Engineer": 30},
+    "Data Integration": {"FTEs": 3, "TAM": 15, "CSA": 25, "Engineer": 40},
+    "Governance Framework": {"FTEs": 2, "TAM": 40, "CSA": 20, "Engineer": 10},
+    "User Enablement": {"FTEs": 2, "TAM": 25, "CSA": 15, "Engineer": 10},
+    "Value Realization": {"FTEs": 1, "TAM": 10, "CSA": 10, "Engineer": 10}
+}
+
+# Starting point of the additional task editor; one row per task beyond the five workstreams
+EMPTY_TASKS = pd.DataFrame({
+    "Task": pd.Series(dtype="str"),
+    "Duration": pd.Series(dtype="float"),
+    "Dependencies": pd.Series(dtype="str"),
+    "Start": pd.Series(dtype="float"),
+    "Optimistic": pd.Series(dtype="float"),
+    "Pessimistic": pd.Series(dtype="float"),
+    "FTEs": pd.Series(dtype="float"),
+    **{role: pd.Series(dtype="float") for role in PS_ROLE_LABELS.values()}
+})
+
+
+# Implementation Planner Page
+def implementation_planner():
+    st.title("🏗️ Atlan Implementation Planner")
+    
+    # Back button
+    if st.button("← Back to Home"):
+        st.session_state.page = 'landing'
+        st.rerun()
+    
+    st.markdown("""
+    Create a detailed implementation plan with phase-wise breakdown, parallel workstreams, dependencies, and risk management strategies.
+    """)
+    
+    with st.form("implementation_form"):
+        st.header("📋 Project Information")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            project_name = st.text_input("Project Name", placeholder="e.g., Enterprise Data Governance Initiative")
+            start_date = st.date_input("Start Date", datetime.now())
+            duration_months = st.number_input("Duration (months)", 3, 24, 6)
+        
+        with col2:
+            team_size = st.number_input("Implementation Team Size", 1, 20, 5)
+            budget = st.number_input("Budget ($K)", 50, 1000, 200, step=50)
+            priority_domains = st.multiselect("Priority Domains", 
+                ["Finance", "Sales", "Marketing", "Operations", "HR", "Product", "Engineering"])
+        
+        st.header("🎯 Implementation Approach")
+        
+        implementation_type = st.radio(
+            "Select Implementation Strategy",
+            ["Sequential (Waterfall)", "Parallel Workstreams", "Hybrid (Parallel with Dependencies)"],
+            index=2,
+            help="Most organizations benefit from a hybrid approach with parallel workstreams"
+        )
+        
+        st.header("📊 Workstreams & Phases")
+        
+        if implementation_type in ["Parallel Workstreams", "Hybrid (Parallel with Dependencies)"]:
+            st.info("💡 Define parallel workstreams that can run concurrently")
+            
+            # Workstream 1: Technical Foundation
+            with st.expander("**Workstream 1: Technical Foundation**", expanded=True):
+                tech_tasks = st.text_area(
+                    "Key Activities",
+                    value="• Atlan instance provisioning\n• Infrastructure setup\n• Security configuration\n• SSO integration\n• Performance optimization",
+                    height=100,
+                    key="tech_tasks"
+                )
+                tech_start = st.slider("Start Week", 0, 12, 0, key="tech_start")
+                tech_duration = st.slider("Most Likely Duration (weeks)", 1, 20, 4, key="tech_dur")
+                tech_range = st.slider("Optimistic / Pessimistic Duration (weeks)", 1, 40, (3, 7), key="tech_range")
+                tech_deps = st.multiselect("Dependencies", ["None", "Executive Approval", "Budget Approval"], default=["None"], key="tech_deps")
+            
+            # Workstream 2: Data Source Integration
+            with st.expander("**Workstream 2: Data Source Integration**", expanded=True):
+                integration_tasks = st.text_area(
+                    "Key Activities",
+                    value="• Connector configuration\n• Metadata harvesting\n• Lineage setup\n• Data quality rules\n• Integration testing",
+                    height=100,
+                    key="int_tasks"
+                )
+                int_start = st.slider("Start Week", 0, 12, 2, key="int_start")
+                int_duration = st.slider("Most Likely Duration (weeks)", 2, 24, 8, key="int_dur")
+                int_range = st.slider("Optimistic / Pessimistic Duration (weeks)", 1, 40, (6, 14), key="int_range")
+                int_deps = st.multiselect("Dependencies", ["Technical Foundation", "Data Owner Approval", "Architecture Review"], 
+                                         default=["Technical Foundation"], key="int_deps")
+            
+            # Workstream 3: Governance Framework
+            with st.expander("**Workstream 3: Governance Framework**", expanded=True):
+                gov_tasks = st.text_area(
+                    "Key Activities",
+                    value="• Policy development\n• Business glossary\n• Stewardship model\n• Process documentation\n• Compliance mapping",
+                    height=100,
+                    key="gov_tasks"
+                )
+                gov_start = st.slider("Start Week", 0, 12, 0, key="gov_start")
+                gov_duration = st.slider("Most Likely Duration (weeks)", 2, 20, 6, key="gov_dur")
+                gov_range = st.slider("Optimistic / Pessimistic Duration (weeks)", 1, 40, (4, 10), key="gov_range")
+                gov_deps = st.multiselect("Dependencies", ["Stakeholder Alignment", "Legal Review"], 
+                                         default=["Stakeholder Alignment"], key="gov_deps")
+            
+            # Workstream 4: User Enablement
+            with st.expander("**Workstream 4: User Enablement**", expanded=True):
+                user_tasks = st.text_area(
+                    "Key Activities",
+                    value="• Training program design\n• User onboarding\n• Documentation creation\n• Champion network\n• Adoption tracking",
+                    height=100,
+                    key="user_tasks"
+                )
+                user_start = st.slider("Start Week", 0, 12, 3, key="user_start")
+                user_duration = st.slider("Most Likely Duration (weeks)", 4, 24, 10, key="user_dur")
+                user_range = st.slider("Optimistic / Pessimistic Duration (weeks)", 1, 40, (8, 16), key="user_range")
+                user_deps = st.multiselect("Dependencies", ["Technical Foundation", "Governance Framework", "Pilot Success"], 
+                                          default=["Technical Foundation"], key="user_deps")
+            
+            # Workstream 5: Value Realization
+            with st.expander("**Workstream 5: Value Realization**", expanded=True):
+                value_tasks = st.text_area(
+                    "Key Activities",
+                    value="• Use case implementation\n• ROI measurement\n• Success metrics\n• Optimization\n• Expansion planning",
+                    height=100,
+                    key="value_tasks"
+                )
+                value_start = st.slider("Start Week", 0, 12, 4, key="value_start")
+                value_duration = st.slider("Most Likely Duration (weeks)", 4, 20, 12, key="value_dur")
+                value_range = st.slider("Optimistic / Pessimistic Duration (weeks)", 1, 40, (8, 20), key="value_range")
+                value_deps = st.multiselect("Dependencies", ["Initial Adoption", "Metrics Baseline"], 
+                                           default=["Initial Adoption"], key="value_deps")
+            
+            # Any number of further tasks; rows can be pasted straight from a spreadsheet
+            with st.expander("**➕ Additional Tasks**"):
+                st.caption("Dependencies are comma-separated task or workstream names. "
+                           "Names that match no task are treated as external approvals and do not move the schedule.")
+                extra_tasks = st.data_editor(
+                    EMPTY_TASKS,
+                    num_rows="dynamic",
+                    use_container_width=True,
+                    key="extra_tasks",
+                    column_config={
+                        "Task": st.column_config.TextColumn("Task", required=True),
+                        "Duration": st.column_config.NumberColumn("Duration (weeks)", min_value=0, required=True),
+                        "Dependencies": st.column_config.TextColumn("Depends On"),
+                        "Start": st.column_config.NumberColumn("Earliest Start Week", min_value=0),
+                        "Optimistic": st.column_config.NumberColumn("Optimistic (weeks)", min_value=0),
+                        "Pessimistic": st.column_config.NumberColumn("Pessimistic (weeks)", min_value=0),
+                        "FTEs": st.column_config.NumberColumn("Team FTEs", min_value=0),
+                        **{role: st.column_config.NumberColumn(f"{role} Hours", min_value=0)
+                           for role in PS_ROLE_LABELS.values()}
+                    }
+                )
+            
+            # Weekly capacity the schedule is leveled against; the team size supplies the FTEs
+            ps_roles = [PS_ROLE_LABELS.get(role, role) for role in maturity_catalog()['ps_components']]
+            with st.expander("**👥 PS Capacity (hours per week)**"):
+                ps_capacity = {}
+                for column, role in zip(st.columns(len(ps_roles)), ps_roles):
+                    with column:
+                        ps_capacity[role] = st.number_input(role, 0, 40, 10, key=f"capacity_{role}")
+            
+            schedule_runs = st.select_slider("Schedule Simulation Runs", options=[1000, 10000, 100000],
+                                             value=DEFAULT_SCHEDULE_RUNS,
+                                             help="Monte Carlo runs over the optimistic, likely and pessimistic durations")
+            
+        else:
+            # Sequential Implementation
+            st.subheader("1️⃣ Discovery Phase")
+            discovery_tasks = st.text_area(
+                "Key Tasks",
+                value="• Stakeholder mapping and interviews\n• Current state assessment\n• Data landscape documentation\n• Success criteria definition\n• Technical architecture review"
+            )
+            discovery_duration = st.slider("Duration (weeks)", 1, 8, 2, key="disc_dur_seq")
+            
+            st.subheader("2️⃣ Setup Phase")
+            setup_tasks = st.text_area(
+                "Key Tasks",
+                value="• Atlan instance provisioning\n• Connector configuration\n• SSO and security setup\n• Initial user provisioning\n• Integration testing"
+            )
+            setup_duration = st.slider("Duration (weeks)", 1, 8, 3, key="setup_dur_seq")
+            
+            st.subheader("3️⃣ Pilot Phase")
+            pilot_tasks = st.text_area(
+                "Key Tasks",
+                value="• Metadata harvesting for pilot domains\n• Business glossary creation\n• Data quality rules setup\n• Lineage validation\n• Pilot user training"
+            )
+            pilot_duration = st.slider("Duration (weeks)", 2, 12, 4, key="pilot_dur_seq")
+            
+            st.subheader("4️⃣ Rollout Phase")
+            rollout_tasks = st.text_area(
+                "Key Tasks",
+                value="• Phased domain onboarding\n• End-user training programs\n• Process integration\n• Adoption tracking\n• Success metrics monitoring"
+            )
+            rollout_duration = st.slider("Duration (weeks)", 4, 20, 8, key="rollout_dur_seq")
+            
+            st.subheader("5️⃣ Optimization Phase")
+            optimization_tasks = st.text_area(
+                "Key Tasks",
+                value="• Advanced automation setup\n• Custom integration development\n• Performance optimization\n• Governance process refinement\n• ROI measurement"
+            )
+            optimization_duration = st.slider("Duration (weeks)", 2, 12, 4, key="opt_dur_seq")
+        
+        st.header("🎯 Critical Milestones")
+        
+        milestones = st.text_area(
+            "Define Key Milestones",
+            value="Week 2: Atlan instance live\nWeek 4: First data source connected\nWeek 6: Pilot domain live\nWeek 8: Business glossary launched\nWeek 12: 50% user adoption\nWeek 16: All domains onboarded\nWeek 20: ROI demonstrated",
+            height=100
+        )
+        
+        st.header("⚠️ Risk Management")
+        
+        col1_risk, col2_risk = st.columns(2)
+        
+        with col1_risk:
+            st.subheader("Atlan-Side Risks")
+            atlan_risks = st.text_area(
+                "Identify risks",
+                value="• Connector availability delays\n• Custom feature requests\n• Performance at scale\n• Integration complexity"
+            )
+        
+        with col2_risk:
+            st.subheader("Customer-Side Risks")
+            customer_risks = st.text_area(
+                "Identify risks",
+                value="• Stakeholder availability\n• Data quality issues\n• Change resistance\n• Resource constraints"
+            )
+        
+        st.header("📊 Success Metrics")
+        
+        success_metrics = st.multiselect(
+            "Select KPIs to track",
+            [
+                "Time to discover data (reduction %)",
+                "Data incident resolution time",
+                "Business glossary coverage",
+                "Active user adoption rate",
+                "Data quality score improvement",
+                "Compliance audit readiness",
+                "Self-service analytics usage",
+                "Cross-team collaboration index"
+            ],
+            default=["Active user adoption rate", "Time to discover data (reduction %)", "Business glossary coverage"]
+        )
+        
+        submitted = st.form_submit_button("Generate Implementation Plan", type="primary")
+    
+    if submitted:
+        st.success("✅ Implementation Plan Generated Successfully!")
+        
+        # Executive Summary
+        st.header("📄 Executive Summary")
+        
+        col1_summary, col2_summary, col3_summary, col4_summary = st.columns(4)
+        
+        with col1_summary:
+            st.metric("Implementation Type", implementation_type.split()[0])
+        with col2_summary:
+            st.metric("Team Size", f"{team_size} members")
+        with col3_summary:
+            st.metric("Budget", f"${budget}K")
+        with col4_summary:
+            st.metric("Priority Domains", len(priority_domains))
+        
+        # Timeline visualization based on implementation type
+        st.header("📅 Implementation Timeline")
+        
+        if implementation_type in ["Parallel Workstreams", "Hybrid (Parallel with Dependencies)"]:
+            # Create Gantt chart for parallel workstreams
+            workstreams = [
+                {
+                    "Workstream": "Technical Foundation",
+                    "Start": tech_start,
+                    "Duration": tech_duration,
+                    "Optimistic": tech_range[0],
+                    "Pessimistic": tech_range[1],
+                    "Dependencies": tech_deps,
+                    "Color": "#3B82F6"
+                },
+                {
+                    "Workstream": "Data Integration",
+                    "Start": int_start,
+                    "Duration": int_duration,
+                    "Optimistic": int_range[0],
+                    "Pessimistic": int_range[1],
+                    "Dependencies": int_deps,
+                    "Color": "#10B981"
+                },
+                {
+                    "Workstream": "Governance Framework",
+                    "Start": gov_start,
+                    "Duration": gov_duration,
+                    "Optimistic": gov_range[0],
+                    "Pessimistic": gov_range[1],
+                    "Dependencies": gov_deps,
+                    "Color": "#F59E0B"
+                },
+                {
+                    "Workstream": "User Enablement",
+                    "Start": user_start,
+                    "Duration": user_duration,
+                    "Optimistic": user_range[0],
+                    "Pessimistic": user_range[1],
+                    "Dependencies": user_deps,
+                    "Color": "#8B5CF6"
+                },
+                {
+                    "Workstream": "Value Realization",
+                    "Start": value_start,
+                    "Duration": value_duration,
+                    "Optimistic": value_range[0],
+                    "Pessimistic": value_range[1],
+                    "Dependencies": value_deps,
+                    "Color": "#EF4444"
+                }
+            ]
+            
+            # Schedule the workstreams and additional tasks through the dependency graph
+            try:
+                tasks = [dict(workstream, Task=workstream["Workstream"], **WORKSTREAM_RESOURCES[workstream["Workstream"]])
+                         for workstream in workstreams] + extra_tasks.to_dict('records')
+                # Reuse the last plan so a changed workstream only recomputes the tasks it reaches
+                plan = update_schedule(st.session_state.get('implementation_schedule'), tasks)
+                st.session_state.implementation_schedule = plan
+                roles = ["Team"] + ps_roles
+                leveled = leveled_schedule(plan, task_loads(plan['graph'], tasks, ["FTEs"], ps_roles),
+                                           [team_size] + [ps_capacity[role] for role in ps_roles], roles)
+            except ScheduleError as error:
+                st.error(f"❌ The plan cannot be scheduled: {error}")
+                return
+            
+            col1_cpm, col2_cpm = st.columns(2)
+            with col1_cpm:
+                st.metric("Scheduled Duration", f"{plan['duration']:g} weeks")
+            with col2_cpm:
+                st.metric("Critical Tasks", int(plan['schedule']['Critical'].sum()),
+                          f"of {len(plan['schedule'])} tasks", delta_color="off")
+            
+            # Create timeline visualization
+            show_figure(schedule_gantt_figure, plan['schedule'])
+            
+            # Dependency visualization
+            st.subheader("🔗 Workstream Dependencies")
+            
+            # Rows are the scheduled tasks, columns the tasks and external gates they wait for
+            st.dataframe(dependency_frame(plan['graph']), use_container_width=True)
+            
+            # Resource allocation across workstreams, peaking where the leveled team load does
+            st.subheader("👥 Resource Allocation")
+            
+            task_ftes = {str(task.get("Task")).strip(): task.get("FTEs") for task in tasks}
+            resource_data = pd.DataFrame({
+                "Workstream": leveled['schedule']['Task'],
+                "FTEs Required": [0 if pd.isna(task_ftes[name]) else task_ftes[name]
+                                  for name in leveled['schedule']['Task']],
+                "Peak Week": peak_weeks(leveled, "Team")
+            })
+            
+            show_figure(resource_figure, resource_data)
+            
+            # The same plan booked against the team and PS capacity
+            st.subheader("⚖️ Resource-Leveled Schedule")
+            
+            ps_hours = leveled['load'][ps_roles].to_numpy().sum()
+            ps_spend = ps_hours * PS_HOURLY_RATE
+            finish_date = start_date + timedelta(weeks=leveled['duration'])
+            
+            col1_level, col2_level, col3_level, col4_level = st.columns(4)
+            with col1_level:
+                st.metric("Leveled Duration", f"{leveled['duration']} weeks",
+                          f"+{leveled['delay']:g} weeks" if leveled['delay'] > 0 else "No delay", delta_color="inverse")
+            with col2_level:
+                st.metric("Leveled Finish", finish_date.strftime("%d %b %Y"))
+            with col3_level:
+                st.metric("Peak Team Load", f"{leveled['utilization']['Team'].to_numpy().max(initial=0):.0f}%")
+            with col4_level:
+                st.metric("PS Spend", f"${ps_spend / 1000:,.0f}K", f"of ${budget}K budget", delta_color="off")
+            
+            if leveled['duration'] > duration_months * WEEKS_PER_MONTH:
+                st.warning(f"⚠️ With {team_size} team members the plan needs {leveled['duration']} weeks, "
+                           f"beyond the {duration_months}-month target")
+            if ps_spend > budget * 1000:
+                st.warning(f"⚠️ The plan needs {ps_hours:,.0f} PS hours (${ps_spend:,.0f}), "
+                           f"${ps_spend - budget * 1000:,.0f} over budget")
+            
+            show_figure(utilization_figure, leveled['utilization'])
+            
+            moved = leveled['schedule'][(leveled['schedule']['Delay (weeks)'] > 0) | leveled['schedule']['Stretched']]
+            if len(moved):
+                st.caption("Tasks moved or stretched to stay within capacity")
+                st.dataframe(moved, hide_index=True, use_container_width=True)
+            
+        else:
+            # Sequential timeline
+            phases_timeline = [
+                {"Phase": "Discovery", "Start": 0, "Duration": discovery_duration},
+                {"Phase": "Setup", "Start": discovery_duration, "Duration": setup_duration},
+                {"Phase": "Pilot", "Start": discovery_duration + setup_duration, "Duration": pilot_duration},
+                {"Phase": "Rollout", "Start": discovery_duration + setup_duration + pilot_duration, "Duration": rollout_duration},
+                {"Phase": "Optimization", "Start": discovery_duration + setup_duration + pilot_duration + rollout_duration, "Duration": optimization_duration}
+            ]
+            
+            timeline_df = pd.DataFrame(phases_timeline)
+            
+            show_figure(phase_timeline_figure, timeline_df)
+        
+        # Critical Path Analysis
+        st.header("🎯 Critical Path Analysis")
+        
+        if implementation_type in ["Parallel Workstreams", "Hybrid (Parallel with Dependencies)"]:
+            insights = "\n".join(f"- {insight}" for insight in schedule_insights(plan))
+            st.info(f"**Critical Path**: {' → '.join(plan['critical_path'])} ({plan['duration']:g} weeks)\n\n"
+                    f"**Key Insights:**\n{insights}")
+            
+            # Show float/slack for non-critical activities
+            st.subheader("⏱️ Schedule Flexibility")
+            
+            float_data = pd.DataFrame({
+                "Task": plan['schedule']['Task'],
+                "Float (weeks)": plan['schedule']['Slack'],
+                "Criticality": plan['schedule']['Criticality']
+            })
+            
+            st.dataframe(float_data, hide_index=True, use_container_width=True)
+            st.caption(f"Schedule analysis updated {plan['recomputed']} of {len(float_data)} tasks for this plan")
+            
+            # Three-point estimates: every run samples all durations and is propagated through the dependencies
+            st.subheader("🎲 Schedule Risk (PERT Monte Carlo)")
+            
+            target_weeks = duration_months * WEEKS_PER_MONTH
+            simulation = simulate_schedule(plan['graph'], *three_point_estimates(plan['graph'], tasks),
+                                           runs=schedule_runs)
+            p50 = finish_percentile(simulation, 50)
+            p80 = finish_percentile(simulation, 80)
+            on_time = finish_probability(simulation, target_weeks)
+            
+            col1_risk, col2_risk, col3_risk, col4_risk = st.columns(4)
+            with col1_risk:
+                st.metric("Most Likely Plan", f"{plan['duration']:g} weeks")
+            with col2_risk:
+                st.metric("P50 Finish", f"{p50:.1f} weeks")
+            with col3_risk:
+                st.metric("P80 Finish", f"{p80:.1f} weeks")
+            with col4_risk:
+                st.metric(f"Within {duration_months} Months", f"{on_time:.0%}")
+            
+            if on_time < 0.5:
+                st.warning(f"⚠️ Fewer than half of the simulated runs finish within {target_weeks:.0f} weeks")
+            
+            show_figure(schedule_risk_figure, simulation['counts'], simulation['edges'], target_weeks, p80)
+            
+            criticality_df = pd.DataFrame({
+                "Task": plan['schedule']['Task'],
+                "Criticality Index (%)": (simulation['criticality'] * 100).round(1)
+            }).sort_values("Criticality Index (%)", ascending=False, kind="stable")
+            show_figure(criticality_figure, criticality_df.head(20))
+            st.caption("Durations follow a Beta-PERT distribution between the optimistic and pessimistic weeks; "
+                       "team and PS capacity limits are not applied to the simulation")
+        
+        # Professional Services Hours Planning
+        st.header("👥 Professional Services Hours Planning")
+        
+        if implementation_type in ["Parallel Workstreams", "Hybrid (Parallel with Dependencies)"]:
+            # PS hours of every scheduled task, the same ones the leveled load books per week
+            ps_ws_df = task_hours(plan['graph'], tasks, ps_roles)
+            ps_ws_df["Total"] = ps_ws_df.sum(axis=1)
+            ps_workstream_hours = ps_ws_df.to_dict('index')
+            st.dataframe(ps_ws_df, use_container_width=True)
+            
+            # Visualize PS hours by workstream
+            show_figure(ps_workstream_figure, ps_workstream_hours)
+            
+            # PS timeline and peak loading
+            st.subheader("🗓️ PS Resource Loading Over Time")
+            
+            # Hours booked per week by the leveled schedule
+            show_figure(ps_loading_figure, leveled['load'][["Week"] + ps_roles])
+        
+        # Total PS Investment Calculator
+        st.header("💰 PS Investment Calculator")
+        
+        col1_calc, col2_calc = st.columns(2)
+        
+        with col1_calc:
+            st.markdown("### Standard SOW Package")
+            st.markdown("""
+            - **Foundation & Setup:** 70 hours
+            - **Domain Implementation:** 120 hours  
+            - **Training & Adoption:** 10 hours
+            - **Total:** 200 hours
+            - **Investment:** $75,000
+            """)
+            
+            st.success("✅ Covers one domain implementation")
+        
+        with col2_calc:
+            st.markdown("### Your Estimated Needs")
+            
+            # Calculate based on inputs
+            base_hours = 200
+            domain_multiplier = max(1, len(priority_domains) / 3)  # Every 3 domains adds complexity
+            team_efficiency = 1 - (min(team_size, 10) - 5) * 0.02  # Larger teams = some efficiency
+            
+            estimated_hours = int(base_hours * domain_multiplier * team_efficiency)
+            estimated_cost = estimated_hours * 375
+            
+            st.markdown(f"""
+            - **Domains to implement:** {len(priority_domains)}
+            - **Team size factor:** {team_efficiency:.2f}x
+            - **Estimated hours:** {estimated_hours}
+            - **Estimated investment:** ${estimated_cost:,}
+            """)
+            
+            if estimated_hours > 200:
+                st.warning(f"⚠️ You may need {estimated_hours - 200} additional hours beyond standard package")
+        
+        # Milestone Tracking
+        st.header("📍 Milestone Tracking Dashboard")
+        
+        milestone_data = pd.DataFrame({
+            "Milestone": ["Instance Live", "First Integration", "Pilot Launch", "Glossary Ready", 
+                         "Training Complete", "Full Rollout", "ROI Achieved"],
+            "Target Week": [2, 4, 6, 8, 12, 16, 20],
+            "Status": ["Not Started", "Not Started", "Not Started", "Not Started", 
+                      "Not Started", "Not Started", "Not Started"],
+            "Owner": ["Technical Lead", "Integration Lead", "Program Manager", "Governance Lead",
+                     "Enablement Lead", "Program Manager", "Value Lead"]
+        })
+        
+        st.dataframe(milestone_data, use_container_width=True)
+        
+        # Success Metrics Tracking
+        st.header("📈 Success Metrics Tracking Plan")
+        
+        st.info("Selected KPIs will be tracked throughout the implementation:")
+        
+        metrics_timeline = pd.DataFrame({
+            "Metric": success_metrics[:3] if len(success_metrics) >= 3 else success_metrics + [""] * (3 - len(success_metrics)),
+            "Baseline (Week 0)": ["0%", "0%", "0%"],
+            "Target (Week 8)": ["30%", "50%", "40%"],
+            "Target (Week 16)": ["60%", "75%", "70%"],
+            "Target (Week 24)": ["85%", "90%", "95%"]
+        })
+        
+        st.dataframe(metrics_timeline, use_container_width=True)
+        
+        # Communication Plan
+        st.header("📢 Communication Plan")
+        
+        comm_plan = pd.DataFrame({
+            "Audience": ["Executive Sponsors", "Data Stewards", "End Users", "IT Teams"],
+            "Frequency": ["Bi-weekly", "Weekly", "Monthly", "Weekly"],
+            "Channel": ["Steering Committee", "Working Groups", "Town Halls", "Tech Syncs"],
+            "Key Messages": ["Progress & Risks", "Implementation Details", "Benefits & Training", "Technical Updates"]
+        })
+        
+        st.dataframe(comm_plan, use_container_width=True)
+        
+        # Next Steps
+        st.header("👉 Immediate Next Steps")
+        
+        col1_next, col2_next = st.columns(2)
+        
+        with col1_next:
+            st.markdown("""
+            **Week 1 Actions:**
+            1. Finalize workstream leads
+            2. Schedule kickoff meetings
+            3. Set up project tools
+            4. Create communication channels
+            5. Baseline current metrics
+            """)
+        
+        with col2_next:
+            st.markdown("""
+            **Week 2 Actions:**
+            1. Complete technical setup
+            2. Begin governance framework
+            3. Identify pilot candidates
+            4. Start user interviews
+            5. Define success criteria
+            """)
+        
+        # Export options
+        st.markdown("---")
+        
+        # Plan data for the exports; the files themselves are only built when a button is clicked
+        if implementation_type in ["Parallel Workstreams", "Hybrid (Parallel with Dependencies)"]:
+            schedule = plan['schedule'].assign(**{"Leveled Start": leveled['schedule']['Start'],
+                                                  "Leveled Finish": leveled['schedule']['Finish']})
+            scheduled_weeks = leveled['duration']
+        else:
+            schedule = pd.DataFrame({
+                "Task": timeline_df["Phase"],
+                "Duration": timeline_df["Duration"],
+                "Earliest Start": timeline_df["Start"],
+                "Earliest Finish": timeline_df["Start"] + timeline_df["Duration"],
+                "Depends On": [""] + list(timeline_df["Phase"][:-1])
+            })
+            scheduled_weeks = schedule["Earliest Finish"].max()
+        
+        export_sheets = {"Schedule": schedule_table(schedule, start_date)}
+        export_sheets["Dependencies"] = dependency_table(schedule)
+        if implementation_type in ["Parallel Workstreams", "Hybrid (Parallel with Dependencies)"]:
+            export_sheets["PS Hours"] = ps_ws_df.rename_axis("Workstream")
+        export_sheets["Milestones"] = milestone_table(milestone_data, start_date)
+        # The dependency matrix grows with the square of the task count, so the PDF relies on Depends On instead
+        pdf_sheets = {title: frame for title, frame in export_sheets.items() if title != "Dependencies"}
+        project = {
+            "name": project_name,
+            "Strategy": implementation_type,
+            "Start Date": start_date.strftime("%d %b %Y"),
+            "Target Duration": f"{duration_months} months",
+            "Scheduled Duration": f"{scheduled_weeks:g} weeks",
+            "Team Size": f"{team_size} members",
+            "Budget": f"${budget}K",
+            "Priority Domains": ", ".join(priority_domains) or "None selected"
+        }
+        export_stem = file_stem(project_name)
+        
+        col1_export, col2_export, col3_export, col4_export = st.columns(4)
+        
+        # on_click="ignore" keeps the generated plan on screen after a download
+        with col1_export:
+            st.download_button(
+                label="📥 Download Implementation Plan",
+                data=lambda: plan_pdf(project, pdf_sheets),
+                file_name=f"{export_stem}_implementation_plan.pdf",
+                mime="application/pdf",
+                on_click="ignore"
+            )
+        
+        with col2_export:
+            st.download_button(
+                label="📊 Download Project Schedule",
+                data=lambda: workbook_xlsx(export_sheets),
+                file_name=f"{export_stem}_schedule.xlsx",
+                mime=XLSX_MIME,
+                on_click="ignore"
+            )
+        
+        with col3_export:
+            st.download_button(
+                label="🧾 Download Schedule CSV",
+                data=lambda: schedule_csv(export_sheets["Schedule"]),
+                file_name=f"{export_stem}_schedule.csv",
+                mime="text/csv",
+                on_click="ignore"
+            )
+        
+        with col4_export:
+            st.download_button(
+                label="📅 Download Milestones (iCal)",
+                data=lambda: milestones_ics(export_sheets["Milestones"], project_name),
+                file_name=f"{export_stem}_milestones.ics",
+                mime=ICS_MIME,
+                on_click="ignore"
+            )
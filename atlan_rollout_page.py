@@ -0,0 +1,296 @@
+import streamlit as st
+import pandas as pd
+from app_theme import show_figure
+from atlan_figures import rollout_histogram_figure, roadmap_figure, sensitivity_tornado_figure
+from figure_cache import figure_cache_info
+from render_profiler import RenderProfiler
+from rollout_engine import (ADOPTION_SUPPORT_LEVELS, BASE_PS_HOURS, MATURITY_FACTORS, PS_HOURLY_RATE,
+                            analyze_rollout, rollout_cache_info)
+
+
+# Rollout Simulator Page
+def rollout_simulator():
+    st.title("📈 Atlan Rollout Plan Simulator")
+    
+    # Back button
+    if st.button("← Back to Home"):
+        st.session_state.page = 'landing'
+        st.rerun()
+    
+    st.markdown("""
+    This simulator helps estimate your Atlan rollout timeline based on organizational factors and surfaces risks with targeted interventions.
+    """)
+    
+    # Create two columns for inputs
+    col1, col2 = st.columns([1, 2])
+    
+    with col1:
+        st.header("📊 Organization Profile")
+        
+        org_type = st.selectbox("Organization Type", ["Growth", "Enterprise", "Major Enterprise"])
+        num_domains = st.slider("Number of Data Domains", 1, 20, 5)
+        num_users = st.number_input("Expected Active Users", 10, 5000, 100, step=50)
+        
+        maturity = st.selectbox("Current DAMA Maturity Level", list(MATURITY_FACTORS))
+        
+        adoption_support = st.selectbox("Adoption Support Available", ADOPTION_SUPPORT_LEVELS)
+        
+        exec_sponsorship = st.radio("Executive Sponsorship Confirmed?", ["Yes", "No"])
+        timeline = st.slider("Target Rollout Timeline (months)", 3, 12, 6)
+        
+        st.header("🛠️ Adoption Accelerators")
+        
+        exec_connects = st.selectbox("Executive Connects Cadence", ["None", "Monthly", "Bi-weekly", "Weekly"])
+        workshops_type = st.multiselect("Workshops Planned", 
+            ["Architecture Review", "Admin Training", "End User Training", "Use Case Discovery", "Data Quality Workshop"])
+        champion_strength = st.selectbox("Champion Network", ["Weak", "Moderate", "Strong", "Very Strong"])
+        user_interviews = st.slider("User Interviews Planned", 0, 50, 15)
+        change_mgmt = st.checkbox("Formal Change Management Program")
+        dedicated_team = st.checkbox("Dedicated Implementation Team")
+        estimator = st.radio("Estimator", ["Analytic", "Monte Carlo"], horizontal=True,
+                             help="Analytic computes the duration distribution in closed form, without sampling")
+        cross_check = estimator == "Analytic" and st.checkbox("Cross-check with Monte Carlo")
+        run_monte_carlo = estimator == "Monte Carlo" or cross_check
+        simulations = st.select_slider("Monte Carlo Runs", [5000, 10000, 50000, 100000, 500000, 1000000], value=5000,
+                                       disabled=not run_monte_carlo)
+        simulation_mode = st.radio("Simulation Mode", ["Global Noise", "Per-Factor"], horizontal=True,
+                                   help="Per-Factor models each duration factor with its own distribution")
+        show_density = st.checkbox("Overlay Density Curve", value=True)
+    
+    profiler = RenderProfiler('atlan/rollout')
+    
+    with col2:
+        # Calculate metrics (memoized on the normalized inputs)
+        with profiler.block('rollout analysis'):
+            analysis = analyze_rollout(
+                org_type, num_domains, num_users, maturity, adoption_support, exec_sponsorship,
+                timeline, exec_connects, workshops_type, champion_strength, user_interviews,
+                change_mgmt, dedicated_team, simulations=simulations, simulation_mode=simulation_mode,
+                monte_carlo=run_monte_carlo
+            )
+        expected_duration = analysis["expected_duration"]
+        risk_factors = analysis["risk_factors"]
+        risk = analysis["risk_score"]
+        
+        # Display metrics with PS hours
+        st.header("📊 Rollout Analysis")
+        
+        col1_metrics, col2_metrics, col3_metrics, col4_metrics = st.columns(4)
+        
+        with col1_metrics:
+            st.metric("Expected Duration", f"{expected_duration:.1f} months", 
+                     f"{expected_duration - timeline:.1f} vs target",
+                     delta_color="inverse")
+        
+        with col2_metrics:
+            risk_label = "High" if risk > 60 else "Medium" if risk > 30 else "Low"
+            st.metric("Risk Score", f"{risk}/100", risk_label)
+        
+        with col3_metrics:
+            success_prob = analysis["success_prob"]
+            st.metric("Success Probability", f"{success_prob}%")
+        
+        with col4_metrics:
+            # PS hours based on actual factors
+            ps_breakdown = analysis["ps"]
+            timeline_factor = ps_breakdown["timeline_factor"]
+            scope_factor = ps_breakdown["scope_factor"]
+            maturity_key = ps_breakdown["maturity_key"]
+            maturity_factor = ps_breakdown["maturity_factor"]
+            ps_hours = ps_breakdown["ps_hours"]
+            st.metric("PS Hours Needed", f"{ps_hours} hrs", f"${ps_hours * PS_HOURLY_RATE:,}")
+        
+        # PS Hours Breakdown Section
+        st.header("👥 Professional Services Allocation")
+        
+        # Show how PS hours were calculated
+        with st.expander("📊 How PS Hours Were Calculated", expanded=True):
+            st.markdown(f"""
+            **Base Package:** {BASE_PS_HOURS} hours (standard SOW)
+            
+            **Adjustments Applied:**
+            - **Timeline Factor:** {timeline_factor:.1f}x ({timeline} month target)
+            - **Scope Factor:** {scope_factor:.1f}x ({num_domains} domains, {num_users} users)
+            - **Maturity Factor:** {maturity_factor:.1f}x ({maturity_key})
+            
+            **Total Hours:** {BASE_PS_HOURS} × {timeline_factor:.1f} × {scope_factor:.1f} × {maturity_factor:.1f} = **{ps_hours} hours**
+            
+            **Investment:** {ps_hours} hours × ${PS_HOURLY_RATE}/hour = **${ps_hours * PS_HOURLY_RATE:,}**
+            """)
+        
+        ps_col1, ps_col2 = st.columns([2, 1])
+        
+        with ps_col1:
+            # Dynamic PS allocation based on calculated hours
+            st.markdown("### PS Hours Distribution")
+            
+            # Allocate hours proportionally
+            foundation_pct = 0.35
+            domain_pct = 0.50
+            training_pct = 0.15
+            
+            ps_allocation = {
+                "Phase": ["Foundation & Setup", "Domain Implementation", "Training & Adoption"],
+                "% of Total": [f"{foundation_pct*100:.0f}%", f"{domain_pct*100:.0f}%", f"{training_pct*100:.0f}%"],
+                "Hours": [
+                    int(ps_hours * foundation_pct),
+                    int(ps_hours * domain_pct),
+                    int(ps_hours * training_pct)
+                ],
+                "Focus": ["Technical setup, migration", "Use cases, workflows, governance", "Enablement, adoption"]
+            }
+            
+            # Role distribution
+            tam_split = 0.35  # 35% TAM
+            csa_split = 0.40  # 40% CSA
+            eng_split = 0.25  # 25% Engineer
+            
+            ps_allocation["TAM"] = [
+                int(ps_hours * foundation_pct * 0.2),
+                int(ps_hours * domain_pct * 0.5),
+                int(ps_hours * training_pct * 0.9)
+            ]
+            ps_allocation["CSA"] = [
+                int(ps_hours * foundation_pct * 0.4),
+                int(ps_hours * domain_pct * 0.3),
+                int(ps_hours * training_pct * 0.1)
+            ]
+            ps_allocation["Engineer"] = [
+                int(ps_hours * foundation_pct * 0.4),
+                int(ps_hours * domain_pct * 0.2),
+                int(ps_hours * training_pct * 0.0)
+            ]
+            
+            ps_df = pd.DataFrame(ps_allocation)
+            st.dataframe(ps_df.set_index("Phase"), use_container_width=True)
+        
+        with ps_col2:
+            # PS package recommendations
+            st.markdown("### Package Recommendation")
+            
+            if ps_hours <= 220:
+                st.success("""
+                **Standard Package**
+                - 200 hours base
+                - Single domain focus
+                - 3-month timeline
+                """)
+            elif ps_hours <= 350:
+                st.warning("""
+                **Extended Package**
+                - 300+ hours
+                - Multi-domain rollout
+                - Complex integrations
+                """)
+            else:
+                st.error("""
+                **Enterprise Package**
+                - 400+ hours
+                - Full transformation
+                - Phased approach recommended
+                """)
+            
+            # Key factors affecting hours
+            st.markdown("### Key Factors")
+            if timeline <= 3:
+                st.warning("⚡ Aggressive timeline increases PS needs")
+            if num_domains > 5:
+                st.info(f"📊 {num_domains} domains require phased approach")
+            if maturity_key in ["Level 0", "Level 1"]:
+                st.warning("🎯 Low maturity requires more guidance")
+        
+        # Timeline Distribution
+        st.header("📈 Timeline Distribution Analysis")
+        
+        # Closed-form estimate, or the Monte Carlo simulation when it is the chosen estimator
+        estimate = analysis["analytic"] if estimator == "Analytic" else analysis["simulation"]
+        density = (estimate["density_x"], estimate["density_y"]) if show_density else None
+        
+        # Histogram of the server-side bin counts; the chart payload is the same for any number of runs
+        with profiler.block('timeline histogram'):
+            show_figure(rollout_histogram_figure, estimate["counts"], estimate["bin_edges"], timeline,
+                        expected_duration, simulations if estimator == "Monte Carlo" else None, density)
+        
+        # Success metrics
+        on_time_probability = estimate["on_time_probability"]
+        p50 = estimate["p50"]
+        p90 = estimate["p90"]
+        
+        col1_prob, col2_prob, col3_prob = st.columns(3)
+        with col1_prob:
+            st.metric("On-Time Probability", f"{on_time_probability:.1f}%")
+        with col2_prob:
+            st.metric("50% Confidence", f"{p50:.1f} months")
+        with col3_prob:
+            st.metric("90% Confidence", f"{p90:.1f} months")
+        
+        if cross_check:
+            st.subheader("🔍 Analytic vs Monte Carlo")
+            st.dataframe(analysis["cross_check"].round(3), hide_index=True, use_container_width=True)
+            st.caption(f"{analysis['analytic']['distribution']} closed form against {simulations:,} runs; "
+                       f"the simulated on-time probability itself carries "
+                       f"±{analysis['simulation']['on_time_std_error']:.2f} points of sampling error")
+        
+        if simulation_mode == "Per-Factor":
+            # Tornado chart from the same estimator as the histogram
+            st.subheader("🌪️ Timeline Sensitivity by Factor")
+            
+            with profiler.block('sensitivity tornado'):
+                show_figure(sensitivity_tornado_figure, estimate["attribution"], p50)
+        
+        # Risk Analysis
+        st.header("⚠️ Risk Analysis & Mitigation")
+        
+        risk_df = pd.DataFrame([
+            {"Factor": name, "Impact": f"{(factor-1)*100:.0f}%", "Status": "🔴 High Risk" if is_risk else "🟢 Managed"}
+            for name, factor, is_risk in risk_factors
+        ])
+        
+        st.dataframe(risk_df, use_container_width=True, hide_index=True)
+        
+        # Recommendations
+        st.header("✅ Prioritized Recommendations")
+        
+        recommendations = []
+        
+        if exec_sponsorship == "No":
+            recommendations.append(("🚨 Critical", "Secure executive sponsorship immediately - this is the #1 success factor"))
+        
+        if exec_connects == "None":
+            recommendations.append(("⚠️ High", "Establish bi-weekly executive connects to maintain momentum"))
+        
+        if len(workshops_type) < 3:
+            recommendations.append(("⚠️ High", f"Plan {3-len(workshops_type)} additional workshops: Architecture Review and End User Training are essential"))
+        
+        if user_interviews < 15:
+            recommendations.append(("📋 Medium", f"Conduct {15-user_interviews} more user interviews to understand requirements"))
+        
+        if champion_strength in ["Weak", "Moderate"]:
+            recommendations.append(("📋 Medium", "Identify and empower 5-7 strong champions across different domains"))
+        
+        if not change_mgmt:
+            recommendations.append(("📋 Medium", "Implement formal change management program with communication plan"))
+        
+        if not dedicated_team:
+            recommendations.append(("💡 Low", "Consider dedicated team for faster implementation"))
+        
+        for priority, rec in recommendations:
+            st.markdown(f"{priority}: {rec}")
+        
+        # Implementation Roadmap
+        st.header("🗓️ Suggested Implementation Roadmap")
+        
+        roadmap_df = analysis["roadmap_df"]
+        
+        with profiler.block('roadmap chart'):
+            show_figure(roadmap_figure, roadmap_df)
+    
+    # Memoization stats for the rollout computations
+    cache = rollout_cache_info()
+    st.sidebar.markdown("---")
+    st.sidebar.metric("⚡ Rollout Cache Hits", cache.hits,
+                      f"{cache.currsize}/{cache.maxsize} scenarios cached", delta_color="off")
+    figures = figure_cache_info()
+    st.sidebar.metric("🖼️ Figure Cache Hits", figures.hits,
+                      f"{figures.currsize}/{figures.maxsize} figures cached", delta_color="off")
+    profiler.finish()
@@ -0,0 +1,68 @@
+import importlib
+
+import streamlit as st
+from app_theme import THEMES
+
+# Page modules are imported on first visit, so a rerun only loads and runs the page being shown
+PAGES = {
+    'landing': ('atlan_landing_page', 'landing_page'),
+    'rollout': ('atlan_rollout_page', 'rollout_simulator'),
+    'maturity': ('atlan_maturity_page', 'maturity_assessment'),
+    'implementation': ('atlan_planner_page', 'implementation_planner')
+}
+
+
+def render_page(page):
+    """Import the page's module if needed and render it"""
+    module_name, function_name = PAGES[page]
+    getattr(importlib.import_module(module_name), function_name)()
+
+
+# Main app logic
+def main(default_theme):
+    """Run the simulator with the entry point's default theme; the sidebar can switch it per session"""
+    # Page configuration
+    st.set_page_config(
+        page_title="Atlan Rollout & Implementation Simulator", 
+        layout="wide",
+        page_icon="📊"
+    )
+    
+    # Initialize session state
+    if 'page' not in st.session_state:
+        st.session_state.page = 'landing'
+    if 'theme' not in st.session_state:
+        st.session_state.theme = default_theme['name']
+    
+    # Sidebar navigation
+    with st.sidebar:
+        st.image("https://via.placeholder.com/150x50/4F46E5/FFFFFF?text=ATLAN", width=150)
+        st.markdown("---")
+        
+        st.markdown("### 🧭 Navigation")
+        if st.button("🏠 Home", use_container_width=True):
+            st.session_state.page = 'landing'
+            st.rerun()
+        if st.button("📈 Rollout Simulator", use_container_width=True):
+            st.session_state.page = 'rollout'
+            st.rerun()
+        if st.button("📊 Maturity Assessment", use_container_width=True):
+            st.session_state.page = 'maturity'
+            st.rerun()
+        if st.button("🏗️ Implementation Planner", use_container_width=True):
+            st.session_state.page = 'implementation'
+            st.rerun()
+        
+        st.markdown("---")
+        # Figures are theme-agnostic; switching only changes the CSS and the layout patch applied at render time
+        st.radio("🎨 Theme", list(THEMES), format_func=lambda name: THEMES[name]['label'],
+                 key='theme', horizontal=True)
+        
+        st.markdown("---")
+        st.markdown("### 📞 Need Help?")
+        st.markdown("Contact your Atlan Customer Success Manager or visit [docs.atlan.com](https://docs.atlan.com)")
+    
+    st.markdown(THEMES[st.session_state.theme]['css'], unsafe_allow_html=True)
+    
+    # Page routing
+    render_page(st.session_state.page)
@@ -0,0 +1,194 @@
+import argparse
+import csv
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+
+import pandas as pd
+
+from assessment_catalog import build_catalog
+from compliance_report import report_filename, validate_assessment, write_html_report
+from compliance_scoring import score_compliance
+from compliance_store import answer_frame, encode_answers
+
+BULK_CHUNK_SIZE = 100
+SUMMARY_FILE = 'portfolio_summary.csv'
+# CSV answer columns are q1..qN in catalog order
+ANSWER_COLUMN = re.compile(r'^q(\d+)$')
+PHASES = ['load', 'catalog', 'score', 'render', 'summary']
+# Key of the placeholder read_assessments leaves for a line it could not parse
+PARSE_ERROR = 'parse_error'
+SUMMARY_COLUMNS = ['Organization', 'Industry', 'AI Role', 'Overall Compliance %', 'Applicable', 'Compliant',
+                   'Partial', 'Non-Compliant', 'N/A', 'Critical Gaps', 'High Gaps', 'Medium Gaps', 'Report',
+                   'Status', 'Error']
+
+
+@lru_cache(maxsize=None)
+def _questions():
+    """Question table built once per worker process"""
+    return build_catalog()['question_table']
+
+
+def read_assessments(path):
+    """Read assessments from JSONL objects or CSV rows of org_info columns, ai_role and q1..qN answers"""
+    if path.endswith('.jsonl'):
+        assessments = []
+        with open(path, encoding='utf-8') as handle:
+            for number, line in enumerate(handle, 1):
+                if not line.strip():
+                    continue
+                # A malformed line becomes a placeholder, reported as a failed row like any invalid assessment
+                try:
+                    assessments.append(json.loads(line))
+                except ValueError as error:
+                    assessments.append({PARSE_ERROR: f"line {number} is not valid JSON: {error}"})
+        return assessments
+
+    assessments = []
+    with open(path, newline='', encoding='utf-8') as handle:
+        for row in csv.DictReader(handle):
+            answers = {}
+            org_info = {}
+            for column, value in row.items():
+                match = ANSWER_COLUMN.match(column)
+                if match:
+                    answers[int(match.group(1)) - 1] = value or None
+                elif column != 'ai_role' and value:
+                    org_info[column] = value
+            assessments.append({
+                'org_info': org_info,
+                'ai_role': row.get('ai_role') or 'both',
+                'answers': [answers.get(index) for index in range(max(answers, default=-1) + 1)]
+            })
+    return assessments
+
+
+def _render_chunk(start, assessments, output_dir, generated):
+    """Score and write the reports for one chunk, returning summary rows and phase timings"""
+    timings = dict.fromkeys(['catalog', 'score', 'render'], 0.0)
+
+    began = time.perf_counter()
+    questions = _questions()
+    timings['catalog'] += time.perf_counter() - began
+
+    rows = []
+    for index, assessment in enumerate(assessments, start):
+        began = time.perf_counter()
+        # A malformed assessment becomes a failed summary row instead of stopping the whole portfolio
+        try:
+            if isinstance(assessment, dict) and PARSE_ERROR in assessment:
+                raise ValueError(assessment[PARSE_ERROR])
+            org_info, ai_role = validate_assessment(assessment)
+            codes = encode_answers(questions, assessment['answers'])
+        except ValueError as error:
+            org_info = assessment.get('org_info') if isinstance(assessment, dict) else None
+            name = org_info.get('name') if isinstance(org_info, dict) else None
+            rows.append({'Organization': name or f"Row {index + 1}", 'Status': 'Failed', 'Error': str(error)})
+            continue
+        scores = score_compliance(questions, codes)
+        scored = time.perf_counter()
+
+        # Row numbers keep file names unique when business units share a name
+        path = os.path.join(output_dir, f"{index + 1:05d}_{report_filename(org_info.get('name', 'Organization'), generated)}")
+        with open(path, 'w', encoding='utf-8') as stream:
+            write_html_report(stream, org_info, answer_frame(questions, codes), ai_role, scores, generated)
+        timings['score'] += scored - began
+        timings['render'] += time.perf_counter() - scored
+
+        overall = scores['overall']
+        rows.append({
+            'Organization': org_info.get('name', 'Organization'),
+            'Industry': org_info.get('industry', 'N/A'),
+            'AI Role': ai_role,
+            'Overall Compliance %': round(overall['overall_compliance'], 1),
+            'Applicable': overall['applicable_questions'],
+            'Compliant': overall['fully_compliant'],
+            'Partial': overall['partial_compliant'],
+            'Non-Compliant': overall['non_compliant'],
+            'N/A': overall['not_applicable'],
+            'Critical Gaps': len(scores['gaps']['critical']),
+            'High Gaps': len(scores['gaps']['high']),
+            'Medium Gaps': len(scores['gaps']['medium']),
+            'Report': path,
+            'Status': 'OK',
+            'Error': ''
+        })
+    return rows, timings
+
+
+def generate_reports(assessments, output_dir, workers=None, chunk_size=BULK_CHUNK_SIZE, generated=None):
+    """Write one HTML report per assessment, optionally across a process pool"""
+    generated = generated or datetime.now()
+    os.makedirs(output_dir, exist_ok=True)
+    chunks = [(start, assessments[start:start + chunk_size]) for start in range(0, len(assessments), chunk_size)]
+
+    if workers == 1 or len(chunks) <= 1:
+        parts = [_render_chunk(start, chunk, output_dir, generated) for start, chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_render_chunk, *zip(*chunks), [output_dir] * len(chunks),
+                                  [generated] * len(chunks)))
+
+    # Worker timings are summed, so they are CPU seconds rather than wall-clock time
+    timings = dict.fromkeys(['catalog', 'score', 'render'], 0.0)
+    rows = []
+    for part_rows, part_timings in parts:
+        rows.extend(part_rows)
+        for phase, seconds in part_timings.items():
+            timings[phase] += seconds
+    return pd.DataFrame(rows, columns=SUMMARY_COLUMNS), timings
+
+
+def portfolio_overview(summary):
+    """Aggregate the per-organization summary into portfolio-level figures; failed rows are only counted"""
+    scored = summary[summary['Status'] == 'OK']
+    return {
+        'organizations': len(scored),
+        'failed': len(summary) - len(scored),
+        'mean_compliance': scored['Overall Compliance %'].mean() if len(scored) else 0,
+        'below_80_percent': int((scored['Overall Compliance %'] < 80).sum()) if len(scored) else 0,
+        'critical_gaps': int(scored['Critical Gaps'].sum()) if len(scored) else 0,
+        'high_gaps': int(scored['High Gaps'].sum()) if len(scored) else 0
+    }
+
+
+def main(argv=None):
+    """Generate EU AI Act compliance reports for a portfolio of organizations"""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument('input', help="CSV (org_info columns, ai_role, q1..qN) or JSONL (org_info, ai_role, answers)")
+    parser.add_argument('--output-dir', default='reports', help="Directory for the reports and portfolio summary")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (1 runs in-process)")
+    parser.add_argument('--chunk-size', type=int, default=BULK_CHUNK_SIZE, help="Assessments per worker task")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    assessments = read_assessments(args.input)
+    load_seconds = time.perf_counter() - started
+
+    summary, timings = generate_reports(assessments, args.output_dir, args.workers, args.chunk_size)
+    generated = time.perf_counter()
+
+    summary.to_csv(os.path.join(args.output_dir, SUMMARY_FILE), index=False)
+    overview = portfolio_overview(summary)
+    finished = time.perf_counter()
+
+    timings.update(load=load_seconds, summary=finished - generated)
+    elapsed = finished - started
+    print(f"Reports written: {overview['organizations']} to {args.output_dir}")
+    if overview['failed']:
+        print(f"Assessments skipped: {overview['failed']} (see the Error column of {SUMMARY_FILE})")
+    print(f"Portfolio mean compliance: {overview['mean_compliance']:.1f}% "
+          f"({overview['below_80_percent']} below 80%, {overview['critical_gaps']} critical gaps, "
+          f"{overview['high_gaps']} high-risk gaps)")
+    print("Phase timings (score/render/catalog summed across workers):")
+    for phase in PHASES:
+        print(f"  {phase:<8} {timings[phase]:8.3f}s")
+    print(f"  {'wall':<8} {elapsed:8.3f}s  ({overview['organizations'] / elapsed * 60 if elapsed else 0:,.0f} reports/min)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+from datetime import datetime
+from io import BytesIO
+
+from fpdf import FPDF
+from fpdf.enums import XPos, YPos
+
+from compliance_charts import article_chart_png
+
+PDF_CHART_DPI = 100
+# Core PDF fonts are latin-1 only, so typographic punctuation is folded to ASCII
+PDF_REPLACEMENTS = str.maketrans({'–': '-', '—': '-', '‘': "'", '’': "'", '“': '"', '”': '"', '…': '...'})
+HEADER_FILL = (102, 126, 234)
+
+
+def score_clauses(relevant_sections, user_answers):
+    """Tally answers per clause and per section; anything but "Yes" counts as a gap"""
+    clause_summary = {}
+    compliant = []
+    gaps = []
+    section_scores = {s: [0, 0] for s in relevant_sections}  # answered, total
+
+    for section, questions in relevant_sections.items():
+        for q, (clause_title, clause_link) in questions.items():
+            a = user_answers.get(q, "No")  # Default to "No" if missing
+            clause_summary.setdefault(clause_title, {"link": clause_link, "compliant": 0, "total": 0, "questions": []})
+            clause_summary[clause_title]["total"] += 1
+            section_scores[section][1] += 1
+
+            if a == "Yes":
+                clause_summary[clause_title]["compliant"] += 1
+                compliant.append((q, clause_title, clause_link))
+                section_scores[section][0] += 1
+            else:
+                gaps.append((q, clause_title, clause_link))
+            clause_summary[clause_title]["questions"].append((q, a))
+
+    return clause_summary, compliant, gaps, section_scores
+
+
+def article_chart_data(clause_summary):
+    """Labels and compliance percentages for the article chart, in clause order"""
+    labels = tuple(clause.replace(' – ', '\n') for clause in clause_summary)
+    values = tuple(round((details['compliant'] / details['total']) * 100, 1) for details in clause_summary.values())
+    return labels, values
+
+
+def pdf_text(text):
+    """Make text safe for the core PDF fonts"""
+    return str(text).translate(PDF_REPLACEMENTS).encode('latin-1', 'replace').decode('latin-1')
+
+
+def _table_header(pdf, columns):
+    """Draw a filled header row for a table of (title, width) columns"""
+    pdf.set_font('Helvetica', 'B', 9)
+    pdf.set_fill_color(*HEADER_FILL)
+    pdf.set_text_color(255, 255, 255)
+    for title, width in columns:
+        pdf.cell(width, 7, title, border=1, fill=True)
+    pdf.ln()
+    pdf.set_text_color(0, 0, 0)
+    pdf.set_font('Helvetica', '', 9)
+
+
+def build_pdf_report(org_info, clause_summary, section_scores, gaps, assessment_label, chart_png=None,
+                     generated=None):
+    """Build the compliance PDF entirely in memory and return its bytes"""
+    generated = generated or datetime.now()
+    total_questions = sum(total for _, total in section_scores.values())
+    total_compliant = sum(met for met, _ in section_scores.values())
+    overall_compliance = round((total_compliant / total_questions) * 100, 1) if total_questions else 0
+
+    pdf = FPDF()
+    pdf.set_auto_page_break(auto=True, margin=15)
+    pdf.add_page()
+
+    pdf.set_font('Helvetica', 'B', 18)
+    pdf.cell(0, 12, pdf_text(f"EU AI Act Compliance Report - {org_info.get('name', 'Unknown')}"),
+             new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+    pdf.set_font('Helvetica', '', 10)
+    pdf.cell(0, 6, pdf_text(f"Assessment Type: {assessment_label} | Industry: {org_info.get('industry', 'Unknown')}"),
+             new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+    pdf.cell(0, 6, f"Generated: {generated.strftime('%B %d, %Y')}", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+    pdf.ln(4)
+
+    # Executive summary
+    pdf.set_font('Helvetica', 'B', 14)
+    pdf.cell(0, 9, "Executive Summary", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+    pdf.set_font('Helvetica', '', 11)
+    pdf.cell(0, 7, f"Overall Compliance: {overall_compliance}%", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+    pdf.cell(0, 7, f"Areas Addressed: {total_compliant}/{total_questions}", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+    pdf.cell(0, 7, f"Priority Gaps: {len(gaps)}", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+    pdf.ln(4)
+
+    # Section scores
+    pdf.set_font('Helvetica', 'B', 14)
+    pdf.cell(0, 9, "Section Analysis", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+    _table_header(pdf, [("Section", 120), ("Met", 20), ("Total", 20), ("Score", 30)])
+    for section, (met, total) in section_scores.items():
+        pdf.cell(120, 6, pdf_text(section[:70]), border=1)
+        pdf.cell(20, 6, str(met), border=1)
+        pdf.cell(20, 6, str(total), border=1)
+        pdf.cell(30, 6, f"{round(met / total * 100, 1) if total else 0}%", border=1, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+    pdf.ln(4)
+
+    # Article chart, rendered straight into a PNG buffer
+    if chart_png is None:
+        chart_png = article_chart_png(*article_chart_data(clause_summary), dpi=PDF_CHART_DPI)
+    pdf.add_page()
+    pdf.set_font('Helvetica', 'B', 14)
+    pdf.cell(0, 9, "Article Compliance", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+    pdf.image(BytesIO(chart_png), w=pdf.epw)
+    pdf.ln(4)
+
+    _table_header(pdf, [("Article", 150), ("Compliant", 40)])
+    for clause, details in clause_summary.items():
+        pdf.cell(150, 6, pdf_text(clause[:90]), border=1, link=details['link'])
+        pdf.cell(40, 6, f"{details['compliant']}/{details['total']}", border=1, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+
+    # Gap list
+    pdf.add_page()
+    pdf.set_font('Helvetica', 'B', 14)
+    pdf.cell(0, 9, f"Priority Gaps ({len(gaps)})", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+    for q, clause, link in gaps:
+        pdf.set_font('Helvetica', 'B', 9)
+        pdf.multi_cell(0, 5, pdf_text(clause), link=link, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+        pdf.set_font('Helvetica', '', 9)
+        pdf.multi_cell(0, 5, pdf_text(f"- {q}"), new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+        pdf.ln(1)
+
+    return bytes(pdf.output())
+
+
+def iter_pdf_reports(assessments, relevant_sections, assessment_label, generated=None):
+    """Yield (org_info, pdf bytes) for many assessments without writing to disk"""
+    for assessment in assessments:
+        clause_summary, _, gaps, section_scores = score_clauses(relevant_sections, assessment['user_answers'])
+        yield assessment['org_info'], build_pdf_report(assessment['org_info'], clause_summary, section_scores,
+                                                        gaps, assessment_label, generated=generated)
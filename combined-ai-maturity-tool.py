@@ -4,6 +4,8 @@ import plotly.graph_objects as go
 import plotly.express as px
 from datetime import datetime
 import numpy as np
+from assessment_catalog import build_catalog, combined_requirements
+from render_profiler import RenderProfiler
 
 # Page config
 st.set_page_config(
@@ -25,809 +27,18 @@ if 'compliance_answers' not in st.session_state:
 if 'org_info' not in st.session_state:
     st.session_state.org_info = {}
 
-# Gartner AI Maturity Model - Enhanced with market data
-gartner_maturity_levels = {
-    1: {
-        "name": "Awareness",
-        "description": "Organization is exploring AI possibilities without active implementation",
-        "market_position": "Bottom 20% - Lagging behind competitors",
-        "characteristics": [
-            "AI discussions happening but no strategic roadmap",
-            "Limited understanding of AI capabilities and limitations",
-            "No formal AI governance or dedicated resources",
-            "Awareness of AI potential but no concrete plans"
-        ],
-        "business_impact": {
-            "revenue": "Below industry average by 15-20%",
-            "efficiency": "Manual processes dominate",
-            "innovation": "Minimal innovation capability",
-            "risk": "Unaware of AI-related risks"
-        },
-        "typical_organizations": "Traditional enterprises just starting digital transformation",
-        "time_to_next_level": "12-18 months with focused effort",
-        "investment_required": "€500K - €2M initial investment",
-        "key_barriers": [
-            "Lack of AI leadership and vision",
-            "Limited technical capabilities",
-            "Data silos and quality issues",
-            "Cultural resistance to change"
-        ],
-        "critical_success_factors": [
-            "Executive buy-in and sponsorship",
-            "AI literacy programs",
-            "Data foundation assessment",
-            "Quick win pilot identification"
-        ],
-        "atlan_accelerators": {
-            "Data Discovery": "Understand what data assets you have across the organization",
-            "Data Quality Assessment": "Identify and fix data quality issues blocking AI initiatives",
-            "Metadata Management": "Create a single source of truth for all data assets",
-            "Collaboration Tools": "Break down silos between data, IT, and business teams"
-        },
-        "color": "#ff6b6b"
-    },
-    2: {
-        "name": "Active",
-        "description": "Organization is experimenting with AI through pilots and proof of concepts",
-        "market_position": "Bottom 40% - Starting to catch up",
-        "characteristics": [
-            "Running AI pilots in specific departments",
-            "Basic AI skills present in pockets",
-            "Initial data quality improvements underway",
-            "Some executive sponsorship for AI initiatives"
-        ],
-        "business_impact": {
-            "revenue": "5-10% efficiency gains in pilot areas",
-            "efficiency": "20-30% process improvement in isolated use cases",
-            "innovation": "Beginning to explore new possibilities",
-            "risk": "Ad-hoc risk management"
-        },
-        "typical_organizations": "Companies with digital initiatives and innovation labs",
-        "time_to_next_level": "18-24 months with structured approach",
-        "investment_required": "€2M - €10M for scaling",
-        "key_barriers": [
-            "Difficulty scaling from pilots to production",
-            "Lack of enterprise data strategy",
-            "Skills gap in AI/ML expertise",
-            "Fragmented technology landscape"
-        ],
-        "critical_success_factors": [
-            "Establish AI Center of Excellence",
-            "Implement data governance framework",
-            "Build reusable AI infrastructure",
-            "Develop success metrics and KPIs"
-        ],
-        "atlan_accelerators": {
-            "Data Lineage": "Track data flow from source to AI models for reliability",
-            "Quality Monitoring": "Automated data quality checks for AI training data",
-            "Access Control": "Secure data access for AI teams while maintaining governance",
-            "Impact Analysis": "Understand downstream effects of data changes on AI models"
-        },
-        "color": "#ffa726"
-    },
-    3: {
-        "name": "Operational",
-        "description": "AI is integrated into core business processes with measurable impact",
-        "market_position": "Top 40% - Above industry average",
-        "characteristics": [
-            "Multiple AI systems in production",
-            "Dedicated AI/ML teams established",
-            "Formal AI governance and ethics policies",
-            "Systematic approach to AI development"
-        ],
-        "business_impact": {
-            "revenue": "15-25% revenue improvement from AI",
-            "efficiency": "40-50% automation of routine tasks",
-            "innovation": "New AI-enhanced products/services",
-            "risk": "Formal risk management processes"
-        },
-        "typical_organizations": "Digital leaders and tech-forward enterprises",
-        "time_to_next_level": "24-36 months for transformation",
-        "investment_required": "€10M - €50M for enterprise scale",
-        "key_barriers": [
-            "Complexity of enterprise-wide integration",
-            "Change management at scale",
-            "Regulatory compliance requirements",
-            "Technical debt from early implementations"
-        ],
-        "critical_success_factors": [
-            "MLOps and AIOps implementation",
-            "Enterprise AI platform strategy",
-            "Cross-functional AI teams",
-            "Continuous learning culture"
-        ],
-        "atlan_accelerators": {
-            "ML Model Governance": "Complete lifecycle management for all AI models",
-            "Automated Compliance": "Built-in EU AI Act compliance workflows",
-            "Business Glossary": "Ensure consistent understanding across AI initiatives",
-            "Advanced Analytics": "Monitor model performance and business impact"
-        },
-        "color": "#66bb6a"
-    },
-    4: {
-        "name": "Systemic",
-        "description": "AI drives innovation and competitive advantage across the organization",
-        "market_position": "Top 20% - Industry leader",
-        "characteristics": [
-            "AI embedded in strategic planning",
-            "Cross-functional AI integration",
-            "Continuous AI innovation culture",
-            "Advanced AI capabilities (GenAI, ML, etc.)"
-        ],
-        "business_impact": {
-            "revenue": "30-40% competitive advantage from AI",
-            "efficiency": "60-70% of decisions AI-augmented",
-            "innovation": "AI-first product development",
-            "risk": "Predictive risk management"
-        },
-        "typical_organizations": "Tech giants and AI-native companies",
-        "time_to_next_level": "36-48 months for full transformation",
-        "investment_required": "€50M+ for platform leadership",
-        "key_barriers": [
-            "Talent competition and retention",
-            "Keeping pace with AI advancement",
-            "Ethical AI at scale",
-            "Platform ecosystem complexity"
-        ],
-        "critical_success_factors": [
-            "AI platform ecosystem",
-            "Continuous innovation pipeline",
-            "Strategic partnerships",
-            "Thought leadership"
-        ],
-        "atlan_accelerators": {
-            "AI Ecosystem Management": "Orchestrate complex AI workflows across platforms",
-            "Real-time Governance": "Automated policy enforcement and monitoring",
-            "Knowledge Graph": "Connect all data, models, and insights intelligently",
-            "API Integration": "Seamless integration with entire AI tool stack"
-        },
-        "color": "#42a5f5"
-    },
-    5: {
-        "name": "Transformational",
-        "description": "AI is core to business model and value proposition",
-        "market_position": "Top 5% - Market maker and disruptor",
-        "characteristics": [
-            "AI-first organization culture",
-            "Continuous AI innovation at scale",
-            "Industry-leading AI capabilities",
-            "AI drives primary value creation"
-        ],
-        "business_impact": {
-            "revenue": "50%+ revenue from AI-driven offerings",
-            "efficiency": "90%+ processes AI-optimized",
-            "innovation": "Creating new markets with AI",
-            "risk": "AI-driven risk prediction and mitigation"
-        },
-        "typical_organizations": "AI platform companies and market disruptors",
-        "time_to_next_level": "Continuous innovation required",
-        "investment_required": "€100M+ annually",
-        "key_barriers": [
-            "Maintaining innovation edge",
-            "Regulatory scrutiny",
-            "Societal impact management",
-            "Talent pipeline sustainability"
-        ],
-        "critical_success_factors": [
-            "Industry standard setting",
-            "Open innovation platforms",
-            "Responsible AI leadership",
-            "Ecosystem orchestration"
-        ],
-        "atlan_accelerators": {
-            "Platform Governance": "Enterprise-grade governance for AI platforms",
-            "Industry Benchmarking": "Set and track industry standards",
-            "Innovation Metrics": "Measure and optimize innovation velocity",
-            "Ecosystem Analytics": "Understand and optimize partner networks"
-        },
-        "color": "#ab47bc"
-    }
-}
-
-# Enhanced assessment dimensions with weights
-maturity_dimensions = {
-    "Strategy & Leadership": {
-        "weight": 0.25,
-        "questions": [
-            {
-                "text": "Do you have a formal AI strategy aligned with business objectives?",
-                "weight": 0.3,
-                "maturity_indicators": {
-                    1: "No AI strategy exists",
-                    2: "Informal AI discussions happening",
-                    3: "Formal AI strategy documented",
-                    4: "AI strategy integrated with business strategy",
-                    5: "AI-first strategic planning"
-                }
-            },
-            {
-                "text": "Is there executive sponsorship and budget allocation for AI initiatives?",
-                "weight": 0.3,
-                "maturity_indicators": {
-                    1: "No executive interest",
-                    2: "Limited sponsorship, minimal budget",
-                    3: "Strong sponsorship, dedicated budget",
-                    4: "C-level AI leadership, significant investment",
-                    5: "Board-level AI oversight, unlimited investment"
-                }
-            },
-            {
-                "text": "Do you have an AI ethics committee or governance board?",
-                "weight": 0.2,
-                "maturity_indicators": {
-                    1: "No governance structure",
-                    2: "Ad-hoc ethics discussions",
-                    3: "Formal ethics committee established",
-                    4: "Integrated governance across organization",
-                    5: "Industry-leading responsible AI practices"
-                }
-            },
-            {
-                "text": "Is AI considered in strategic business planning?",
-                "weight": 0.2,
-                "maturity_indicators": {
-                    1: "AI not considered",
-                    2: "AI mentioned in some plans",
-                    3: "AI integral to key initiatives",
-                    4: "AI drives strategic decisions",
-                    5: "Business strategy is AI strategy"
-                }
-            }
-        ]
-    },
-    "Data & Technology": {
-        "weight": 0.25,
-        "questions": [
-            {
-                "text": "Do you have high-quality, accessible data for AI initiatives?",
-                "weight": 0.3,
-                "maturity_indicators": {
-                    1: "Data silos, poor quality",
-                    2: "Some data cleanup efforts",
-                    3: "Centralized data, good quality",
-                    4: "Real-time data platform",
-                    5: "Self-optimizing data ecosystem"
-                }
-            },
-            {
-                "text": "Is your technology infrastructure AI-ready (cloud, compute, storage)?",
-                "weight": 0.25,
-                "maturity_indicators": {
-                    1: "Legacy on-premise systems",
-                    2: "Partial cloud migration",
-                    3: "Cloud-first infrastructure",
-                    4: "Elastic AI compute platform",
-                    5: "Cutting-edge AI infrastructure"
-                }
-            },
-            {
-                "text": "Do you have data governance and quality management processes?",
-                "weight": 0.25,
-                "maturity_indicators": {
-                    1: "No data governance",
-                    2: "Basic data policies",
-                    3: "Comprehensive governance framework",
-                    4: "Automated governance workflows",
-                    5: "Self-governing data systems"
-                }
-            },
-            {
-                "text": "Are ML platforms and tools standardized across the organization?",
-                "weight": 0.2,
-                "maturity_indicators": {
-                    1: "No ML tools",
-                    2: "Fragmented tool usage",
-                    3: "Standardized ML platform",
-                    4: "Integrated ML ecosystem",
-                    5: "Industry-leading ML platform"
-                }
-            }
-        ]
-    },
-    "People & Culture": {
-        "weight": 0.2,
-        "questions": [
-            {
-                "text": "Do you have dedicated AI/ML talent and teams?",
-                "weight": 0.3,
-                "maturity_indicators": {
-                    1: "No AI expertise",
-                    2: "Few AI practitioners",
-                    3: "Dedicated AI teams",
-                    4: "AI talent throughout organization",
-                    5: "World-class AI organization"
-                }
-            },
-            {
-                "text": "Is there organization-wide AI literacy and training?",
-                "weight": 0.25,
-                "maturity_indicators": {
-                    1: "No AI awareness",
-                    2: "Limited AI training",
-                    3: "Comprehensive AI education",
-                    4: "Continuous AI upskilling",
-                    5: "AI-literate entire workforce"
-                }
-            },
-            {
-                "text": "Does your culture support experimentation and innovation?",
-                "weight": 0.25,
-                "maturity_indicators": {
-                    1: "Risk-averse culture",
-                    2: "Some innovation pockets",
-                    3: "Innovation encouraged",
-                    4: "Fail-fast culture",
-                    5: "Innovation is the norm"
-                }
-            },
-            {
-                "text": "Are business and technical teams collaborating on AI projects?",
-                "weight": 0.2,
-                "maturity_indicators": {
-                    1: "Siloed departments",
-                    2: "Occasional collaboration",
-                    3: "Regular collaboration",
-                    4: "Integrated teams",
-                    5: "Seamless fusion"
-                }
-            }
-        ]
-    },
-    "Process & Governance": {
-        "weight": 0.15,
-        "questions": [
-            {
-                "text": "Do you have established AI development lifecycles and MLOps?",
-                "weight": 0.25,
-                "maturity_indicators": {
-                    1: "Ad-hoc development",
-                    2: "Basic processes",
-                    3: "Formal MLOps implemented",
-                    4: "Automated ML pipelines",
-                    5: "Self-optimizing MLOps"
-                }
-            },
-            {
-                "text": "Are AI risks systematically identified and managed?",
-                "weight": 0.25,
-                "maturity_indicators": {
-                    1: "No risk assessment",
-                    2: "Informal risk discussions",
-                    3: "Formal risk framework",
-                    4: "Proactive risk management",
-                    5: "Predictive risk systems"
-                }
-            },
-            {
-                "text": "Do you measure and monitor AI system performance?",
-                "weight": 0.25,
-                "maturity_indicators": {
-                    1: "No monitoring",
-                    2: "Basic metrics",
-                    3: "Comprehensive monitoring",
-                    4: "Real-time dashboards",
-                    5: "Self-healing systems"
-                }
-            },
-            {
-                "text": "Is there a process for AI model validation and testing?",
-                "weight": 0.25,
-                "maturity_indicators": {
-                    1: "No validation process",
-                    2: "Manual testing",
-                    3: "Automated testing suite",
-                    4: "Continuous validation",
-                    5: "Zero-trust AI systems"
-                }
-            }
-        ]
-    },
-    "Value & Innovation": {
-        "weight": 0.15,
-        "questions": [
-            {
-                "text": "Are you measuring ROI from AI initiatives?",
-                "weight": 0.25,
-                "maturity_indicators": {
-                    1: "No ROI measurement",
-                    2: "Anecdotal benefits",
-                    3: "Formal ROI tracking",
-                    4: "Real-time value monitoring",
-                    5: "AI drives P&L"
-                }
-            },
-            {
-                "text": "Do AI projects deliver tangible business value?",
-                "weight": 0.25,
-                "maturity_indicators": {
-                    1: "No clear value",
-                    2: "Some efficiency gains",
-                    3: "Significant cost savings",
-                    4: "Revenue generation",
-                    5: "Business transformation"
-                }
-            },
-            {
-                "text": "Are you using AI to create new products or services?",
-                "weight": 0.25,
-                "maturity_indicators": {
-                    1: "No AI products",
-                    2: "AI features in development",
-                    3: "AI-enhanced offerings",
-                    4: "AI-native products",
-                    5: "AI platform business"
-                }
-            },
-            {
-                "text": "Is AI driving competitive advantage for your organization?",
-                "weight": 0.25,
-                "maturity_indicators": {
-                    1: "No advantage",
-                    2: "Catching up to competitors",
-                    3: "On par with industry",
-                    4: "Leading the industry",
-                    5: "Defining the industry"
-                }
-            }
-        ]
-    }
-}
+@st.cache_resource
+def load_catalog():
+    """Build the frozen assessment catalog once per process"""
+    return build_catalog()
 
-# Enhanced EU AI Act compliance with examples and GPAI
-eu_ai_act_requirements = {
-    "Governance & Oversight": {
-        "questions": [
-            {
-                "text": "Do you have designated roles and responsibilities for AI governance?",
-                "article": "Article 26 – Obligations of users of high-risk AI systems",
-                "link": "https://artificialintelligenceact.eu/article/26/",
-                "example": "We have a Chief AI Officer, AI Ethics Committee with quarterly meetings, designated AI system owners for each deployment, and clear RACI matrix for AI decisions.",
-                "documentation": "Organizational charts, role descriptions, governance charter, meeting minutes, and decision logs.",
-                "risk_level": "high",
-                "implementation_effort": "medium"
-            },
-            {
-                "text": "Is there human oversight for high-risk AI system decision-making?",
-                "article": "Article 14 – Human oversight",
-                "link": "https://artificialintelligenceact.eu/article/14/",
-                "example": "All high-risk AI decisions require human review before execution, with kill switches, override capabilities, and mandatory human sign-off for critical decisions.",
-                "documentation": "Human oversight procedures, approval workflows, override logs, and training records.",
-                "risk_level": "critical",
-                "implementation_effort": "high"
-            },
-            {
-                "text": "Do you have processes to monitor AI system performance and accuracy?",
-                "article": "Article 26 – Obligations of users",
-                "link": "https://artificialintelligenceact.eu/article/26/",
-                "example": "We run daily accuracy checks, weekly performance reviews, monthly drift detection, with automated alerts for anomalies and dashboards showing key metrics.",
-                "documentation": "Monitoring procedures, KPI definitions, alert configurations, and performance reports.",
-                "risk_level": "high",
-                "implementation_effort": "medium"
-            },
-            {
-                "text": "Are employees trained on AI system capabilities and limitations?",
-                "article": "Article 4 – AI literacy",
-                "link": "https://artificialintelligenceact.eu/article/4/",
-                "example": "All staff complete mandatory AI literacy training, role-specific workshops for AI users, annual refreshers, and maintain >90% completion rate.",
-                "documentation": "Training curricula, attendance records, assessment results, and competency matrices.",
-                "risk_level": "medium",
-                "implementation_effort": "low"
-            },
-            {
-                "text": "Do you have incident reporting procedures for AI system failures?",
-                "article": "Article 26 – Obligations of users",
-                "link": "https://artificialintelligenceact.eu/article/26/",
-                "example": "24-hour incident hotline, standardized reporting forms, root cause analysis process, with escalation matrix and remediation tracking system.",
-                "documentation": "Incident response procedures, reporting templates, investigation reports, and corrective action logs.",
-                "risk_level": "high",
-                "implementation_effort": "medium"
-            }
-        ]
-    },
-    "Risk Management": {
-        "questions": [
-            {
-                "text": "Do you have a risk management system for AI systems?",
-                "article": "Article 9 – Risk management system",
-                "link": "https://artificialintelligenceact.eu/article/9/",
-                "example": "ISO 31000-based framework with AI-specific risk taxonomy, quarterly risk assessments, mitigation plans, and board-level risk reporting.",
-                "documentation": "Risk management framework, risk registers, assessment reports, and mitigation plans.",
-                "risk_level": "critical",
-                "implementation_effort": "high"
-            },
-            {
-                "text": "Are AI systems tested for bias and discrimination before deployment?",
-                "article": "Article 10 – Data and data governance",
-                "link": "https://artificialintelligenceact.eu/article/10/",
-                "example": "We conduct fairness audits using multiple metrics (demographic parity, equal opportunity), test on diverse datasets, and engage external auditors.",
-                "documentation": "Bias testing protocols, audit reports, test datasets specifications, and remediation records.",
-                "risk_level": "critical",
-                "implementation_effort": "high"
-            },
-            {
-                "text": "Do you conduct impact assessments for high-risk AI systems?",
-                "article": "Article 27 – Fundamental rights impact assessment",
-                "link": "https://artificialintelligenceact.eu/article/27/",
-                "example": "Full DPIA plus AI-specific assessments covering fundamental rights, using EU methodology, with stakeholder consultations and public summaries.",
-                "documentation": "Impact assessment templates, completed assessments, stakeholder feedback, and action plans.",
-                "risk_level": "high",
-                "implementation_effort": "high"
-            },
-            {
-                "text": "Are there procedures to address AI system risks to vulnerable groups?",
-                "article": "Article 9 – Risk management system",
-                "link": "https://artificialintelligenceact.eu/article/9/",
-                "example": "Special testing for elderly, children, disabled users; accessibility features; simplified interfaces; and dedicated support channels.",
-                "documentation": "Vulnerability assessment procedures, accessibility standards, user testing results, and support protocols.",
-                "risk_level": "high",
-                "implementation_effort": "medium"
-            },
-            {
-                "text": "Do you have quality management systems for AI development?",
-                "article": "Article 17 – Quality management system",
-                "link": "https://artificialintelligenceact.eu/article/17/",
-                "example": "ISO 9001 certified processes adapted for AI, including version control, peer reviews, staging environments, and automated testing pipelines.",
-                "documentation": "QMS documentation, process maps, audit reports, and continuous improvement records.",
-                "risk_level": "medium",
-                "implementation_effort": "medium"
-            }
-        ]
-    },
-    "Documentation & Transparency": {
-        "questions": [
-            {
-                "text": "Do you maintain technical documentation for AI systems?",
-                "article": "Article 11 – Technical documentation",
-                "link": "https://artificialintelligenceact.eu/article/11/",
-                "example": "Comprehensive docs including architecture diagrams, data flows, model cards, API specs, update logs, maintained in version-controlled repository.",
-                "documentation": "Technical specifications, architecture documents, data dictionaries, and API documentation.",
-                "risk_level": "high",
-                "implementation_effort": "medium"
-            },
-            {
-                "text": "Are users informed when interacting with AI systems?",
-                "article": "Article 52 – Transparency obligations",
-                "link": "https://artificialintelligenceact.eu/article/52/",
-                "example": "Clear AI disclosure badges, pop-up notifications, terms of service mentions, and opt-out options visible at all interaction points.",
-                "documentation": "Transparency notices, UI/UX guidelines, user communication templates, and consent forms.",
-                "risk_level": "medium",
-                "implementation_effort": "low"
-            },
-            {
-                "text": "Do you keep logs of AI system operations and decisions?",
-                "article": "Article 12 – Record-keeping",
-                "link": "https://artificialintelligenceact.eu/article/12/",
-                "example": "Automated logging of all AI decisions with timestamps, input data, outputs, confidence scores, retained for 5 years with secure access controls.",
-                "documentation": "Logging specifications, retention policies, access control procedures, and audit trail reports.",
-                "risk_level": "high",
-                "implementation_effort": "medium"
-            },
-            {
-                "text": "Are instructions for use provided to AI system users?",
-                "article": "Article 13 – Instructions for use",
-                "link": "https://artificialintelligenceact.eu/article/13/",
-                "example": "Multi-language user guides, video tutorials, in-app help, FAQs, covering proper use, limitations, and safety guidelines.",
-                "documentation": "User manuals, training materials, help documentation, and safety guidelines.",
-                "risk_level": "medium",
-                "implementation_effort": "low"
-            },
-            {
-                "text": "Do you maintain records of AI system modifications and updates?",
-                "article": "Article 12 – Record-keeping",
-                "link": "https://artificialintelligenceact.eu/article/12/",
-                "example": "Git-based version control, detailed changelogs, rollback procedures, with approval records for all production changes.",
-                "documentation": "Change management procedures, version histories, approval records, and rollback plans.",
-                "risk_level": "medium",
-                "implementation_effort": "low"
-            }
-        ]
-    },
-    "Data Governance": {
-        "questions": [
-            {
-                "text": "Are training datasets quality-controlled and bias-tested?",
-                "article": "Article 10 – Data and data governance",
-                "link": "https://artificialintelligenceact.eu/article/10/",
-                "example": "Multi-stage QA process: automated checks, statistical analysis, manual reviews, bias metrics, with 99.5% quality threshold before use.",
-                "documentation": "Data quality standards, QA procedures, test results, and quality metrics.",
-                "risk_level": "critical",
-                "implementation_effort": "high"
-            },
-            {
-                "text": "Do you have data lineage tracking for AI training data?",
-                "article": "Article 10 – Data and data governance",
-                "link": "https://artificialintelligenceact.eu/article/10/",
-                "example": "End-to-end lineage from source systems through transformations to model training, using automated tools with visual lineage maps.",
-                "documentation": "Data lineage tools configuration, lineage maps, data flow documentation, and source mappings.",
-                "risk_level": "high",
-                "implementation_effort": "medium"
-            },
-            {
-                "text": "Are personal data processing activities compliant with GDPR?",
-                "article": "Article 10 – Data and data governance",
-                "link": "https://artificialintelligenceact.eu/article/10/",
-                "example": "All processing has legal basis, documented in ROPA, with DPIAs completed, consent mechanisms implemented, and DPO approval obtained.",
-                "documentation": "ROPA entries, legal basis documentation, DPIAs, consent records, and DPO assessments.",
-                "risk_level": "critical",
-                "implementation_effort": "high"
-            },
-            {
-                "text": "Do you validate data quality before using for AI training?",
-                "article": "Article 10 – Data and data governance",
-                "link": "https://artificialintelligenceact.eu/article/10/",
-                "example": "Automated validation pipelines checking completeness, accuracy, consistency, with manual spot checks and domain expert reviews.",
-                "documentation": "Validation procedures, quality criteria, validation reports, and exception handling processes.",
-                "risk_level": "high",
-                "implementation_effort": "medium"
-            },
-            {
-                "text": "Are datasets representative and free from harmful biases?",
-                "article": "Article 10 – Data and data governance",
-                "link": "https://artificialintelligenceact.eu/article/10/",
-                "example": "Statistical analysis ensuring demographic representation matching target population, with external bias audits and corrective sampling.",
-                "documentation": "Representation analysis, demographic breakdowns, bias audit reports, and sampling strategies.",
-                "risk_level": "critical",
-                "implementation_effort": "high"
-            }
-        ]
-    },
-    "Compliance & Conformity": {
-        "questions": [
-            {
-                "text": "Do you have conformity assessments for high-risk AI systems?",
-                "article": "Article 43 – Conformity assessment",
-                "link": "https://artificialintelligenceact.eu/article/43/",
-                "example": "Third-party assessments following harmonized standards, internal audits, technical documentation reviews, with annual reassessments.",
-                "documentation": "Assessment reports, certificates, audit trails, and corrective action plans.",
-                "risk_level": "critical",
-                "implementation_effort": "high"
-            },
-            {
-                "text": "Are AI systems registered in the EU database when required?",
-                "article": "Article 60 – EU database for high-risk AI systems",
-                "link": "https://artificialintelligenceact.eu/article/60/",
-                "example": "All high-risk systems registered before deployment, with quarterly updates, maintaining complete records and public transparency.",
-                "documentation": "Registration confirmations, database entries, update logs, and compliance certificates.",
-                "risk_level": "high",
-                "implementation_effort": "low"
-            },
-            {
-                "text": "Do you have CE marking for applicable AI systems?",
-                "article": "Article 48 – CE marking",
-                "link": "https://artificialintelligenceact.eu/article/48/",
-                "example": "CE marks affixed following conformity assessment, with technical files maintained, DoC issued, and market surveillance cooperation.",
-                "documentation": "CE marking procedures, technical files, declarations of conformity, and test reports.",
-                "risk_level": "high",
-                "implementation_effort": "medium"
-            },
-            {
-                "text": "Are there procedures for corrective actions when non-compliance is detected?",
-                "article": "Article 21 – Corrective actions",
-                "link": "https://artificialintelligenceact.eu/article/21/",
-                "example": "24-hour response SLA, root cause analysis, corrective action plans, effectiveness verification, with board reporting for serious issues.",
-                "documentation": "Corrective action procedures, investigation reports, action plans, and effectiveness reviews.",
-                "risk_level": "medium",
-                "implementation_effort": "medium"
-            },
-            {
-                "text": "Do you have post-market monitoring systems for deployed AI?",
-                "article": "Article 26 – Obligations of users",
-                "link": "https://artificialintelligenceact.eu/article/26/",
-                "example": "Continuous performance monitoring, user feedback loops, incident tracking, with monthly reviews and proactive improvement cycles.",
-                "documentation": "Monitoring plans, performance reports, user feedback analysis, and improvement records.",
-                "risk_level": "high",
-                "implementation_effort": "medium"
-            }
-        ]
-    },
-    "General Purpose AI (GPAI)": {
-        "questions": [
-            {
-                "text": "Do you maintain comprehensive technical documentation for your GPAI model?",
-                "article": "Article 53 – Obligations for providers of GPAI models",
-                "link": "https://artificialintelligenceact.eu/article/53/",
-                "example": "500-page technical report covering architecture (transformer, 175B parameters), training (500TB data, 3 months), capabilities, limitations, and safety measures.",
-                "documentation": "Model architecture specifications, training process documentation, capability assessments, and limitation disclosures.",
-                "risk_level": "high",
-                "implementation_effort": "high"
-            },
-            {
-                "text": "Have you implemented a policy to respect copyright law in your training data?",
-                "article": "Article 53 – Obligations for providers of GPAI models",
-                "link": "https://artificialintelligenceact.eu/article/53/",
-                "example": "Automated filtering for copyrighted content, licensed dataset procurement, opt-out portal for creators, with quarterly legal reviews.",
-                "documentation": "Copyright compliance policy, data filtering procedures, licensing agreements, and opt-out mechanisms.",
-                "risk_level": "critical",
-                "implementation_effort": "high"
-            },
-            {
-                "text": "Do you provide adequate information to downstream providers?",
-                "article": "Article 53 – Obligations for providers of GPAI models",
-                "link": "https://artificialintelligenceact.eu/article/53/",
-                "example": "Comprehensive API documentation, model cards, integration guides, safety guidelines, usage restrictions, and support channels.",
-                "documentation": "API documentation, model cards, safety guidelines, usage policies, and technical support materials.",
-                "risk_level": "medium",
-                "implementation_effort": "medium"
-            },
-            {
-                "text": "Have you conducted systemic risk assessments for models with systemic risk?",
-                "article": "Article 55 – Obligations for GPAI models with systemic risk",
-                "link": "https://artificialintelligenceact.eu/article/55/",
-                "example": "Red team exercises for misuse potential, bias audits across demographics, safety evaluations for harmful content generation.",
-                "documentation": "Risk assessment reports, red team findings, mitigation strategies, and monitoring plans.",
-                "risk_level": "critical",
-                "implementation_effort": "high"
-            },
-            {
-                "text": "Do you have measures to mitigate systemic risks?",
-                "article": "Article 55 – Obligations for GPAI models with systemic risk",
-                "link": "https://artificialintelligenceact.eu/article/55/",
-                "example": "Content filters, use case restrictions, rate limiting, continuous monitoring, incident response team, and regular safety updates.",
-                "documentation": "Mitigation measures documentation, incident response plans, monitoring dashboards, and update logs.",
-                "risk_level": "critical",
-                "implementation_effort": "high"
-            }
-        ]
-    }
-}
+catalog = load_catalog()
+gartner_maturity_levels = catalog['gartner_maturity_levels']
+maturity_dimensions = catalog['maturity_dimensions']
+industry_benchmarks = catalog['industry_benchmarks']
 
-# Industry benchmarks with more detail
-industry_benchmarks = {
-    "Technology": {
-        "average": 3.2,
-        "leaders": ["Google", "Microsoft", "Amazon"],
-        "typical_challenges": "Talent retention, ethical AI at scale",
-        "investment_range": "5-15% of revenue"
-    },
-    "Financial Services": {
-        "average": 3.0,
-        "leaders": ["JPMorgan", "Goldman Sachs", "Ant Financial"],
-        "typical_challenges": "Regulatory compliance, legacy systems",
-        "investment_range": "2-8% of revenue"
-    },
-    "Healthcare": {
-        "average": 2.5,
-        "leaders": ["Mayo Clinic", "Kaiser Permanente"],
-        "typical_challenges": "Data privacy, clinical validation",
-        "investment_range": "1-5% of revenue"
-    },
-    "Manufacturing": {
-        "average": 2.3,
-        "leaders": ["Siemens", "GE", "Bosch"],
-        "typical_challenges": "IoT integration, workforce upskilling",
-        "investment_range": "1-4% of revenue"
-    },
-    "Retail": {
-        "average": 2.4,
-        "leaders": ["Amazon", "Alibaba", "Walmart"],
-        "typical_challenges": "Omnichannel integration, personalization",
-        "investment_range": "2-6% of revenue"
-    },
-    "Government": {
-        "average": 1.8,
-        "leaders": ["Singapore", "Estonia", "UK"],
-        "typical_challenges": "Procurement, citizen trust",
-        "investment_range": "0.5-2% of budget"
-    },
-    "Education": {
-        "average": 2.2,
-        "leaders": ["ASU", "Georgia Tech"],
-        "typical_challenges": "Budget constraints, change management",
-        "investment_range": "0.5-3% of budget"
-    },
-    "Energy": {
-        "average": 2.5,
-        "leaders": ["Shell", "BP", "Equinor"],
-        "typical_challenges": "Safety requirements, field deployment",
-        "investment_range": "1-5% of revenue"
-    },
-    "Other": {
-        "average": 2.5,
-        "leaders": ["Industry varies"],
-        "typical_challenges": "Varies by sector",
-        "investment_range": "1-5% of revenue"
-    }
-}
+# EU AI Act compliance questions with examples and GPAI
+eu_ai_act_requirements = combined_requirements()
 
 # Custom CSS for professional styling
 st.markdown("""
@@ -1431,6 +642,8 @@ elif st.session_state.current_page == 'compliance_assessment':
 
 # Results page
 elif st.session_state.current_page == 'results':
+    # Opt-in render profiling (APP_PROFILE=1, or ?profile=1 where the server allows it): sidebar waterfall
+    profiler = RenderProfiler('combined-ai-maturity-tool/results')
     org_name = st.session_state.org_info.get('name', 'Your Organization')
     st.markdown(f"## 📊 Assessment Report - {org_name}")
     st.markdown(f"**Generated:** {datetime.now().strftime('%B %d, %Y')}")
@@ -1447,7 +660,7 @@ elif st.session_state.current_page == 'results':
     
     # Maturity Results Tab
     if tab1 and st.session_state.assessment_type in ['maturity', 'combined']:
-        with tab1:
+        with tab1, profiler.block('maturity tab'):
             # Calculate overall maturity
             dimension_scores = st.session_state.get('maturity_scores', {})
             
@@ -1510,7 +723,7 @@ elif st.session_state.current_page == 'results':
             
             col1, col2 = st.columns([2, 1])
             
-            with col1:
+            with col1, profiler.block('dimension radar chart'):
                 # Create radar chart
                 categories = list(dimension_scores.keys())
                 values = [data['score'] for data in dimension_scores.values()]
@@ -1590,7 +803,7 @@ elif st.session_state.current_page == 'results':
             
             col1, col2 = st.columns([3, 1])
             
-            with col1:
+            with col1, profiler.block('industry benchmark chart'):
                 # Create industry comparison chart
                 industries = list(industry_benchmarks.keys())
                 averages = [industry_benchmarks[ind]['average'] for ind in industries]
@@ -1693,16 +906,17 @@ elif st.session_state.current_page == 'results':
     
     # Compliance Results Tab
     if tab2 and st.session_state.assessment_type in ['compliance', 'combined']:
-        with tab2:
+        with tab2, profiler.block('compliance tab'):
             compliance_answers = st.session_state.get('compliance_answers', {})
             
             # Calculate compliance scores
-            total_questions = len(compliance_answers)
-            fully_compliant = sum(1 for a in compliance_answers.values() if "Yes" in a['answer'])
-            partial_compliant = sum(1 for a in compliance_answers.values() if "Partial" in a['answer'])
-            non_compliant = sum(1 for a in compliance_answers.values() if "No" in a['answer'])
+            with profiler.block('compliance scoring'):
+                total_questions = len(compliance_answers)
+                fully_compliant = sum(1 for a in compliance_answers.values() if "Yes" in a['answer'])
+                partial_compliant = sum(1 for a in compliance_answers.values() if "Partial" in a['answer'])
+                non_compliant = sum(1 for a in compliance_answers.values() if "No" in a['answer'])
             
-            overall_compliance = (fully_compliant * 100 + partial_compliant * 50) / total_questions
+                overall_compliance = (fully_compliant * 100 + partial_compliant * 50) / total_questions
             
             # Compliance metrics
             col1, col2, col3, col4 = st.columns(4)
@@ -1735,99 +949,101 @@ elif st.session_state.current_page == 'results':
             st.markdown("### 📊 Compliance by EU AI Act Article")
             
             # Analyze compliance by article
-            article_compliance = {}
+            with profiler.block('article scoring'):
+                article_compliance = {}
             
-            for key, answer in compliance_answers.items():
-                article = answer['article'].split(' – ')[0]  # Extract article number
+                for key, answer in compliance_answers.items():
+                    article = answer['article'].split(' – ')[0]  # Extract article number
                 
-                if article not in article_compliance:
-                    article_compliance[article] = {
-                        'yes': 0,
-                        'partial': 0,
-                        'no': 0,
-                        'total': 0,
-                        'questions': []
-                    }
+                    if article not in article_compliance:
+                        article_compliance[article] = {
+                            'yes': 0,
+                            'partial': 0,
+                            'no': 0,
+                            'total': 0,
+                            'questions': []
+                        }
                 
-                article_compliance[article]['total'] += 1
-                article_compliance[article]['questions'].append(answer['question'])
+                    article_compliance[article]['total'] += 1
+                    article_compliance[article]['questions'].append(answer['question'])
                 
-                if "Yes" in answer['answer']:
-                    article_compliance[article]['yes'] += 1
-                elif "Partial" in answer['answer']:
-                    article_compliance[article]['partial'] += 1
-                else:
-                    article_compliance[article]['no'] += 1
-            
-            # Calculate compliance score per article
-            article_scores = {}
-            for article, data in article_compliance.items():
-                score = (data['yes'] * 100 + data['partial'] * 50) / data['total']
-                article_scores[article] = {
-                    'score': score,
-                    'data': data
-                }
+                    if "Yes" in answer['answer']:
+                        article_compliance[article]['yes'] += 1
+                    elif "Partial" in answer['answer']:
+                        article_compliance[article]['partial'] += 1
+                    else:
+                        article_compliance[article]['no'] += 1
+            
+                # Calculate compliance score per article
+                article_scores = {}
+                for article, data in article_compliance.items():
+                    score = (data['yes'] * 100 + data['partial'] * 50) / data['total']
+                    article_scores[article] = {
+                        'score': score,
+                        'data': data
+                    }
             
-            # Sort articles by number
-            sorted_articles = sorted(article_scores.items(), 
-                                   key=lambda x: int(''.join(filter(str.isdigit, x[0])) or '0'))
+                # Sort articles by number
+                sorted_articles = sorted(article_scores.items(), 
+                                       key=lambda x: int(''.join(filter(str.isdigit, x[0])) or '0'))
             
             # Create article compliance visualization
-            articles = [item[0] for item in sorted_articles]
-            scores = [item[1]['score'] for item in sorted_articles]
-            
-            # Color based on compliance level
-            colors = []
-            for score in scores:
-                if score >= 80:
-                    colors.append('#28a745')  # Green
-                elif score >= 60:
-                    colors.append('#ffc107')  # Yellow
-                else:
-                    colors.append('#dc3545')  # Red
-            
-            fig = go.Figure()
-            
-            # Add bars
-            fig.add_trace(go.Bar(
-                x=articles,
-                y=scores,
-                marker_color=colors,
-                text=[f"{s:.0f}%" for s in scores],
-                textposition='outside',
-                hovertemplate='%{x}<br>Compliance: %{y:.0f}%<br>%{customdata}<extra></extra>',
-                customdata=[f"Questions: {article_scores[art]['data']['total']}" for art in articles]
-            ))
-            
-            # Add target line at 80%
-            fig.add_shape(
-                type="line",
-                x0=-0.5, x1=len(articles)-0.5,
-                y0=80, y1=80,
-                line=dict(color="#28a745", width=2, dash="dash"),
-            )
+            with profiler.block('article chart'):
+                articles = [item[0] for item in sorted_articles]
+                scores = [item[1]['score'] for item in sorted_articles]
             
-            fig.add_annotation(
-                x=len(articles)-1,
-                y=80,
-                text="Target: 80%",
-                showarrow=False,
-                bgcolor="#28a745",
-                font=dict(color="white", size=10),
-                xanchor="right"
-            )
+                # Color based on compliance level
+                colors = []
+                for score in scores:
+                    if score >= 80:
+                        colors.append('#28a745')  # Green
+                    elif score >= 60:
+                        colors.append('#ffc107')  # Yellow
+                    else:
+                        colors.append('#dc3545')  # Red
             
-            fig.update_layout(
-                title="EU AI Act Compliance by Article",
-                xaxis_title="Article",
-                yaxis_title="Compliance Score (%)",
-                yaxis=dict(range=[0, 110]),
-                xaxis_tickangle=-45,
-                height=500,
-                showlegend=False
-            )
+                fig = go.Figure()
+            
+                # Add bars
+                fig.add_trace(go.Bar(
+                    x=articles,
+                    y=scores,
+                    marker_color=colors,
+                    text=[f"{s:.0f}%" for s in scores],
+                    textposition='outside',
+                    hovertemplate='%{x}<br>Compliance: %{y:.0f}%<br>%{customdata}<extra></extra>',
+                    customdata=[f"Questions: {article_scores[art]['data']['total']}" for art in articles]
+                ))
+            
+                # Add target line at 80%
+                fig.add_shape(
+                    type="line",
+                    x0=-0.5, x1=len(articles)-0.5,
+                    y0=80, y1=80,
+                    line=dict(color="#28a745", width=2, dash="dash"),
+                )
+            
+                fig.add_annotation(
+                    x=len(articles)-1,
+                    y=80,
+                    text="Target: 80%",
+                    showarrow=False,
+                    bgcolor="#28a745",
+                    font=dict(color="white", size=10),
+                    xanchor="right"
+                )
             
-            st.plotly_chart(fig, use_container_width=True)
+                fig.update_layout(
+                    title="EU AI Act Compliance by Article",
+                    xaxis_title="Article",
+                    yaxis_title="Compliance Score (%)",
+                    yaxis=dict(range=[0, 110]),
+                    xaxis_tickangle=-45,
+                    height=500,
+                    showlegend=False
+                )
+            
+                st.plotly_chart(fig, use_container_width=True)
             
             # Article details expandable section
             with st.expander("📋 Detailed Article Compliance Breakdown"):
@@ -1871,47 +1087,48 @@ elif st.session_state.current_page == 'results':
             st.markdown("### 📊 Compliance by Category")
             
             # Calculate category scores
-            category_scores = {}
-            for cat_name in eu_ai_act_requirements.keys():
-                cat_answers = {k: v for k, v in compliance_answers.items() if k.startswith(cat_name)}
-                if cat_answers:
-                    yes = sum(1 for a in cat_answers.values() if "Yes" in a['answer'])
-                    partial = sum(1 for a in cat_answers.values() if "Partial" in a['answer'])
-                    no = sum(1 for a in cat_answers.values() if "No" in a['answer'])
-                    total = len(cat_answers)
-                    score = (yes * 100 + partial * 50) / total
-                    category_scores[cat_name] = {
-                        'score': score,
-                        'yes': yes,
-                        'partial': partial,
-                        'no': no,
-                        'total': total
-                    }
+            with profiler.block('category scoring and chart'):
+                category_scores = {}
+                for cat_name in eu_ai_act_requirements.keys():
+                    cat_answers = {k: v for k, v in compliance_answers.items() if k.startswith(cat_name)}
+                    if cat_answers:
+                        yes = sum(1 for a in cat_answers.values() if "Yes" in a['answer'])
+                        partial = sum(1 for a in cat_answers.values() if "Partial" in a['answer'])
+                        no = sum(1 for a in cat_answers.values() if "No" in a['answer'])
+                        total = len(cat_answers)
+                        score = (yes * 100 + partial * 50) / total
+                        category_scores[cat_name] = {
+                            'score': score,
+                            'yes': yes,
+                            'partial': partial,
+                            'no': no,
+                            'total': total
+                        }
+            
+                # Create category chart
+                categories = list(category_scores.keys())
+                scores = [category_scores[cat]['score'] for cat in categories]
+                colors = ['#28a745' if s >= 80 else '#ffc107' if s >= 60 else '#dc3545' for s in scores]
             
-            # Create category chart
-            categories = list(category_scores.keys())
-            scores = [category_scores[cat]['score'] for cat in categories]
-            colors = ['#28a745' if s >= 80 else '#ffc107' if s >= 60 else '#dc3545' for s in scores]
-            
-            fig = go.Figure()
-            
-            fig.add_trace(go.Bar(
-                x=categories,
-                y=scores,
-                marker_color=colors,
-                text=[f"{s:.0f}%" for s in scores],
-                textposition='outside'
-            ))
-            
-            fig.update_layout(
-                title="EU AI Act Compliance by Category",
-                yaxis_title="Compliance Score (%)",
-                yaxis=dict(range=[0, 110]),
-                xaxis_tickangle=-45,
-                height=400
-            )
+                fig = go.Figure()
             
-            st.plotly_chart(fig, use_container_width=True)
+                fig.add_trace(go.Bar(
+                    x=categories,
+                    y=scores,
+                    marker_color=colors,
+                    text=[f"{s:.0f}%" for s in scores],
+                    textposition='outside'
+                ))
+            
+                fig.update_layout(
+                    title="EU AI Act Compliance by Category",
+                    yaxis_title="Compliance Score (%)",
+                    yaxis=dict(range=[0, 110]),
+                    xaxis_tickangle=-45,
+                    height=400
+                )
+            
+                st.plotly_chart(fig, use_container_width=True)
             
             # GPAI-specific compliance summary (if applicable)
             if "General Purpose AI (GPAI)" in category_scores:
@@ -2112,7 +1329,7 @@ elif st.session_state.current_page == 'results':
     
     # Roadmap Tab
     if tab3:
-        with tab3:
+        with tab3, profiler.block('roadmap tab'):
             st.markdown("### 🎯 Your Personalized AI & Compliance Roadmap")
             
             # Generate integrated roadmap based on both assessments
@@ -2271,7 +1488,7 @@ elif st.session_state.current_page == 'results':
     
     # Executive Summary Tab (for combined assessment)
     if tab4 and st.session_state.assessment_type == 'combined':
-        with tab4:
+        with tab4, profiler.block('executive summary tab'):
             st.markdown("### 📋 Executive Summary")
             
             # Key findings
@@ -2400,6 +1617,9 @@ elif st.session_state.current_page == 'results':
     st.markdown("---")
     col1, col2, col3, col4 = st.columns(4)
     
+    # The waterfall is drawn before the buttons, which may stop the run with st.rerun()
+    profiler.finish()
+    
     with col1:
         if st.button("📧 Email Report", use_container_width=True):
             st.success("✅ Report sent to your email")
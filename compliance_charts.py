@@ -0,0 +1,38 @@
+from io import BytesIO
+
+from matplotlib.figure import Figure
+
+ARTICLE_CHART_SIZE = (12, 8)
+ARTICLE_CHART_DPI = 150
+
+
+def compliance_color(pct):
+    """Traffic-light bar colour for a compliance percentage"""
+    if pct >= 80:
+        return '#2E8B57'
+    if pct >= 50:
+        return '#FFB347'
+    return '#FF6B6B'
+
+
+def article_chart_png(labels, values, dpi=ARTICLE_CHART_DPI):
+    """Render the article compliance bar chart to PNG bytes and release the figure"""
+    # A bare Figure is never registered with pyplot, so nothing keeps it alive after this call
+    fig = Figure(figsize=ARTICLE_CHART_SIZE)
+    try:
+        ax = fig.subplots()
+        bars = ax.barh(labels, values, color=[compliance_color(value) for value in values])
+        ax.set_xlabel("Compliance Percentage")
+        ax.set_title("EU AI Act Article Compliance Status")
+        ax.set_xlim(0, 100)
+
+        for bar, value in zip(bars, values):
+            ax.text(bar.get_width() + 1, bar.get_y() + bar.get_height()/2,
+                    f'{value}%', ha='left', va='center', fontweight='bold')
+
+        fig.tight_layout()
+        buffer = BytesIO()
+        fig.savefig(buffer, format='png', dpi=dpi)
+        return buffer.getvalue()
+    finally:
+        fig.clear()
@@ -0,0 +1,385 @@
+import argparse
+import json
+import os
+import re
+import sys
+from datetime import datetime
+from html import escape
+from string import Template
+
+from compliance_scoring import score_compliance
+from compliance_store import answer_frame, encode_answers
+
+ROLE_DISPLAY = {
+    "provider": "AI Provider",
+    "deployer": "AI Deployer",
+    "both": "Both Provider and Deployer"
+}
+STATUS_CLASSES = {
+    "Yes - Fully Compliant": "status-compliant",
+    "Partial - In Progress": "status-partial",
+    "No - Not Compliant": "status-non-compliant",
+    "N/A - Not Applicable": "status-na"
+}
+
+REPORT_STYLE = """
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
+            line-height: 1.6;
+            color: #333;
+            margin: 0;
+            padding: 20px;
+            background: #f5f5f5;
+        }
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+            background: white;
+            padding: 40px;
+            box-shadow: 0 0 20px rgba(0,0,0,0.1);
+            border-radius: 10px;
+        }
+        h1 {
+            color: #1e3c72;
+            border-bottom: 3px solid #1e3c72;
+            padding-bottom: 10px;
+        }
+        h2 {
+            color: #2a5298;
+            margin-top: 30px;
+        }
+        h3 {
+            color: #333;
+            margin-top: 20px;
+        }
+        .header {
+            background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%);
+            color: white;
+            padding: 30px;
+            border-radius: 10px;
+            margin-bottom: 30px;
+        }
+        .metrics {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 20px;
+            margin: 20px 0;
+        }
+        .metric {
+            background: #f8f9fa;
+            padding: 20px;
+            border-radius: 8px;
+            text-align: center;
+            border-left: 4px solid #2a5298;
+        }
+        .metric-value {
+            font-size: 2em;
+            font-weight: bold;
+            color: #1e3c72;
+        }
+        .metric-label {
+            color: #666;
+            margin-top: 5px;
+        }
+        .status-badge {
+            display: inline-block;
+            padding: 5px 15px;
+            border-radius: 20px;
+            font-weight: bold;
+            margin: 5px;
+        }
+        .status-compliant {
+            background: #d4edda;
+            color: #155724;
+        }
+        .status-partial {
+            background: #fff3cd;
+            color: #856404;
+        }
+        .status-non-compliant {
+            background: #f8d7da;
+            color: #721c24;
+        }
+        .status-na {
+            background: #e7e7e7;
+            color: #666;
+        }
+        table {
+            width: 100%;
+            border-collapse: collapse;
+            margin: 20px 0;
+        }
+        th {
+            background: #f8f9fa;
+            color: #333;
+            padding: 12px;
+            text-align: left;
+            border-bottom: 2px solid #dee2e6;
+        }
+        td {
+            padding: 12px;
+            border-bottom: 1px solid #dee2e6;
+        }
+        .risk-critical {
+            color: #dc3545;
+            font-weight: bold;
+        }
+        .risk-high {
+            color: #fd7e14;
+            font-weight: bold;
+        }
+        .risk-medium {
+            color: #ffc107;
+            font-weight: bold;
+        }
+        .risk-low {
+            color: #28a745;
+            font-weight: bold;
+        }
+        .section {
+            margin: 30px 0;
+            padding: 20px;
+            background: #f8f9fa;
+            border-radius: 8px;
+        }
+        .footer {
+            margin-top: 50px;
+            padding-top: 20px;
+            border-top: 1px solid #dee2e6;
+            color: #666;
+            text-align: center;
+        }
+        @media print {
+            body {
+                background: white;
+            }
+            .container {
+                box-shadow: none;
+                padding: 20px;
+            }
+        }
+"""
+
+REPORT_HEAD = Template("""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>EU AI Act Compliance Report - $org_name</title>
+    <style>$style    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>EU AI Act Compliance Assessment Report</h1>
+            <p style="font-size: 1.2em;">$org_name</p>
+            <p>Generated: $generated</p>
+        </div>
+
+        <div class="section">
+            <h2>Executive Summary</h2>
+            <div class="metrics">
+                <div class="metric">
+                    <div class="metric-value">$overall_compliance%</div>
+                    <div class="metric-label">Overall Compliance</div>
+                </div>
+                <div class="metric">
+                    <div class="metric-value">$applicable_questions</div>
+                    <div class="metric-label">Applicable Questions</div>
+                </div>
+                <div class="metric">
+                    <div class="metric-value">$fully_compliant</div>
+                    <div class="metric-label">Fully Compliant</div>
+                </div>
+                <div class="metric">
+                    <div class="metric-value">$non_compliant</div>
+                    <div class="metric-label">Non-Compliant</div>
+                </div>
+            </div>
+
+            <h3>Organization Profile</h3>
+            <table>
+                <tr><td><strong>Organization:</strong></td><td>$name</td></tr>
+                <tr><td><strong>Industry:</strong></td><td>$industry</td></tr>
+                <tr><td><strong>Size:</strong></td><td>$size</td></tr>
+                <tr><td><strong>AI Role:</strong></td><td>$role</td></tr>
+                <tr><td><strong>EU Operations:</strong></td><td>$eu_operations</td></tr>
+                <tr><td><strong>Current AI State:</strong></td><td>$ai_state</td></tr>
+            </table>
+        </div>
+
+        <div class="section">
+            <h2>Compliance by Section</h2>
+            <table>
+                <thead>
+                    <tr>
+                        <th>Section</th>
+                        <th>Score</th>
+                        <th>Applicable</th>
+                        <th>Compliant</th>
+                        <th>Partial</th>
+                        <th>Non-Compliant</th>
+                        <th>N/A</th>
+                    </tr>
+                </thead>
+                <tbody>
+""")
+
+SECTION_ROW = Template("""                    <tr>
+                        <td>$section</td>
+                        <td><strong>$raw_score%</strong></td>
+                        <td>$applicable_questions/$total_questions</td>
+                        <td>$yes_count</td>
+                        <td>$partial_count</td>
+                        <td>$no_count</td>
+                        <td>$na_count</td>
+                    </tr>
+""")
+
+DETAIL_HEAD = """                </tbody>
+            </table>
+        </div>
+
+        <div class="section">
+            <h2>Detailed Assessment Results</h2>
+            <table>
+                <thead>
+                    <tr>
+                        <th>Question</th>
+                        <th>Article</th>
+                        <th>Status</th>
+                        <th>Risk Level</th>
+                        <th>Implementation Effort</th>
+                    </tr>
+                </thead>
+                <tbody>
+"""
+
+DETAIL_ROW = Template("""                    <tr>
+                        <td>$question...</td>
+                        <td>$article</td>
+                        <td><span class="status-badge $status_class">$status</span></td>
+                        <td class="risk-$risk_level">$risk_label</td>
+                        <td>$effort</td>
+                    </tr>
+""")
+
+REPORT_FOOT = Template("""                </tbody>
+            </table>
+        </div>
+
+        <div class="footer">
+            <p>This report is generated based on the EU AI Act compliance assessment completed on $generated.</p>
+            <p>For the latest requirements and guidance, please refer to the official EU AI Act documentation.</p>
+        </div>
+    </div>
+</body>
+</html>
+""")
+
+
+def validate_assessment(assessment):
+    """Org info and AI role of a saved assessment, or a ValueError naming what is wrong with it"""
+    if not isinstance(assessment, dict):
+        raise ValueError("assessment must be an object")
+    org_info = assessment.get('org_info') or {}
+    if not isinstance(org_info, dict):
+        raise ValueError("org_info must be an object")
+    ai_role = assessment.get('ai_role') or 'both'
+    if ai_role not in ROLE_DISPLAY:
+        raise ValueError(f"unknown ai_role {ai_role!r}; expected one of {', '.join(ROLE_DISPLAY)}")
+    if not isinstance(assessment.get('answers'), (list, dict)):
+        raise ValueError("answers must be a list or an object keyed by question text")
+    return org_info, ai_role
+
+
+def iter_html_report(org_info, answers, ai_role, compliance_scores, generated=None):
+    """Yield the HTML report chunk by chunk: header, one table row at a time, footer"""
+    generated = (generated or datetime.now()).strftime('%B %d, %Y')
+    overall = compliance_scores['overall']
+
+    yield REPORT_HEAD.substitute(
+        style=REPORT_STYLE,
+        org_name=escape(str(org_info.get('name', 'Organization'))),
+        generated=generated,
+        overall_compliance=f"{overall['overall_compliance']:.0f}",
+        applicable_questions=overall['applicable_questions'],
+        fully_compliant=overall['fully_compliant'],
+        non_compliant=overall['non_compliant'],
+        role=escape(ROLE_DISPLAY[ai_role]),
+        **{field: escape(str(org_info.get(field, 'N/A')))
+           for field in ['name', 'industry', 'size', 'eu_operations', 'ai_state']}
+    )
+
+    for section_name, data in compliance_scores['sections'].items():
+        if data['total_questions'] > 0:
+            yield SECTION_ROW.substitute(data, section=escape(section_name), raw_score=f"{data['raw_score']:.0f}")
+
+    yield DETAIL_HEAD
+
+    # Every catalog field is escaped: the CLI and bulk runs render catalogs and answers from user files
+    for answer, question, article, risk_level, effort in zip(
+            answers['answer'], answers['question'], answers['article'],
+            answers['risk_level'], answers['implementation_effort']):
+        risk_level = str(risk_level)
+        yield DETAIL_ROW.substitute(
+            question=escape(str(question)[:100]),
+            article=escape(str(article)),
+            status_class=STATUS_CLASSES.get(answer, ''),
+            status=escape(str(answer).split(' - ')[-1]),
+            risk_level=escape(risk_level),
+            risk_label=escape(risk_level.upper()),
+            effort=escape(str(effort).upper())
+        )
+
+    yield REPORT_FOOT.substitute(generated=generated)
+
+
+def render_html_report(org_info, answers, ai_role, compliance_scores, generated=None):
+    """Join the streamed report into a single string"""
+    return ''.join(iter_html_report(org_info, answers, ai_role, compliance_scores, generated))
+
+
+def write_html_report(stream, org_info, answers, ai_role, compliance_scores, generated=None):
+    """Stream the report into an open text file without materialising it"""
+    for chunk in iter_html_report(org_info, answers, ai_role, compliance_scores, generated):
+        stream.write(chunk)
+
+
+def report_filename(org_name, generated=None, extension='html'):
+    """Download file name used by the apps and the CLI, safe for any file system"""
+    org_name = re.sub(r'[^\w.-]+', '_', str(org_name)).strip('_') or 'Organization'
+    return f"EU_AI_Act_Compliance_Report_{org_name}_{(generated or datetime.now()).strftime('%Y%m%d')}.{extension}"
+
+
+def main(argv=None):
+    """Render HTML reports for saved assessments given as JSON files"""
+    from assessment_catalog import build_catalog
+
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument('assessments', nargs='+',
+                        help="JSON files with org_info, ai_role and answers (a list aligned with the "
+                             "catalog or an object keyed by question text)")
+    parser.add_argument('--output-dir', default='.', help="Directory the reports are written to")
+    args = parser.parse_args(argv)
+
+    questions = build_catalog()['question_table']
+    os.makedirs(args.output_dir, exist_ok=True)
+    for path in args.assessments:
+        with open(path, encoding='utf-8') as handle:
+            assessment = json.load(handle)
+        try:
+            org_info, ai_role = validate_assessment(assessment)
+            codes = encode_answers(questions, assessment['answers'])
+        except ValueError as error:
+            print(f"{path}: skipped, {error}", file=sys.stderr)
+            continue
+        output = os.path.join(args.output_dir, report_filename(org_info.get('name', 'Organization')))
+        with open(output, 'w', encoding='utf-8') as stream:
+            write_html_report(stream, org_info, answer_frame(questions, codes),
+                              ai_role, score_compliance(questions, codes))
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
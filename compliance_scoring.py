@@ -0,0 +1,140 @@
+import numpy as np
+import pandas as pd
+
+ANSWER_YES = "Yes - Fully Compliant"
+ANSWER_PARTIAL = "Partial - In Progress"
+ANSWER_NO = "No - Not Compliant"
+ANSWER_NA = "N/A - Not Applicable"
+# Position in this list is the answer code stored per question
+ANSWER_OPTIONS = [ANSWER_YES, ANSWER_PARTIAL, ANSWER_NO, ANSWER_NA]
+
+# Section weights based on criticality
+SECTION_WEIGHTS = {
+    "Role Identification": 0.05,
+    "AI System Classification & Risk Assessment": 0.15,
+    "Prohibited AI Practices": 0.20,
+    "High-Risk AI System Requirements": 0.15,
+    "Provider Obligations - Design & Development": 0.10,
+    "Provider Obligations - Market Placement & Post-Market": 0.10,
+    "Deployer Obligations - Pre-Deployment Assessment": 0.08,
+    "Deployer Obligations - Operational Management": 0.07,
+    "Shared Obligations - Governance & Risk Management": 0.05,
+    "Shared Obligations - Data & Transparency": 0.03,
+    "General Purpose AI (GPAI) - Enhanced Coverage": 0.02,
+    "Cross-Border & Regulatory Interaction": 0.01
+}
+DEFAULT_SECTION_WEIGHT = 0.01
+
+RISK_LEVELS = ['critical', 'high', 'medium', 'low']
+OBLIGATION_TYPES = ['provider', 'deployer', 'shared']
+
+GAP_STATUS = {ANSWER_NO: 'Non-compliant', ANSWER_PARTIAL: 'Partial compliance'}
+GAP_CODES = [ANSWER_OPTIONS.index(answer) for answer in GAP_STATUS]
+GAP_RISK_LEVELS = ['critical', 'high', 'medium']
+
+ARTICLE_COLUMNS = ['Article', 'Questions', 'Compliant', 'Partial', 'Non-Compliant', 'N/A', 'Compliance %']
+
+
+def obligation_type(applicable_to):
+    """Map a question's applicable_to list onto provider, deployer or shared"""
+    applicable_to = tuple(applicable_to)
+    if applicable_to == ('provider',):
+        return 'provider'
+    if applicable_to == ('deployer',):
+        return 'deployer'
+    return 'shared'
+
+
+def compliance_percentage(yes, partial, applicable):
+    """Score answers as 100 for Yes and 50 for Partial; all-N/A counts as compliant"""
+    if applicable > 0:
+        return (yes * 100 + partial * 50) / applicable
+    return 100
+
+
+def score_compliance(questions, codes):
+    """Compute section, obligation, gap, article and overall aggregates as vectorized group-bys"""
+    rows = np.flatnonzero(codes >= 0)
+    answers = codes[rows].astype(np.intp)
+
+    def tally(column):
+        # One bincount over (category, answer) pairs yields every counter of the group-by at once
+        categories = questions[column].cat.categories
+        groups = questions[column].cat.codes.to_numpy()[rows].astype(np.intp)
+        counts = np.bincount(groups * len(ANSWER_OPTIONS) + answers,
+                             minlength=len(categories) * len(ANSWER_OPTIONS))
+        return categories, counts.reshape(len(categories), len(ANSWER_OPTIONS)).tolist()
+
+    section_scores = {}
+    for section_name, (yes, partial, no, na) in zip(*tally('section')):
+        total = yes + partial + no + na
+        if total == 0:
+            continue
+        raw_score = compliance_percentage(yes, partial, total - na)
+        section_scores[section_name] = {
+            'total_questions': total,
+            'yes_count': yes,
+            'partial_count': partial,
+            'no_count': no,
+            'na_count': na,
+            'applicable_questions': total - na,
+            'weighted_score': raw_score * SECTION_WEIGHTS.get(section_name, DEFAULT_SECTION_WEIGHT),
+            'raw_score': raw_score
+        }
+
+    obligation_scores = {}
+    for obligation, (yes, partial, no, na) in zip(*tally('obligation')):
+        total = yes + partial + no + na
+        obligation_scores[obligation] = {
+            'total': total, 'yes': yes, 'partial': partial, 'no': no, 'na': na,
+            'applicable_questions': total - na,
+            'compliance_score': compliance_percentage(yes, partial, total - na)
+        }
+
+    article_rows = []
+    for article, (yes, partial, no, na) in zip(*tally('article')):
+        total = yes + partial + no + na
+        if total:
+            article_rows.append({
+                'Article': article, 'Questions': total, 'Compliant': yes, 'Partial': partial,
+                'Non-Compliant': no, 'N/A': na,
+                'Compliance %': compliance_percentage(yes, partial, total - na)
+            })
+    article_scores = pd.DataFrame(article_rows, columns=ARTICLE_COLUMNS)
+
+    # N/A answers are never gaps; No and Partial answers are, bucketed by risk
+    gap_rows = rows[np.isin(answers, GAP_CODES)]
+    gaps = {}
+    for risk in GAP_RISK_LEVELS:
+        selected = questions.iloc[gap_rows[(questions['risk_level'].to_numpy()[gap_rows] == risk)]]
+        gaps[risk] = [{
+            'question': question,
+            'article': article,
+            'risk': risk,
+            'effort': effort,
+            'status': GAP_STATUS[ANSWER_OPTIONS[codes[row]]],
+            'applicable_to': applicable_to,
+            'section': section
+        } for row, question, article, effort, applicable_to, section in zip(
+            selected.index, selected['question'], selected['article'], selected['implementation_effort'],
+            selected['applicable_to'], selected['section'])]
+
+    yes, partial, no, na = np.bincount(answers, minlength=len(ANSWER_OPTIONS)).tolist()
+    total_questions = len(rows)
+    applicable_questions = total_questions - na
+
+    return {
+        'sections': section_scores,
+        'obligations': obligation_scores,
+        'gaps': gaps,
+        'articles': article_scores,
+        'overall': {
+            'total_questions': total_questions,
+            'fully_compliant': yes,
+            'partial_compliant': partial,
+            'non_compliant': no,
+            'not_applicable': na,
+            'applicable_questions': applicable_questions,
+            'overall_compliance': compliance_percentage(yes, partial, applicable_questions)
+        }
+    }
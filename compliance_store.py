@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+
+from compliance_scoring import ANSWER_OPTIONS, OBLIGATION_TYPES, RISK_LEVELS, obligation_type
+
+# Answers are stored per session as one int8 code per catalog question
+UNANSWERED = -1
+ANSWER_CODES = {answer: code for code, answer in enumerate(ANSWER_OPTIONS)}
+EFFORT_LEVELS = ['low', 'medium', 'high']
+
+
+def question_table(requirements):
+    """Flatten the requirements catalog into one row per question with categorical columns"""
+    rows = [(section, question) for section, data in requirements.items() for question in data['questions']]
+    articles = [question['article'] for _, question in rows]
+
+    return pd.DataFrame({
+        'section': pd.Categorical([section for section, _ in rows], categories=list(requirements)),
+        'article': pd.Categorical(articles, categories=list(dict.fromkeys(articles))),
+        'risk_level': pd.Categorical([question['risk_level'] for _, question in rows], categories=RISK_LEVELS),
+        'implementation_effort': pd.Categorical([question['implementation_effort'] for _, question in rows],
+                                                categories=EFFORT_LEVELS),
+        'obligation': pd.Categorical([obligation_type(question['applicable_to']) for _, question in rows],
+                                     categories=OBLIGATION_TYPES),
+        'question': [question['text'] for _, question in rows],
+        'applicable_to': [question['applicable_to'] for _, question in rows]
+    })
+
+
+def empty_answers(questions):
+    """Create an all-unanswered code array aligned with the question table"""
+    return np.full(len(questions), UNANSWERED, dtype=np.int8)
+
+
+def encode_answer(answer):
+    """Map a compliance status string onto its answer code"""
+    return ANSWER_CODES.get(answer, UNANSWERED)
+
+
+def answered_count(codes):
+    """Number of questions with a recorded answer"""
+    return int(np.count_nonzero(codes != UNANSWERED))
+
+
+def answer_frame(questions, codes):
+    """Join the answered questions with their decoded compliance status"""
+    rows = np.flatnonzero(codes != UNANSWERED)
+    frame = questions.iloc[rows].reset_index(drop=True)
+    frame.insert(0, 'answer', pd.Categorical.from_codes(codes[rows], categories=ANSWER_OPTIONS))
+    return frame
+
+
+def answers_from_dicts(compliance_answers):
+    """Convert legacy dict-of-dicts answers into a question table and answer codes"""
+    entries = list(compliance_answers.values())
+    requirements = {}
+    for entry in entries:
+        requirements.setdefault(entry.get('section', 'Other'), {'questions': []})['questions'].append({
+            'text': entry['question'],
+            'article': entry['article'],
+            'risk_level': entry['risk_level'],
+            'implementation_effort': entry['implementation_effort'],
+            'applicable_to': entry.get('applicable_to', ['both'])
+        })
+
+    # Regrouping by section keeps each section's answers together, as question_table expects
+    grouped = [entry for section in requirements for entry in entries if entry.get('section', 'Other') == section]
+    codes = np.array([encode_answer(entry['answer']) for entry in grouped], dtype=np.int8)
+    return question_table(requirements), codes
+
+
+def _checked_answer(answer, where):
+    """Answer code of a saved status; blanks are unanswered, anything else must be a known status"""
+    if answer is None or answer == '':
+        return UNANSWERED
+    if answer not in ANSWER_CODES:
+        raise ValueError(f"unknown answer {answer!r} for {where}; expected one of {', '.join(ANSWER_OPTIONS)}")
+    return ANSWER_CODES[answer]
+
+
+def encode_answers(questions, answers):
+    """Encode statuses given as a catalog-aligned list or a mapping of question text to status"""
+    codes = empty_answers(questions)
+    if isinstance(answers, dict):
+        rows = {text: row for row, text in enumerate(questions['question'])}
+        for text, answer in answers.items():
+            if text not in rows:
+                raise ValueError(f"unknown question {text!r}")
+            codes[rows[text]] = _checked_answer(answer, f"question {text!r}")
+    else:
+        if len(answers) > len(codes):
+            raise ValueError(f"answer {len(codes) + 1} has no catalog question "
+                             f"({len(answers)} answers for {len(codes)} questions)")
+        for row, answer in enumerate(answers):
+            codes[row] = _checked_answer(answer, f"answer {row + 1}")
+    return codes
@@ -1,20 +1,28 @@
 import streamlit as st
-import json
-import matplotlib.pyplot as plt
+import math
 import numpy as np
 import os
-from fpdf import FPDF
-import tempfile
 import plotly.graph_objects as go
 import plotly.express as px
+from clause_report import article_chart_data, build_pdf_report, score_clauses
+from compliance_report import report_filename
+from compliance_charts import article_chart_png
+from recommendation_matcher import DEFAULT_RECOMMENDATION, match_recommendations
+from runtime_stats import process_rss_mb
+from schema_loader import SchemaError, load_schema
 
-# Load schema (keeping for backward compatibility)
+# Load schema (keeping for backward compatibility); parsed once per process, re-read only when the file changes
 schema_path = "ai_compliance_framework_schema_eu_tagged_full.json"
+schema_error = None
 try:
-    with open(schema_path, "r") as f:
-        schema = json.load(f)
+    schema_index = load_schema(schema_path)
 except FileNotFoundError:
-    schema = {}  # Handle missing schema file gracefully
+    schema_index = None  # Handle missing schema file gracefully
+except SchemaError as error:
+    # The schema is optional, so a malformed file falls back to an empty one instead of stopping the app
+    schema_index = None
+    schema_error = error
+schema = schema_index['schema'] if schema_index else {}
 
 # Updated EU AI Act clauses with accurate articles and requirements
 real_eu_ai_clauses = {
@@ -230,39 +238,6 @@ all_examples = {
     }
 }
 
-# Updated recommendation helper with more specific Atlan integration suggestions
-def get_atlan_recommendations(clause_text):
-    recommendations = {
-        "governance": "Use Atlan's role-based access control and governance workflows to establish clear AI oversight responsibilities and approval processes. Set up custom roles for AI governance team members and configure multi-stage approval workflows for AI system changes.",
-        "oversight": "Implement Atlan's lineage tracking and monitoring capabilities to maintain human oversight over AI decision-making processes. Create dashboards showing AI decision flows and set up alerts for decisions requiring human review.",
-        "risk": "Leverage Atlan's metadata management and classification features to identify and track high-risk AI systems and their data dependencies. Use custom tags to classify risk levels and create risk assessment workflows.",
-        "documentation": "Use Atlan's comprehensive metadata catalog to maintain technical documentation, lineage, and change tracking for AI systems. Create model cards, attach architecture diagrams, and maintain version-controlled documentation.",
-        "transparency": "Implement Atlan's glossary and documentation features to ensure clear communication about AI system capabilities and limitations. Publish AI system information to stakeholders through Atlan's collaboration features.",
-        "data": "Use Atlan's data quality monitoring, lineage tracking, and profiling capabilities to ensure training data meets Article 10 requirements. Set up quality rules, monitor data drift, and track bias metrics.",
-        "compliance": "Leverage Atlan's audit trails, version control, and governance features to support conformity assessments and regulatory compliance. Generate compliance reports and maintain evidence for audits.",
-        "conformity": "Use Atlan's workflow automation and approval processes to implement systematic conformity assessment procedures. Create checklists and automate assessment workflows.",
-        "corrective": "Implement Atlan's incident management and change tracking capabilities to support corrective action procedures. Set up incident workflows and track remediation progress.",
-        "monitoring": "Use Atlan's monitoring and alerting features to implement post-market surveillance of deployed AI systems. Create performance dashboards and configure drift alerts.",
-        "gpai": "Leverage Atlan's comprehensive documentation and lineage features to meet GPAI model transparency and documentation requirements. Build model registries and maintain training data catalogs.",
-        "copyright": "Use Atlan's data cataloging and lineage features to track copyright status and licensing of training data sources. Tag datasets with licensing information and maintain opt-out records.",
-        "downstream": "Implement Atlan's API documentation and access control features to manage downstream provider relationships. Create API catalogs and track usage patterns.",
-        "users": "Configure Atlan's access management to control and monitor who can access AI systems and their outputs. Implement usage tracking and access auditing.",
-        "literacy": "Use Atlan's knowledge base and glossary features to support AI literacy training. Create learning resources and track training completion.",
-        "quality": "Leverage Atlan's data quality framework to implement comprehensive quality management for AI systems. Define quality metrics and automate quality checks.",
-        "impact": "Use Atlan's impact analysis features to assess how AI systems affect different stakeholder groups. Map dependencies and analyze downstream impacts.",
-        "registration": "Maintain EU database registration information in Atlan's metadata catalog. Track registration status and compliance certificates.",
-        "marking": "Use Atlan's tagging and classification features to track CE marking status and conformity assessments. Maintain technical files and declarations."
-    }
-    
-    # Extract key terms to match recommendations
-    key_terms = clause_text.lower().split()
-    for term in key_terms:
-        if term in recommendations:
-            return recommendations[term]
-    
-    # Default comprehensive recommendation
-    return "Use Atlan's comprehensive data governance platform to maintain audit readiness and ensure compliance with EU AI Act requirements through automated lineage, metadata management, and governance workflows. Configure custom attributes for EU AI Act compliance tracking and leverage workflow automation for systematic compliance management."
-
 # START STREAMLIT APP
 st.set_page_config(
     page_title="EU AI Act Compliance Tool",
@@ -276,6 +251,26 @@ if 'page' not in st.session_state:
     st.session_state.page = 'landing'
 if 'assessment_type' not in st.session_state:
     st.session_state.assessment_type = None
+if 'baseline_rss_mb' not in st.session_state:
+    st.session_state.baseline_rss_mb = process_rss_mb()
+
+if schema_error:
+    st.sidebar.warning(f"Compliance schema ignored: {schema_error}")
+
+@st.cache_data(max_entries=64)
+def render_article_chart(labels, values):
+    """Article compliance chart as PNG bytes, shared by every rerun with the same results"""
+    return article_chart_png(labels, values)
+
+# Memory gauge: RSS should stay flat across reruns once the chart cache is warm
+rss_mb = process_rss_mb()
+if math.isnan(rss_mb):
+    # Not measurable on this platform (no resource module or /proc)
+    st.sidebar.metric("🧠 Process Memory (RSS)", "n/a")
+else:
+    st.sidebar.metric("🧠 Process Memory (RSS)", f"{rss_mb:.0f} MB",
+                      delta=f"{rss_mb - st.session_state.baseline_rss_mb:+.1f} MB since session start",
+                      delta_color="inverse")
 
 # Landing Page
 if st.session_state.page == 'landing':
@@ -608,25 +603,7 @@ elif st.session_state.page == 'results':
             relevant_sections = {k: v for k, v in real_eu_ai_clauses.items() if "General Purpose AI" not in k}
         
         # Compliance scoring
-        clause_summary = {}
-        compliant = []
-        gaps = []
-        section_scores = {s: [0, 0] for s in relevant_sections}  # answered, total
-
-        for section, questions in relevant_sections.items():
-            for q, (clause_title, clause_link) in questions.items():
-                a = user_answers.get(q, "No")  # Default to "No" if missing
-                clause_summary.setdefault(clause_title, {"link": clause_link, "compliant": 0, "total": 0, "questions": []})
-                clause_summary[clause_title]["total"] += 1
-                section_scores[section][1] += 1
-                
-                if a == "Yes":
-                    clause_summary[clause_title]["compliant"] += 1
-                    compliant.append((q, clause_title, clause_link))
-                    section_scores[section][0] += 1
-                else:
-                    gaps.append((q, clause_title, clause_link))
-                clause_summary[clause_title]["questions"].append((q, a))
+        clause_summary, compliant, gaps, section_scores = score_clauses(relevant_sections, user_answers)
 
         # Calculate overall compliance score
         total_questions = sum(total for _, total in section_scores.values())
@@ -839,35 +816,8 @@ elif st.session_state.page == 'results':
         tab1, tab2, tab3 = st.tabs(["Article Compliance", "Section Analysis", "Priority Matrix"])
         
         with tab1:
-            # Bar chart
-            chart_labels = []
-            chart_values = []
-            chart_colors = []
-
-            for clause, details in clause_summary.items():
-                pct = round((details['compliant'] / details['total']) * 100, 1)
-                chart_labels.append(clause.replace(' – ', '\n'))
-                chart_values.append(pct)
-                
-                if pct >= 80:
-                    chart_colors.append('#2E8B57')
-                elif pct >= 50:
-                    chart_colors.append('#FFB347')
-                else:
-                    chart_colors.append('#FF6B6B')
-
-            fig, ax = plt.subplots(figsize=(12, 8))
-            bars = ax.barh(chart_labels, chart_values, color=chart_colors)
-            ax.set_xlabel("Compliance Percentage")
-            ax.set_title("EU AI Act Article Compliance Status")
-            ax.set_xlim(0, 100)
-
-            for bar, value in zip(bars, chart_values):
-                ax.text(bar.get_width() + 1, bar.get_y() + bar.get_height()/2, 
-                        f'{value}%', ha='left', va='center', fontweight='bold')
-
-            plt.tight_layout()
-            st.pyplot(fig)
+            # Bar chart, rendered once per distinct result and served as a cached PNG
+            st.image(render_article_chart(*article_chart_data(clause_summary)), use_container_width=True)
         
         with tab2:
             # Section-wise radar chart using plotly
@@ -1059,6 +1009,18 @@ elif st.session_state.page == 'results':
                     """)
                     
         with rec_tab2:
+            # Gap-specific recommendations; matches are memoized per gap text
+            if gaps:
+                st.markdown("### 🎯 Recommendations for Your Gaps")
+                for q, clause, link in gaps:
+                    with st.expander(f"📜 {clause}: {q}"):
+                        matches = match_recommendations(f"{clause} {q}")
+                        for keyword, recommendation in matches:
+                            st.markdown(f"**{keyword.title()}:** {recommendation}")
+                        if not matches:
+                            st.markdown(DEFAULT_RECOMMENDATION)
+                        st.markdown(f"[Read the article]({link})")
+
             st.markdown("### 🔧 Atlan Implementation Guide")
             
             # Atlan implementation phases
@@ -1317,8 +1279,18 @@ elif st.session_state.page == 'results':
         st.markdown("---")
         col1, col2, col3 = st.columns([1, 2, 1])
         with col2:
-            if st.button("📥 Download Detailed Report", type="secondary", use_container_width=True):
-                st.info("Report download functionality would be implemented here in production version.")
+            # The PDF is built in memory only when the button is clicked
+            org_info = {'name': st.session_state.get('org_name', 'Unknown'),
+                        'industry': st.session_state.get('industry', 'Unknown')}
+            st.download_button(
+                "📥 Download Detailed Report",
+                data=lambda: build_pdf_report(org_info, clause_summary, section_scores, gaps, assessment_type,
+                                              chart_png=render_article_chart(*article_chart_data(clause_summary))),
+                file_name=report_filename(org_info['name'], extension='pdf'),
+                mime="application/pdf",
+                type="secondary",
+                use_container_width=True
+            )
             
             if st.button("🔄 Take Assessment Again", use_container_width=True):
                 st.session_state.page = 'landing'
@@ -0,0 +1,97 @@
+import hashlib
+import threading
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+import pandas as pd
+
+# Figures held across reruns and sessions; each theme variant takes its own slot
+FIGURE_CACHE_SIZE = 128
+
+FigureCacheInfo = namedtuple('FigureCacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+_figures = OrderedDict()
+_stats = {'hits': 0, 'misses': 0}
+_lock = threading.Lock()
+
+
+def _feed(digest, value):
+    """Feed a value's type and content into the digest, recursing through containers"""
+    digest.update(type(value).__name__.encode())
+    if isinstance(value, pd.DataFrame):
+        digest.update(repr((list(value.columns), [str(dtype) for dtype in value.dtypes])).encode())
+        digest.update(pd.util.hash_pandas_object(value, index=True).values.tobytes())
+    elif isinstance(value, pd.Series):
+        digest.update(repr((value.name, str(value.dtype))).encode())
+        digest.update(pd.util.hash_pandas_object(value, index=True).values.tobytes())
+    elif isinstance(value, np.ndarray):
+        digest.update(repr((value.shape, str(value.dtype))).encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, dict):
+        digest.update(str(len(value)).encode())
+        # Insertion order decides trace order, so it is part of the key
+        for key, item in value.items():
+            _feed(digest, key)
+            _feed(digest, item)
+    elif isinstance(value, (list, tuple)):
+        digest.update(str(len(value)).encode())
+        for item in value:
+            _feed(digest, item)
+    else:
+        digest.update(repr(value).encode())
+    digest.update(b'\x00')
+
+
+def input_digest(inputs):
+    """Content hash of a figure's inputs"""
+    digest = hashlib.blake2b(digest_size=16)
+    _feed(digest, inputs)
+    return digest.hexdigest()
+
+
+def _lookup(key):
+    with _lock:
+        figure = _figures.get(key)
+        if figure is not None:
+            _figures.move_to_end(key)
+        return figure
+
+
+def _store(key, figure):
+    with _lock:
+        _figures[key] = figure
+        _figures.move_to_end(key)
+        while len(_figures) > FIGURE_CACHE_SIZE:
+            _figures.popitem(last=False)
+    return figure
+
+
+def cached_figure(builder, inputs, variant=None, patch=None):
+    """Figure built from the inputs, reused while their content is unchanged; patch makes a cached variant"""
+    key = (builder, input_digest(inputs))
+    variant_key = key + (variant,)
+
+    figure = _lookup(variant_key)
+    with _lock:
+        _stats['hits' if figure is not None else 'misses'] += 1
+    if figure is not None:
+        return figure
+
+    # A new variant of a known figure only needs the patch, not a rebuild
+    base = _lookup(key) if patch is not None else None
+    if base is None:
+        base = _store(key, builder(*inputs))
+    return _store(variant_key, patch(base) if patch is not None else base)
+
+
+def figure_cache_info():
+    """Hit, miss and size statistics of the figure cache"""
+    with _lock:
+        return FigureCacheInfo(_stats['hits'], _stats['misses'], FIGURE_CACHE_SIZE, len(_figures))
+
+
+def clear_figure_cache():
+    """Drop every cached figure and reset the statistics"""
+    with _lock:
+        _figures.clear()
+        _stats.update(hits=0, misses=0)
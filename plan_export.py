@@ -0,0 +1,260 @@
+import re
+import zipfile
+from datetime import datetime, timedelta
+from io import BytesIO
+from xml.sax.saxutils import escape
+
+import numpy as np
+import pandas as pd
+
+XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+ICS_MIME = "text/calendar"
+# Excel's limits on sheet names
+SHEET_NAME_LENGTH = 31
+SHEET_NAME_FORBIDDEN = re.compile(r'[\[\]:*?/\\]')
+# iCalendar lines are folded at 75 octets
+ICS_LINE_LENGTH = 75
+# Approximate width of one 8pt Helvetica character, in mm, for truncating PDF table cells
+PDF_CHAR_WIDTH = 1.6
+
+XLSX_CONTENT_TYPES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="xml" ContentType="application/xml"/>
+<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>
+<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>
+{sheets}
+</Types>"""
+XLSX_ROOT_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>
+</Relationships>"""
+XLSX_WORKBOOK = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">
+<sheets>{sheets}</sheets>
+</workbook>"""
+XLSX_WORKBOOK_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+{sheets}
+<Relationship Id="rIdStyles" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>
+</Relationships>"""
+# Style 1 is the bold header row
+XLSX_STYLES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font><font><b/><sz val="11"/><name val="Calibri"/></font></fonts>
+<fills count="2"><fill><patternFill patternType="none"/></fill><fill><patternFill patternType="gray125"/></fill></fills>
+<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>
+<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>
+<cellXfs count="2"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/><xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/></cellXfs>
+</styleSheet>"""
+XLSX_SHEET = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+<sheetViews><sheetView workbookViewId="0"><pane ySplit="1" topLeftCell="A2" activePane="bottomLeft" state="frozen"/></sheetView></sheetViews>
+<sheetData>{rows}</sheetData>
+</worksheet>"""
+
+
+def file_stem(project_name):
+    """Project name made safe for download file names"""
+    return re.sub(r'\W+', '_', project_name or '').strip('_') or 'atlan_implementation'
+
+
+def schedule_table(schedule, start_date):
+    """Schedule with calendar dates next to the week offsets, from the leveled weeks when the plan has them"""
+    table = schedule.copy()
+    origin = pd.Timestamp(start_date)
+    # The leveled dates are the ones the planner reports; the CPM weeks are only the unconstrained bound
+    leveled = 'Leveled Start' in table and 'Leveled Finish' in table
+    start, finish = ('Leveled Start', 'Leveled Finish') if leveled else ('Earliest Start', 'Earliest Finish')
+    table['Start Date'] = (origin + pd.to_timedelta(table[start] * 7, unit='D')).dt.date
+    table['Finish Date'] = (origin + pd.to_timedelta(table[finish] * 7, unit='D')).dt.date
+    return table
+
+
+def dependency_table(schedule):
+    """Task by task matrix marking the predecessors each task requires"""
+    names = list(schedule['Task'])
+    position = {name: column for column, name in enumerate(names)}
+    cells = np.full((len(names), len(names)), '', dtype=object)
+    for row, depends_on in enumerate(schedule['Depends On']):
+        for predecessor in (dep.strip() for dep in str(depends_on).split(',')):
+            if predecessor in position:
+                cells[row, position[predecessor]] = 'Required'
+    return pd.DataFrame(cells, index=pd.Index(names, name='Task'), columns=names)
+
+
+def milestone_table(milestones, start_date):
+    """Milestones with the calendar date of their target week"""
+    table = milestones.copy()
+    table['Target Date'] = [start_date + timedelta(weeks=int(week)) for week in table['Target Week']]
+    return table
+
+
+def schedule_csv(schedule):
+    """The schedule as UTF-8 CSV bytes"""
+    return schedule.to_csv(index=False).encode('utf-8')
+
+
+def _column_letter(position):
+    """Spreadsheet column letters for a zero-based column position"""
+    letters = ''
+    position += 1
+    while position:
+        position, remainder = divmod(position - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def _xlsx_cell(reference, value, style=0):
+    """One worksheet cell: numbers and booleans typed, everything else an inline string; blanks are left out"""
+    styled = f' s="{style}"' if style else ''
+    if value is None or value == '' or (isinstance(value, float) and np.isnan(value)):
+        return ''
+    if isinstance(value, (bool, np.bool_)):
+        return f'<c r="{reference}" t="b"{styled}><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float, np.integer, np.floating)):
+        return f'<c r="{reference}"{styled}><v>{value}</v></c>'
+    return f'<c r="{reference}" t="inlineStr"{styled}><is><t xml:space="preserve">{escape(str(value))}</t></is></c>'
+
+
+def _xlsx_sheet(frame):
+    """Worksheet XML for a frame: a bold header row, then one row per record"""
+    frame = frame.reset_index() if frame.index.name else frame
+    letters = [_column_letter(position) for position in range(len(frame.columns))]
+    rows = ['<row r="1">' + ''.join(_xlsx_cell(f"{letter}1", str(column), style=1)
+                                    for letter, column in zip(letters, frame.columns)) + '</row>']
+    values = frame.to_numpy(dtype=object)
+    # Only filled cells are written, which keeps sparse sheets such as the dependency matrix small
+    filled = frame.notna().to_numpy() & (values != '')
+    for number, (record, columns) in enumerate(zip(values, filled), start=2):
+        rows.append(f'<row r="{number}">' + ''.join(_xlsx_cell(f"{letters[column]}{number}", record[column])
+                                                     for column in np.flatnonzero(columns)) + '</row>')
+    return XLSX_SHEET.format(rows=''.join(rows))
+
+
+def workbook_xlsx(sheets):
+    """An XLSX workbook with one sheet per named frame, written entirely in memory"""
+    names = [SHEET_NAME_FORBIDDEN.sub(' ', name)[:SHEET_NAME_LENGTH] for name in sheets]
+
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('[Content_Types].xml', XLSX_CONTENT_TYPES.format(sheets=''.join(
+            f'<Override PartName="/xl/worksheets/sheet{number}.xml" '
+            f'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+            for number in range(1, len(names) + 1))))
+        archive.writestr('_rels/.rels', XLSX_ROOT_RELS)
+        archive.writestr('xl/workbook.xml', XLSX_WORKBOOK.format(sheets=''.join(
+            f'<sheet name="{escape(name)}" sheetId="{number}" r:id="rId{number}"/>'
+            for number, name in enumerate(names, start=1))))
+        archive.writestr('xl/_rels/workbook.xml.rels', XLSX_WORKBOOK_RELS.format(sheets=''.join(
+            f'<Relationship Id="rId{number}" '
+            f'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+            f'Target="worksheets/sheet{number}.xml"/>'
+            for number in range(1, len(names) + 1))))
+        archive.writestr('xl/styles.xml', XLSX_STYLES)
+        for number, frame in enumerate(sheets.values(), start=1):
+            archive.writestr(f'xl/worksheets/sheet{number}.xml', _xlsx_sheet(frame))
+    return buffer.getvalue()
+
+
+def _ics_text(text):
+    """Escape iCalendar text values"""
+    return str(text).replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,').replace('\n', '\\n')
+
+
+def _ics_fold(line):
+    """Fold a content line into 75-octet pieces joined by CRLF and a space"""
+    encoded = line.encode('utf-8')
+    pieces = []
+    while len(encoded) > ICS_LINE_LENGTH:
+        cut = ICS_LINE_LENGTH - (1 if pieces else 0)
+        # Never split a multi-byte character
+        while cut and (encoded[cut] & 0xC0) == 0x80:
+            cut -= 1
+        pieces.append(encoded[:cut])
+        encoded = encoded[cut:]
+    pieces.append(encoded)
+    return b'\r\n '.join(pieces).decode('utf-8')
+
+
+def milestones_ics(milestones, project_name, generated=None):
+    """All-day iCalendar events for the milestones' target dates"""
+    stamp = (generated or datetime.now()).strftime('%Y%m%dT%H%M%S')
+    stem = file_stem(project_name)
+    lines = ['BEGIN:VCALENDAR', 'VERSION:2.0', 'PRODID:-//Atlan Implementation Planner//EN', 'CALSCALE:GREGORIAN',
+             f"X-WR-CALNAME:{_ics_text(project_name or 'Atlan Implementation')} Milestones"]
+    for position, milestone in enumerate(milestones.to_dict('records')):
+        day = milestone['Target Date']
+        description = f"Week {milestone['Target Week']} - owner: {milestone['Owner']}"
+        lines += [
+            'BEGIN:VEVENT',
+            f"UID:{stem}-milestone-{position}@atlan-planner",
+            f"DTSTAMP:{stamp}",
+            f"DTSTART;VALUE=DATE:{day.strftime('%Y%m%d')}",
+            f"DTEND;VALUE=DATE:{(day + timedelta(days=1)).strftime('%Y%m%d')}",
+            f"SUMMARY:{_ics_text(milestone['Milestone'])}",
+            f"DESCRIPTION:{_ics_text(description)}",
+            'END:VEVENT'
+        ]
+    lines.append('END:VCALENDAR')
+    return ('\r\n'.join(_ics_fold(line) for line in lines) + '\r\n').encode('utf-8')
+
+
+def _pdf_value(value):
+    """Table cell text: whole numbers without decimals, blanks for missing values"""
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return ''
+    if isinstance(value, (float, np.floating)):
+        return f"{value:g}"
+    return str(value)
+
+
+def _pdf_table(pdf, title, frame):
+    """A titled table spread over the page width, one row per record"""
+    from fpdf.enums import XPos, YPos
+    from clause_report import HEADER_FILL, pdf_text
+    pdf.set_font('Helvetica', 'B', 14)
+    pdf.cell(0, 9, pdf_text(title), new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+    frame = frame.reset_index() if frame.index.name else frame
+    width = pdf.epw / max(len(frame.columns), 1)
+    characters = int(width / PDF_CHAR_WIDTH)
+
+    pdf.set_font('Helvetica', 'B', 8)
+    pdf.set_fill_color(*HEADER_FILL)
+    pdf.set_text_color(255, 255, 255)
+    for column in frame.columns:
+        pdf.cell(width, 7, pdf_text(column)[:characters], border=1, fill=True)
+    pdf.ln()
+    pdf.set_text_color(0, 0, 0)
+    pdf.set_font('Helvetica', '', 8)
+    for record in frame.itertuples(index=False):
+        for value in record:
+            pdf.cell(width, 6, pdf_text(_pdf_value(value))[:characters], border=1)
+        pdf.ln()
+    pdf.ln(4)
+
+
+def plan_pdf(project, sheets, generated=None):
+    """The implementation plan as a PDF: project summary, then one table per sheet"""
+    # The PDF stack, matplotlib included via clause_report, is only loaded when a PDF is requested
+    from fpdf import FPDF
+    from fpdf.enums import XPos, YPos
+    from clause_report import pdf_text
+    generated = generated or datetime.now()
+    pdf = FPDF(orientation='L')
+    pdf.set_auto_page_break(auto=True, margin=15)
+    pdf.add_page()
+
+    pdf.set_font('Helvetica', 'B', 18)
+    pdf.cell(0, 12, pdf_text(f"Implementation Plan - {project.get('name') or 'Atlan Implementation'}"),
+             new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+    pdf.set_font('Helvetica', '', 10)
+    for label, value in project.items():
+        if label != 'name':
+            pdf.cell(0, 6, pdf_text(f"{label}: {value}"), new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+    pdf.cell(0, 6, f"Generated: {generated.strftime('%B %d, %Y')}", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+    pdf.ln(4)
+
+    for title, frame in sheets.items():
+        _pdf_table(pdf, title, frame)
+    return bytes(pdf.output())
@@ -0,0 +1,90 @@
+import re
+from functools import lru_cache
+
+# Keyword -> Atlan recommendation for a compliance clause
+ATLAN_RECOMMENDATIONS = {
+    "governance": "Use Atlan's role-based access control and governance workflows to establish clear AI oversight responsibilities and approval processes. Set up custom roles for AI governance team members and configure multi-stage approval workflows for AI system changes.",
+    "oversight": "Implement Atlan's lineage tracking and monitoring capabilities to maintain human oversight over AI decision-making processes. Create dashboards showing AI decision flows and set up alerts for decisions requiring human review.",
+    "risk": "Leverage Atlan's metadata management and classification features to identify and track high-risk AI systems and their data dependencies. Use custom tags to classify risk levels and create risk assessment workflows.",
+    "documentation": "Use Atlan's comprehensive metadata catalog to maintain technical documentation, lineage, and change tracking for AI systems. Create model cards, attach architecture diagrams, and maintain version-controlled documentation.",
+    "transparency": "Implement Atlan's glossary and documentation features to ensure clear communication about AI system capabilities and limitations. Publish AI system information to stakeholders through Atlan's collaboration features.",
+    "data": "Use Atlan's data quality monitoring, lineage tracking, and profiling capabilities to ensure training data meets Article 10 requirements. Set up quality rules, monitor data drift, and track bias metrics.",
+    "compliance": "Leverage Atlan's audit trails, version control, and governance features to support conformity assessments and regulatory compliance. Generate compliance reports and maintain evidence for audits.",
+    "conformity": "Use Atlan's workflow automation and approval processes to implement systematic conformity assessment procedures. Create checklists and automate assessment workflows.",
+    "corrective": "Implement Atlan's incident management and change tracking capabilities to support corrective action procedures. Set up incident workflows and track remediation progress.",
+    "monitoring": "Use Atlan's monitoring and alerting features to implement post-market surveillance of deployed AI systems. Create performance dashboards and configure drift alerts.",
+    "gpai": "Leverage Atlan's comprehensive documentation and lineage features to meet GPAI model transparency and documentation requirements. Build model registries and maintain training data catalogs.",
+    "copyright": "Use Atlan's data cataloging and lineage features to track copyright status and licensing of training data sources. Tag datasets with licensing information and maintain opt-out records.",
+    "downstream": "Implement Atlan's API documentation and access control features to manage downstream provider relationships. Create API catalogs and track usage patterns.",
+    "users": "Configure Atlan's access management to control and monitor who can access AI systems and their outputs. Implement usage tracking and access auditing.",
+    "literacy": "Use Atlan's knowledge base and glossary features to support AI literacy training. Create learning resources and track training completion.",
+    "quality": "Leverage Atlan's data quality framework to implement comprehensive quality management for AI systems. Define quality metrics and automate quality checks.",
+    "impact": "Use Atlan's impact analysis features to assess how AI systems affect different stakeholder groups. Map dependencies and analyze downstream impacts.",
+    "registration": "Maintain EU database registration information in Atlan's metadata catalog. Track registration status and compliance certificates.",
+    "marking": "Use Atlan's tagging and classification features to track CE marking status and conformity assessments. Maintain technical files and declarations."
+}
+DEFAULT_RECOMMENDATION = "Use Atlan's comprehensive data governance platform to maintain audit readiness and ensure compliance with EU AI Act requirements through automated lineage, metadata management, and governance workflows. Configure custom attributes for EU AI Act compliance tracking and leverage workflow automation for systematic compliance management."
+
+# Suffixes folded by the stemmer and re-allowed by the matcher, longest first
+STEM_SUFFIXES = ('ations', 'ation', 'ments', 'ment', 'ances', 'ance', 'ences', 'ence', 'ency', 'ancy',
+                 'ities', 'ity', 'ions', 'ion', 'ings', 'ing', 'ives', 'ive', 'ers', 'er', 'ed', 'es', 'ent',
+                 'ant', 'ly', 's')
+MIN_STEM_LENGTH = 4
+RECOMMENDATION_CACHE_SIZE = 1024
+# Related words whose stems the keyword's own stem does not reach, such as the verb behind a noun
+KEYWORD_VARIANTS = {
+    "registration": ("register", "registry"),
+    "compliance": ("comply",),
+    "oversight": ("oversee",)
+}
+WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def stem(word):
+    """Strip one inflectional suffix so that documented and documentation share a stem"""
+    word = word.lower()
+    for suffix in STEM_SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= MIN_STEM_LENGTH:
+            return word[:-len(suffix)]
+    return word
+
+
+def word_stems(word):
+    """The word, then every stem one suffix strip away, longest suffix first; stem() only takes the first"""
+    word = word.lower()
+    return (word,) + tuple(word[:-len(suffix)] for suffix in STEM_SUFFIXES
+                           if word.endswith(suffix) and len(word) - len(suffix) >= MIN_STEM_LENGTH)
+
+
+def _index_keywords(keywords, variants=KEYWORD_VARIANTS):
+    """Stem -> keyword for every keyword and its variants, so registered and registration meet"""
+    index = {}
+    for keyword in keywords:
+        for form in (keyword,) + variants.get(keyword, ()):
+            index.setdefault(form, keyword)
+            index.setdefault(stem(form), keyword)
+    return index
+
+
+STEM_KEYWORDS = _index_keywords(ATLAN_RECOMMENDATIONS)
+
+
+@lru_cache(maxsize=RECOMMENDATION_CACHE_SIZE)
+def match_recommendations(clause_text, limit=3):
+    """Rank keyword recommendations for a clause by hit count, then by first position"""
+    hits = {}
+    for position, word in enumerate(WORD_PATTERN.findall(clause_text.lower())):
+        keyword = next((STEM_KEYWORDS[form] for form in word_stems(word) if form in STEM_KEYWORDS), None)
+        if keyword is None:
+            continue
+        count, first = hits.get(keyword, (0, position))
+        hits[keyword] = (count + 1, first)
+
+    ranked = sorted(hits, key=lambda keyword: (-hits[keyword][0], hits[keyword][1]))
+    return tuple((keyword, ATLAN_RECOMMENDATIONS[keyword]) for keyword in ranked[:limit])
+
+
+def get_atlan_recommendations(clause_text):
+    """Best single recommendation for a clause, or the default platform recommendation"""
+    matches = match_recommendations(clause_text, limit=1)
+    return matches[0][1] if matches else DEFAULT_RECOMMENDATION
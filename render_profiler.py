@@ -0,0 +1,204 @@
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from functools import wraps
+
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+# Profiling is opt-in on the server: APP_PROFILE=1 profiles every run, while
+# APP_PROFILE_ALLOW_PARAM=1 lets a visitor turn it on with ?profile=1 on the URL
+PROFILE_PARAM = 'profile'
+PROFILE_ENV = 'APP_PROFILE'
+ALLOW_PARAM_ENV = 'APP_PROFILE_ALLOW_PARAM'
+# Traces are only written when the server names a file for them
+TRACE_FILE_ENV = 'APP_PROFILE_TRACE'
+ENABLED_VALUES = ('1', 'true', 'yes', 'on')
+
+# tracemalloc is process-wide, so it runs only while at least one profiled run is in flight
+_tracing_lock = threading.Lock()
+_tracing_runs = 0
+
+
+def _env_flag(name):
+    return os.environ.get(name, '').lower() in ENABLED_VALUES
+
+
+def profiling_enabled():
+    """Whether this run was asked to profile itself, and the server allows it"""
+    if _env_flag(PROFILE_ENV):
+        return True
+    if not _env_flag(ALLOW_PARAM_ENV):
+        return False
+    return st.query_params.get(PROFILE_PARAM, '').lower() in ENABLED_VALUES
+
+
+def trace_path():
+    """Local JSONL file the traces are appended to, or None when tracing to disk is off"""
+    return os.environ.get(TRACE_FILE_ENV) or None
+
+
+def _start_tracing():
+    global _tracing_runs
+    with _tracing_lock:
+        _tracing_runs += 1
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+
+def _stop_tracing():
+    global _tracing_runs
+    with _tracing_lock:
+        _tracing_runs = max(_tracing_runs - 1, 0)
+        if _tracing_runs == 0 and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+
+class RenderProfiler:
+    """Wall time, allocations and payload of the named render blocks of one script run"""
+
+    def __init__(self, page, enabled=None):
+        self.page = page
+        self.enabled = profiling_enabled() if enabled is None else enabled
+        self.blocks = []
+        self._open = []
+        self._payload = 0
+        self._ctx = None
+        if self.enabled:
+            # Allocation counters need tracemalloc; finish() stops it again once no profiled run needs it
+            _start_tracing()
+            self._count_payload()
+            self.started_at = datetime.now()
+            self.started = time.perf_counter()
+
+    def _count_payload(self):
+        """Count the bytes of every message this run sends to the browser"""
+        ctx = get_script_run_ctx()
+        if ctx is None:
+            return
+        # A run that stopped early may have left its counter in place
+        send = getattr(ctx._enqueue, '__wrapped__', ctx._enqueue)
+
+        @wraps(send)
+        def counted(msg):
+            self._payload += msg.ByteSize()
+            send(msg)
+
+        ctx._enqueue = counted
+        self._ctx = ctx
+
+    def _restore_payload(self):
+        """Hand the run's message queue back untouched"""
+        if self._ctx is not None:
+            self._ctx._enqueue = self._ctx._enqueue.__wrapped__
+            self._ctx = None
+
+    def _fold_peak(self):
+        """Credit the traced peak so far to every open block, then restart peak tracking"""
+        peak = tracemalloc.get_traced_memory()[1]
+        for record in self._open:
+            record['peak'] = max(record['peak'], peak)
+        tracemalloc.reset_peak()
+
+    @contextmanager
+    def block(self, name):
+        """Time a render block; blocks may nest, and cost nothing when profiling is off"""
+        if not self.enabled:
+            yield
+            return
+
+        self._fold_peak()
+        current = tracemalloc.get_traced_memory()[0]
+        record = {'name': name, 'depth': len(self._open), 'current': current, 'peak': current,
+                  'payload': self._payload, 'start': time.perf_counter()}
+        self._open.append(record)
+        try:
+            yield
+        finally:
+            ended = time.perf_counter()
+            self._fold_peak()
+            self._open.pop()
+            allocated = tracemalloc.get_traced_memory()[0] - record['current']
+            self.blocks.append({
+                'name': name,
+                'depth': record['depth'],
+                'start_ms': round((record['start'] - self.started) * 1000, 2),
+                'duration_ms': round((ended - record['start']) * 1000, 2),
+                'allocated_kb': round(allocated / 1024, 1),
+                'peak_kb': round((record['peak'] - record['current']) / 1024, 1),
+                'payload_kb': round((self._payload - record['payload']) / 1024, 1)
+            })
+
+    def trace(self):
+        """The run's blocks in start order, with the total time and payload so far"""
+        return {
+            'page': self.page,
+            'started': self.started_at.isoformat(timespec='milliseconds'),
+            'total_ms': round((time.perf_counter() - self.started) * 1000, 2),
+            'payload_kb': round(self._payload / 1024, 1),
+            'blocks': sorted(self.blocks, key=lambda block: block['start_ms'])
+        }
+
+    def write_trace(self, trace, path=None):
+        """Append the trace as one JSON line for offline analysis; nothing is written without a path"""
+        path = path or trace_path()
+        if not path:
+            return None
+        with open(path, 'a', encoding='utf-8') as handle:
+            handle.write(json.dumps(trace) + '\n')
+        return path
+
+    def render_sidebar(self, trace, written=None):
+        """Waterfall of the blocks and their allocation counters in the sidebar"""
+        blocks = trace['blocks']
+        st.sidebar.markdown("---")
+        st.sidebar.markdown(f"### ⏱️ Render Profile ({trace['total_ms']:.0f} ms, {trace['payload_kb']:,.1f} KB sent)")
+        if not blocks:
+            st.sidebar.caption("No profiled blocks ran")
+            return
+
+        labels = [' ' * block['depth'] + block['name'] for block in blocks]
+        fig = go.Figure(go.Bar(
+            y=labels,
+            x=[block['duration_ms'] for block in blocks],
+            base=[block['start_ms'] for block in blocks],
+            orientation='h',
+            marker_color=['#667eea' if block['depth'] == 0 else '#42a5f5' for block in blocks],
+            hovertemplate='%{y}<br>%{base:.0f} ms + %{x:.1f} ms<extra></extra>'
+        ))
+        fig.update_layout(
+            xaxis_title="ms since run start",
+            yaxis=dict(autorange='reversed'),
+            height=120 + 28 * len(blocks),
+            margin=dict(l=0, r=0, t=10, b=0),
+            showlegend=False
+        )
+        st.sidebar.plotly_chart(fig, use_container_width=True)
+        st.sidebar.dataframe(pd.DataFrame(blocks)[['name', 'duration_ms', 'allocated_kb', 'peak_kb', 'payload_kb']],
+                             hide_index=True, use_container_width=True)
+        if written:
+            st.sidebar.caption(f"Trace appended to {written}")
+        else:
+            st.sidebar.caption(f"Set {TRACE_FILE_ENV} to keep traces in a file")
+
+    def finish(self):
+        """Record the run: write the trace file, then show the waterfall"""
+        if not self.enabled:
+            return
+        # The sidebar profile itself is not part of the page's payload
+        self._restore_payload()
+        trace = self.trace()
+        _stop_tracing()
+        self.enabled = False
+        written = None
+        try:
+            written = self.write_trace(trace)
+        except OSError as error:
+            st.sidebar.warning(f"Could not write the profile trace: {error}")
+        self.render_sidebar(trace, written)
@@ -0,0 +1,154 @@
+import heapq
+
+import numpy as np
+import pandas as pd
+
+from schedule_engine import ScheduleError, backward_pass, forward_pass
+
+# Load that may exceed a role's weekly capacity through floating point error alone
+CAPACITY_TOLERANCE = 1e-9
+
+
+def _weeks(values):
+    """Whole weeks covering each value; leveling books resources week by week"""
+    return np.ceil(np.maximum(values, 0) - CAPACITY_TOLERANCE).astype(np.int64)
+
+
+def _task_values(task, columns):
+    """Non-negative values of the task's columns, with blanks as zero"""
+    values = [task.get(column) for column in columns]
+    return [0.0 if value is None or pd.isna(value) else max(float(value), 0.0) for value in values]
+
+
+def task_loads(graph, tasks, rate_columns, total_columns):
+    """Weekly load of each scheduled task: rate columns as given, totals spread evenly over its duration"""
+    by_name = {str(task.get('Task')).strip(): task for task in tasks}
+    loads = np.zeros((len(graph['names']), len(rate_columns) + len(total_columns)))
+    for position, (name, duration) in enumerate(zip(graph['names'], graph['durations'])):
+        values = _task_values(by_name[name], rate_columns + total_columns)
+        loads[position, :len(rate_columns)] = values[:len(rate_columns)]
+        if duration > 0:
+            loads[position, len(rate_columns):] = np.array(values[len(rate_columns):]) / duration
+    return loads
+
+
+def task_hours(graph, tasks, total_columns):
+    """Totals each scheduled task books through task_loads; tasks without a duration book none"""
+    by_name = {str(task.get('Task')).strip(): task for task in tasks}
+    hours = [_task_values(by_name[name], total_columns) if duration > 0 else [0.0] * len(total_columns)
+             for name, duration in zip(graph['names'], graph['durations'])]
+    return pd.DataFrame(hours, index=pd.Index(graph['names']), columns=total_columns)
+
+
+def _stretch(names, roles, weeks, demand, capacity):
+    """Spread tasks that need more of a role per week than exists over more weeks at full capacity"""
+    needed = demand > CAPACITY_TOLERANCE
+    missing = needed & (capacity <= 0)
+    if missing.any():
+        task, role = np.argwhere(missing)[0]
+        raise ScheduleError(f"{names[task]} needs {roles[role]} but no {roles[role]} capacity is available")
+
+    factor = (demand / np.where(capacity > 0, capacity, np.inf)).max(axis=1, initial=0)
+    stretched = (factor > 1 + CAPACITY_TOLERANCE) & (weeks > 0)
+    if stretched.any():
+        weeks, demand = weeks.copy(), demand.copy()
+        longer = _weeks(weeks[stretched] * factor[stretched])
+        # The same work over the longer span, so no week asks for more than the role can give
+        demand[stretched] *= (weeks[stretched] / longer)[:, None]
+        weeks[stretched] = longer
+    return weeks, demand, stretched
+
+
+def _first_fit(usage, row, capacity, earliest, weeks):
+    """First week from the earliest start where the task's load fits for its whole duration"""
+    roles = np.flatnonzero(row > CAPACITY_TOLERANCE)
+    if weeks == 0 or not len(roles):
+        return earliest
+    fits = np.all(usage[earliest:, roles] + row[roles] <= capacity[roles] + CAPACITY_TOLERANCE, axis=1)
+    blocked = np.concatenate(([0], np.cumsum(~fits)))
+    # A window fits when no blocked week falls inside it
+    windows = np.flatnonzero(blocked[weeks:] == blocked[:-weeks])
+    return earliest + int(windows[0])
+
+
+def level_resources(graph, demand, capacity, roles, priority=None):
+    """Serial list scheduling: start ready tasks in priority order at the first week their load fits"""
+    names = graph['names']
+    capacity = np.asarray(capacity, dtype=float)
+    demand = np.asarray(demand, dtype=float).reshape(len(names), len(capacity))
+    weeks, demand, stretched = _stretch(names, roles, _weeks(graph['durations']), demand, capacity)
+    release = _weeks(graph['release'])
+
+    if priority is None:
+        # Least latest start first: the tasks with the least slack claim capacity first
+        earliest_start, earliest_finish = forward_pass(graph, weeks)
+        priority = backward_pass(graph, earliest_finish.max(initial=0), weeks)[0]
+
+    # Every task fits once all the others are done, so this horizon can never run out
+    horizon = int(release.max(initial=0) + weeks.sum()) + 1
+    usage = np.zeros((horizon, len(capacity)))
+    start = np.zeros(len(names), dtype=np.int64)
+    finish = np.zeros(len(names), dtype=np.int64)
+    waiting = np.array([len(preds) for preds in graph['predecessors']])
+
+    ready = [(priority[task], task) for task in range(len(names)) if waiting[task] == 0]
+    heapq.heapify(ready)
+    while ready:
+        task = heapq.heappop(ready)[1]
+        earliest = max([release[task]] + [finish[pred] for pred in graph['predecessors'][task]])
+        start[task] = _first_fit(usage, demand[task], capacity, earliest, weeks[task])
+        finish[task] = start[task] + weeks[task]
+        usage[start[task]:finish[task]] += demand[task]
+        for succ in graph['successors'][task]:
+            waiting[succ] -= 1
+            if waiting[succ] == 0:
+                heapq.heappush(ready, (priority[succ], succ))
+
+    duration = int(finish.max(initial=0))
+    return {
+        'start': start,
+        'finish': finish,
+        'weeks': weeks,
+        'stretched': stretched,
+        'duration': duration,
+        'usage': usage[:duration]
+    }
+
+
+def leveled_schedule(plan, demand, capacity, roles):
+    """Level a critical-path plan against role capacities; dates, weekly load and utilization per role"""
+    graph = plan['graph']
+    capacity = np.asarray(capacity, dtype=float)
+    leveled = level_resources(graph, demand, capacity, roles)
+    cpm_start = plan['schedule']['Earliest Start'].to_numpy()
+
+    schedule = pd.DataFrame({
+        'Task': graph['names'],
+        'Start': leveled['start'],
+        'Finish': leveled['finish'],
+        'Delay (weeks)': leveled['start'] - cpm_start,
+        'Stretched': leveled['stretched']
+    })
+    weeks = np.arange(1, leveled['duration'] + 1)
+    load = pd.DataFrame(leveled['usage'], columns=roles).round(2)
+    load.insert(0, 'Week', weeks)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        shares = np.where(capacity > 0, leveled['usage'] / capacity * 100, 0)
+    utilization = pd.DataFrame(shares, columns=roles).round(1)
+    utilization.insert(0, 'Week', weeks)
+
+    return {
+        'schedule': schedule,
+        'duration': leveled['duration'],
+        'delay': leveled['duration'] - plan['duration'],
+        'load': load,
+        'utilization': utilization
+    }
+
+
+def peak_weeks(leveled, role):
+    """Week (1-based) in each task's leveled span when the role's total load is highest"""
+    load = leveled['load'][role].to_numpy()
+    schedule = leveled['schedule']
+    return np.array([start + int(np.argmax(load[start:finish])) + 1 if finish > start else start + 1
+                     for start, finish in zip(schedule['Start'], schedule['Finish'])])
@@ -0,0 +1,596 @@
+import math
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# Default Monte Carlo settings used by the rollout simulator page
+DEFAULT_SIMULATIONS = 5000
+DEFAULT_NOISE_SIGMA = 0.15
+DEFAULT_HISTOGRAM_BINS = 30
+DEFAULT_SEED = 42
+# Points on the smoothed density curve drawn over the histogram
+DENSITY_POINTS = 120
+# Probability grid for the closed-form factor moments; a multiple of ten so each decile is a whole slice
+MOMENT_GRID_SIZE = 5000
+
+# Duration model lookup tables
+BASE_DURATION = {"Growth": 3, "Enterprise": 6, "Major Enterprise": 9}
+SUPPORT_FACTOR = {"Low": 1.5, "Medium": 1.2, "High": 1.0}
+CHAMPION_BOOST = {"Weak": 1.3, "Moderate": 1.1, "Strong": 0.9, "Very Strong": 0.8}
+EXEC_BOOST = {"None": 1.3, "Monthly": 1.1, "Bi-weekly": 0.95, "Weekly": 0.9}
+MATURITY_FACTORS = {
+    "Level 0: Non-existent": 2.0,
+    "Level 1: Initial/Ad-hoc": 1.5,
+    "Level 2: Repeatable": 1.3,
+    "Level 3: Defined Process": 1.1,
+    "Level 4: Managed and Measurable": 1.0,
+    "Level 5: Optimized": 0.9
+}
+ADOPTION_SUPPORT_LEVELS = [
+    "Low - Limited CDO/DA support, no training org",
+    "Medium - Some training & comms in place",
+    "High - Strong enablement, change management"
+]
+
+# PS hours model
+BASE_PS_HOURS = 200  # Standard SOW
+PS_HOURLY_RATE = 375
+PS_MATURITY_FACTORS = {
+    "Level 0": 1.3,
+    "Level 1": 1.15,
+    "Level 2": 1.0,
+    "Level 3": 0.9,
+    "Level 4": 0.8,
+    "Level 5": 0.7
+}
+
+# Implementation roadmap phases as a share of the expected duration
+ROADMAP_PHASES = [
+    ("Discovery & Planning", 0.15),
+    ("Technical Setup", 0.20),
+    ("Pilot Implementation", 0.25),
+    ("Rollout & Training", 0.25),
+    ("Optimization", 0.15)
+]
+
+# Number of distinct rollout input combinations kept by the memoized analysis
+ROLLOUT_CACHE_SIZE = 16
+
+# Risk table rows mapped to the duration factor each one reports on
+RISK_FACTORS = {
+    "Executive Sponsorship": "Executive Sponsorship",
+    "Adoption Support": "Adoption Support",
+    "Champion Network": "Champion Network",
+    "User Research": "User Research",
+    "Training Program": "Workshops",
+    "Change Management": "Change Management",
+    "Team Resources": "Team Resources"
+}
+
+# Uncertainty of each duration factor as a multiplier around its nominal value:
+# ("triangular", low, mode, high) or ("lognormal", sigma) with median 1.0
+FACTOR_DISTRIBUTIONS = {
+    "Base Duration": ("lognormal", 0.10),
+    "Adoption Support": ("triangular", 0.95, 1.0, 1.15),
+    "Maturity": ("triangular", 0.90, 1.0, 1.10),
+    "Data Domains": ("triangular", 0.95, 1.0, 1.10),
+    "Active Users": ("triangular", 0.98, 1.0, 1.05),
+    "Executive Sponsorship": ("lognormal", 0.08),
+    "Executive Connects": ("triangular", 0.95, 1.0, 1.08),
+    "Champion Network": ("triangular", 0.90, 1.0, 1.15),
+    "User Research": ("triangular", 0.97, 1.0, 1.05),
+    "Workshops": ("triangular", 0.97, 1.0, 1.05),
+    "Change Management": ("lognormal", 0.05),
+    "Team Resources": ("lognormal", 0.05)
+}
+
+
+# The model helpers below accept either scalars (one scenario from the page widgets)
+# or pandas Series (a whole scenario grid) so both paths share one formula.
+
+def _lookup(table, keys, default=np.nan):
+    if isinstance(keys, str):
+        return table.get(keys, default)
+    values = np.asarray(pd.Series(keys).map(table), dtype=float)
+    return np.where(np.isnan(values), default, values)
+
+
+def _first_word(text, sep=None):
+    if isinstance(text, str):
+        return text.split(sep)[0].strip()
+    # Series.map on a categorical only visits the categories, not every row
+    return pd.Series(text).map(lambda value: _first_word(value, sep))
+
+
+def _where(condition, if_true, if_false):
+    result = np.where(condition, if_true, if_false)
+    return result.item() if result.ndim == 0 else result
+
+
+def duration_factors(org_type, adoption_support, maturity, num_domains, num_users,
+                     exec_sponsorship, exec_connects, champion_strength, user_interviews,
+                     num_workshops, change_mgmt, dedicated_team):
+    """Return the nominal multiplicative factors behind the expected rollout duration"""
+    return {
+        "Base Duration": _lookup(BASE_DURATION, org_type),
+        "Adoption Support": _lookup(SUPPORT_FACTOR, _first_word(adoption_support)),
+        "Maturity": _lookup(MATURITY_FACTORS, maturity),
+        "Data Domains": 1 + (num_domains - 5) * 0.03,
+        "Active Users": 1 + (num_users - 100) * 0.0001,
+        "Executive Sponsorship": _where(exec_sponsorship == "No", 1.3, 1.0),
+        "Executive Connects": _lookup(EXEC_BOOST, exec_connects),
+        "Champion Network": _lookup(CHAMPION_BOOST, champion_strength),
+        "User Research": 1 - np.minimum(user_interviews * 0.005, 0.2),
+        "Workshops": 1 - (num_workshops * 0.03),
+        "Change Management": _where(change_mgmt, 0.85, 1.0),
+        "Team Resources": _where(dedicated_team, 0.9, 1.0)
+    }
+
+
+def expected_duration_from_factors(factors):
+    """Multiply the nominal factors into the expected duration in months"""
+    duration = 1.0
+    for value in factors.values():
+        duration = duration * value
+    return duration
+
+
+def risk_flags(exec_sponsorship, adoption_support, champion_strength, user_interviews,
+               num_workshops, change_mgmt, dedicated_team):
+    """Flag which rollout risk factors are currently unmanaged"""
+    return {
+        "Executive Sponsorship": exec_sponsorship == "No",
+        "Adoption Support": _first_word(adoption_support) == "Low",
+        "Champion Network": champion_strength == "Weak",
+        "User Research": user_interviews < 15,
+        "Training Program": num_workshops < 3,
+        "Change Management": np.logical_not(change_mgmt),
+        "Team Resources": np.logical_not(dedicated_team)
+    }
+
+
+def risk_score(flags):
+    """Score rollout risk as 15 points per unmanaged factor, capped at 100"""
+    high_risks = sum(np.asarray(flag, dtype=int) for flag in flags.values())
+    score = np.minimum(100, high_risks * 15)
+    return int(score) if np.ndim(score) == 0 else score
+
+
+def success_probability(score, num_workshops):
+    """Translate the risk score and workshop plan into a success probability"""
+    probability = np.clip(100 - score + num_workshops * 5, 20, 95)
+    return int(probability) if np.ndim(probability) == 0 else probability
+
+
+def ps_hours_breakdown(timeline, num_domains, num_users, maturity):
+    """Estimate PS hours from the timeline, scope and maturity adjustments"""
+    # Rushed timelines need more PS support, relaxed ones a little less
+    timeline_factor = _where(timeline <= 3, 1.3, _where(timeline >= 9, 0.9, 1.0))
+
+    # More domains and a large user base widen the scope
+    scope_factor = 1.0 + np.maximum(num_domains - 5, 0) * 0.05 + _where(num_users > 200, 0.2, 0.0)
+
+    # Lower maturity needs more guidance
+    maturity_key = _first_word(maturity, ":")
+    maturity_factor = _lookup(PS_MATURITY_FACTORS, maturity_key, 1.0)
+
+    ps_hours = BASE_PS_HOURS * timeline_factor * scope_factor * maturity_factor
+    ps_hours = int(ps_hours) if np.ndim(ps_hours) == 0 else np.asarray(ps_hours).astype(int)
+
+    return {
+        "timeline_factor": timeline_factor,
+        "scope_factor": scope_factor,
+        "maturity_key": maturity_key,
+        "maturity_factor": maturity_factor,
+        "ps_hours": ps_hours
+    }
+
+
+def smoothed_density(counts, bin_edges, bandwidth, points=DENSITY_POINTS):
+    """Gaussian kernel density of the binned runs, scaled to runs per bin so it overlays the histogram"""
+    centers = (bin_edges[:-1] + bin_edges[1:]) / 2
+    bandwidth = max(bandwidth, np.diff(bin_edges).mean() / 2)
+    grid = np.linspace(bin_edges[0] - 2 * bandwidth, bin_edges[-1] + 2 * bandwidth, points)
+    kernel = np.exp(-0.5 * ((grid[:, None] - centers[None, :]) / bandwidth) ** 2) / (bandwidth * np.sqrt(2 * np.pi))
+    return grid, kernel @ counts * np.diff(bin_edges).mean()
+
+
+def _summarize(results, timeline, bins):
+    """Counts, density and percentiles of the simulated durations; the runs themselves are not kept"""
+    counts, bin_edges = np.histogram(results, bins=bins)
+    p50, p90 = np.percentile(results, [50, 90])
+    # Silverman's rule of thumb for the kernel bandwidth
+    bandwidth = 1.06 * results.std() * results.size ** -0.2
+    density_x, density_y = smoothed_density(counts, bin_edges, bandwidth)
+    on_time = (results <= timeline).mean()
+
+    return {
+        "counts": counts,
+        "bin_edges": bin_edges,
+        "density_x": density_x,
+        "density_y": density_y,
+        "p50": float(p50),
+        "p90": float(p90),
+        "on_time_probability": float(on_time * 100),
+        # Binomial sampling error of the on-time probability, in percentage points
+        "on_time_std_error": float(np.sqrt(on_time * (1 - on_time) / results.size) * 100),
+        "simulations": int(results.size)
+    }
+
+
+def simulate_timeline(expected_duration, timeline, simulations=DEFAULT_SIMULATIONS,
+                      sigma=DEFAULT_NOISE_SIGMA, bins=DEFAULT_HISTOGRAM_BINS, seed=DEFAULT_SEED):
+    """Run the rollout timeline Monte Carlo with a single batched draw"""
+    rng = np.random.default_rng(seed)
+
+    # One vectorized draw for every run instead of one np.random.normal call per sample
+    results = expected_duration * rng.normal(1.0, sigma, size=int(simulations))
+
+    return _summarize(results, timeline, bins)
+
+
+# Standard normal quantile of the 90th percentile, used for tornado decile cut-offs
+_Z90 = 1.2815515655446004
+# Standard normal quantile of the 99.9th percentile; analytic histograms span the central 99.8%
+_Z999 = 3.090232306167813
+
+_erfc = np.vectorize(math.erfc, otypes=[float])
+
+
+def _normal_cdf(z):
+    """Standard normal CDF of a scalar or array"""
+    return 0.5 * _erfc(-np.asarray(z, dtype=float) / math.sqrt(2))
+
+
+def _triangular_quantile(u, low, mode, high):
+    """Inverse CDF of the triangular distribution"""
+    split = (mode - low) / (high - low)
+    left = low + np.sqrt(u * (high - low) * (mode - low))
+    right = high - np.sqrt((1 - u) * (high - low) * (high - mode))
+    return np.where(u < split, left, right)
+
+
+def _multiplier_deciles(names, distributions):
+    """Analytic 10th/90th percentiles of each factor's multiplier"""
+    low_q = np.empty(len(names))
+    high_q = np.empty(len(names))
+    for i, name in enumerate(names):
+        spec = distributions[name]
+        if spec[0] == "triangular":
+            low_q[i], high_q[i] = _triangular_quantile(np.array([0.1, 0.9]), *spec[1:])
+        else:
+            low_q[i], high_q[i] = np.exp(-_Z90 * spec[1]), np.exp(_Z90 * spec[1])
+    return low_q, high_q
+
+
+def sample_factor_matrix(factors, simulations=DEFAULT_SIMULATIONS, seed=DEFAULT_SEED,
+                         distributions=FACTOR_DISTRIBUTIONS):
+    """Sample every duration factor at once as a (runs x factors) matrix"""
+    rng = np.random.default_rng(seed)
+    names = list(factors)
+    nominal = np.array([factors[name] for name in names], dtype=float)
+    multipliers = np.empty((int(simulations), len(names)))
+
+    # Group columns by distribution family so each family is a single batched draw.
+    # Both transforms are branch-free and cheaper than the broadcasting
+    # Generator.triangular and Generator.lognormal samplers.
+    tri_cols = [i for i, name in enumerate(names) if distributions[name][0] == "triangular"]
+    log_cols = [i for i, name in enumerate(names) if distributions[name][0] == "lognormal"]
+
+    if tri_cols:
+        low, mode, high = np.array([distributions[names[i]][1:] for i in tri_cols]).T
+        split = (mode - low) / (high - low)
+        # (1 - c) * min(U, V) + c * max(U, V) is Triangular(0, c, 1) (Stein & Keblis, 2009)
+        u = rng.random((2, int(simulations), len(tri_cols)))
+        standard = (1 - split) * np.minimum(u[0], u[1]) + split * np.maximum(u[0], u[1])
+        multipliers[:, tri_cols] = low + (high - low) * standard
+    if log_cols:
+        sigmas = np.array([distributions[names[i]][1] for i in log_cols])
+        multipliers[:, log_cols] = np.exp(rng.standard_normal((int(simulations), len(log_cols))) * sigmas)
+
+    return names, nominal * multipliers
+
+
+def factor_attribution(factors, matrix, durations, distributions=FACTOR_DISTRIBUTIONS):
+    """Attribute duration variance to each factor from a sampled factor matrix"""
+    # log(duration) is the sum of log(factor), so with independent factors the
+    # variance of the log-duration splits exactly into per-factor shares
+    log_var = np.log(matrix).var(axis=0)
+    total = log_var.sum()
+    share = log_var / total * 100 if total > 0 else np.zeros_like(log_var)
+
+    # Tornado swing: mean duration when a factor sits in its bottom vs top decile.
+    # The decile cut-offs are known in closed form, so no per-column sort is needed.
+    names = list(factors)
+    nominal = np.array([factors[name] for name in names], dtype=float)
+    low_q, high_q = _multiplier_deciles(names, distributions)
+    low_mask = matrix <= nominal * low_q
+    high_mask = matrix >= nominal * high_q
+    low_mean = durations @ low_mask / np.maximum(low_mask.sum(axis=0), 1)
+    high_mean = durations @ high_mask / np.maximum(high_mask.sum(axis=0), 1)
+
+    attribution = pd.DataFrame({
+        "Factor": names,
+        "Variance Share (%)": share,
+        "Low Duration": low_mean,
+        "High Duration": high_mean,
+        "Swing": high_mean - low_mean
+    })
+    return attribution.sort_values("Variance Share (%)", ascending=False, ignore_index=True)
+
+
+def simulate_factor_model(factors, timeline, simulations=DEFAULT_SIMULATIONS,
+                          bins=DEFAULT_HISTOGRAM_BINS, seed=DEFAULT_SEED,
+                          distributions=FACTOR_DISTRIBUTIONS):
+    """Run the per-factor stochastic rollout model and its variance attribution"""
+    _, matrix = sample_factor_matrix(factors, simulations, seed, distributions)
+    results = matrix.prod(axis=1)
+
+    summary = _summarize(results, timeline, bins)
+    summary["attribution"] = factor_attribution(factors, matrix, results, distributions)
+    return summary
+
+
+def _closed_form_summary(location, scale, timeline, lognormal, bins):
+    """Percentiles, on-time probability and binned shares of a normal or lognormal duration"""
+    def standardize(months):
+        months = np.asarray(months, dtype=float)
+        return ((np.log(months) if lognormal else months) - location) / scale
+
+    def quantile(z):
+        value = location + z * scale
+        return float(np.exp(value) if lognormal else value)
+
+    # Shares in percent per bin; the density is scaled the same way so it overlays the bars
+    bin_edges = np.linspace(quantile(-_Z999), quantile(_Z999), bins + 1)
+    counts = np.diff(_normal_cdf(standardize(bin_edges))) * 100
+    density_x = np.linspace(bin_edges[0], bin_edges[-1], DENSITY_POINTS)
+    pdf = np.exp(-standardize(density_x) ** 2 / 2) / (math.sqrt(2 * math.pi) * scale)
+    if lognormal:
+        pdf = pdf / density_x
+
+    return {
+        "distribution": "Lognormal" if lognormal else "Normal",
+        "counts": counts,
+        "bin_edges": bin_edges,
+        "density_x": density_x,
+        "density_y": pdf * np.diff(bin_edges).mean() * 100,
+        "p50": quantile(0),
+        "p90": quantile(_Z90),
+        "on_time_probability": float(_normal_cdf(standardize(timeline)) * 100)
+    }
+
+
+def analytic_timeline(expected_duration, timeline, sigma=DEFAULT_NOISE_SIGMA, bins=DEFAULT_HISTOGRAM_BINS):
+    """Closed-form counterpart of simulate_timeline; scaled normal noise makes the duration exactly normal"""
+    return _closed_form_summary(expected_duration, expected_duration * sigma, timeline, False, bins)
+
+
+@lru_cache(maxsize=None)
+def _multiplier_moments(spec):
+    """Mean and variance of a factor multiplier's log, its mean, and its mean in the bottom and top decile"""
+    if spec[0] == "lognormal":
+        sigma = spec[1]
+        mean = math.exp(sigma ** 2 / 2)
+        # E[exp(sigma Z); Z <= -z] = exp(sigma^2 / 2) * Phi(-z - sigma), and symmetrically for the top tail
+        tails = mean * _normal_cdf([-_Z90 - sigma, sigma - _Z90]) / 0.1
+        return 0.0, sigma ** 2, mean, float(tails[0]), float(tails[1])
+
+    # Midpoint quadrature over the triangular quantile function
+    multipliers = _triangular_quantile((np.arange(MOMENT_GRID_SIZE) + 0.5) / MOMENT_GRID_SIZE, *spec[1:])
+    logs = np.log(multipliers)
+    decile = MOMENT_GRID_SIZE // 10
+    return (float(logs.mean()), float(logs.var()), float(multipliers.mean()),
+            float(multipliers[:decile].mean()), float(multipliers[-decile:].mean()))
+
+
+def analytic_factor_model(factors, timeline, bins=DEFAULT_HISTOGRAM_BINS, distributions=FACTOR_DISTRIBUTIONS):
+    """Closed-form counterpart of simulate_factor_model: a lognormal fitted to the summed log-factor moments"""
+    names = list(factors)
+    nominal = np.array([factors[name] for name in names], dtype=float)
+    mean_log, var_log, mean, low, high = np.array([_multiplier_moments(distributions[name]) for name in names]).T
+
+    # log(duration) is a sum of independent log-factors, so its mean and variance add up
+    summary = _closed_form_summary(np.log(nominal).sum() + mean_log.sum(), np.sqrt(var_log.sum()),
+                                   timeline, True, bins)
+
+    # With independent factors, conditioning one factor on a decile only rescales the mean duration.
+    # Rows are ordered in numpy; DataFrame.sort_values would cost more than the whole estimate.
+    expected = nominal.prod() * mean.prod()
+    share = var_log / var_log.sum() * 100
+    order = np.argsort(-share, kind="stable")
+    summary["attribution"] = pd.DataFrame({
+        "Factor": np.array(names)[order],
+        "Variance Share (%)": share[order],
+        "Low Duration": (expected * low / mean)[order],
+        "High Duration": (expected * high / mean)[order],
+        "Swing": (expected * (high - low) / mean)[order]
+    })
+    return summary
+
+
+def estimator_error(analytic, simulation):
+    """Analytic estimates against a Monte Carlo run of the same model"""
+    metrics = {"P50 (months)": "p50", "P90 (months)": "p90", "On-Time Probability (%)": "on_time_probability"}
+    table = pd.DataFrame({
+        "Metric": list(metrics),
+        "Analytic": [analytic[key] for key in metrics.values()],
+        "Monte Carlo": [simulation[key] for key in metrics.values()]
+    })
+    table["Error"] = table["Analytic"] - table["Monte Carlo"]
+    return table
+
+
+def roadmap_phases(expected_duration, phases=ROADMAP_PHASES):
+    """Lay the roadmap phases end to end across the expected duration"""
+    shares = np.array([share for _, share in phases])
+    durations = expected_duration * shares
+    ends = np.cumsum(durations)
+
+    return pd.DataFrame({
+        "Phase": [phase for phase, _ in phases],
+        "Start": ends - durations,
+        "Duration": durations,
+        "End": ends
+    })
+
+
+@lru_cache(maxsize=ROLLOUT_CACHE_SIZE)
+def _cached_rollout_analysis(org_type, num_domains, num_users, maturity, adoption_support,
+                             exec_sponsorship, timeline, exec_connects, workshops, champion_strength,
+                             user_interviews, change_mgmt, dedicated_team, simulations, simulation_mode,
+                             monte_carlo):
+    factors = duration_factors(org_type, adoption_support, maturity, num_domains, num_users,
+                               exec_sponsorship, exec_connects, champion_strength, user_interviews,
+                               len(workshops), change_mgmt, dedicated_team)
+    expected_duration = expected_duration_from_factors(factors)
+
+    flags = risk_flags(exec_sponsorship, adoption_support, champion_strength, user_interviews,
+                       len(workshops), change_mgmt, dedicated_team)
+    risk = risk_score(flags)
+
+    if simulation_mode == "Per-Factor":
+        analytic = analytic_factor_model(factors, timeline)
+    else:
+        analytic = analytic_timeline(expected_duration, timeline)
+
+    simulation = None
+    if monte_carlo:
+        if simulation_mode == "Per-Factor":
+            simulation = simulate_factor_model(factors, timeline, simulations=simulations)
+        else:
+            simulation = simulate_timeline(expected_duration, timeline, simulations=simulations)
+
+    # Cached results are shared between reruns, so the binned arrays are made read-only
+    for summary in filter(None, (analytic, simulation)):
+        for key in ("counts", "bin_edges", "density_x", "density_y"):
+            summary[key].flags.writeable = False
+
+    return {
+        "factors": factors,
+        "expected_duration": expected_duration,
+        "risk_factors": [(name, factors[factor], flags[name]) for name, factor in RISK_FACTORS.items()],
+        "risk_score": risk,
+        "success_prob": success_probability(risk, len(workshops)),
+        "ps": ps_hours_breakdown(timeline, num_domains, num_users, maturity),
+        "analytic": analytic,
+        "simulation": simulation,
+        "cross_check": estimator_error(analytic, simulation) if simulation is not None else None,
+        "roadmap_df": roadmap_phases(expected_duration)
+    }
+
+
+def analyze_rollout(org_type, num_domains, num_users, maturity, adoption_support, exec_sponsorship,
+                    timeline, exec_connects, workshops_type, champion_strength, user_interviews,
+                    change_mgmt, dedicated_team, simulations=DEFAULT_SIMULATIONS,
+                    simulation_mode="Global Noise", monte_carlo=True):
+    """Return the memoized rollout analysis for one set of rollout page inputs; the Monte Carlo is optional"""
+    # Normalize the widget values so equivalent selections share one cache entry
+    return _cached_rollout_analysis(
+        org_type, int(num_domains), int(num_users), maturity, adoption_support, exec_sponsorship,
+        int(timeline), exec_connects, tuple(sorted(workshops_type)), champion_strength,
+        int(user_interviews), bool(change_mgmt), bool(dedicated_team),
+        # The run count only matters when the Monte Carlo runs
+        int(simulations) if monte_carlo else 0, simulation_mode, bool(monte_carlo)
+    )
+
+
+def rollout_cache_info():
+    """Hit, miss and size statistics of the memoized rollout analysis"""
+    return _cached_rollout_analysis.cache_info()
+
+
+# Scenario sweep defaults: every option of the five headline inputs, with the
+# remaining widgets held at the rollout page defaults
+SWEEP_GRID = {
+    "org_type": list(BASE_DURATION),
+    "maturity": list(MATURITY_FACTORS),
+    "adoption_support": ADOPTION_SUPPORT_LEVELS,
+    "champion_strength": list(CHAMPION_BOOST),
+    "exec_connects": list(EXEC_BOOST)
+}
+SWEEP_BASE = {
+    "num_domains": 5,
+    "num_users": 100,
+    "exec_sponsorship": "Yes",
+    "timeline": 6,
+    "user_interviews": 15,
+    "num_workshops": 0,
+    "change_mgmt": False,
+    "dedicated_team": False
+}
+SWEEP_CHUNK_SIZE = 250_000
+
+
+def scenario_grid(grid=None, base=None):
+    """Expand a parameter grid into one DataFrame row per scenario"""
+    grid = {**SWEEP_GRID, **(grid or {})}
+    base = {**SWEEP_BASE, **(base or {})}
+
+    # Base values are treated as single-option grid axes unless the grid sweeps them
+    axes = {**{key: [value] for key, value in base.items() if key not in grid}, **grid}
+    index = pd.MultiIndex.from_product(list(axes.values()), names=list(axes))
+
+    # Keep text axes as categoricals so large grids store small integer codes
+    return pd.DataFrame({
+        name: pd.Categorical.from_codes(index.codes[i], categories=index.levels[i])
+        if index.levels[i].dtype == object or pd.api.types.is_string_dtype(index.levels[i])
+        else index.levels[i].to_numpy()[index.codes[i]]
+        for i, name in enumerate(index.names)
+    })
+
+
+def evaluate_scenarios(scenarios, simulations=DEFAULT_SIMULATIONS, sigma=DEFAULT_NOISE_SIGMA,
+                       seed=DEFAULT_SEED):
+    """Compute the rollout metrics for every scenario row in one vectorized pass"""
+    factors = duration_factors(
+        scenarios["org_type"], scenarios["adoption_support"], scenarios["maturity"],
+        scenarios["num_domains"], scenarios["num_users"], scenarios["exec_sponsorship"],
+        scenarios["exec_connects"], scenarios["champion_strength"], scenarios["user_interviews"],
+        scenarios["num_workshops"], scenarios["change_mgmt"], scenarios["dedicated_team"]
+    )
+    expected = np.asarray(expected_duration_from_factors(factors), dtype=float)
+
+    flags = risk_flags(
+        scenarios["exec_sponsorship"], scenarios["adoption_support"], scenarios["champion_strength"],
+        scenarios["user_interviews"], scenarios["num_workshops"], scenarios["change_mgmt"],
+        scenarios["dedicated_team"]
+    )
+    score = np.asarray(risk_score(flags))
+    ps = ps_hours_breakdown(scenarios["timeline"], scenarios["num_domains"],
+                            scenarios["num_users"], scenarios["maturity"])
+
+    # simulate_timeline scales one shared noise draw by the expected duration, so every
+    # scenario's percentiles and on-time probability follow from a single sorted draw
+    noise = np.sort(np.random.default_rng(seed).normal(1.0, sigma, size=int(simulations)))
+    noise_p50, noise_p90 = np.percentile(noise, [50, 90])
+    on_time = np.searchsorted(noise, scenarios["timeline"].to_numpy() / expected, side="right")
+
+    results = scenarios.copy()
+    results["expected_duration"] = expected
+    results["risk_score"] = score
+    results["success_prob"] = np.asarray(success_probability(score, scenarios["num_workshops"]))
+    results["ps_hours"] = ps["ps_hours"]
+    results["ps_cost"] = ps["ps_hours"] * PS_HOURLY_RATE
+    results["p50"] = expected * noise_p50
+    results["p90"] = expected * noise_p90
+    results["on_time_probability"] = on_time / noise.size * 100
+    return results
+
+
+def sweep_scenarios(grid=None, base=None, simulations=DEFAULT_SIMULATIONS, sigma=DEFAULT_NOISE_SIGMA,
+                    seed=DEFAULT_SEED, workers=None, chunk_size=SWEEP_CHUNK_SIZE):
+    """Evaluate every rollout scenario in a parameter grid, optionally across a process pool"""
+    scenarios = scenario_grid(grid, base)
+
+    if not workers or len(scenarios) <= chunk_size:
+        return evaluate_scenarios(scenarios, simulations, sigma, seed)
+
+    # Very large grids are split into chunks; each worker redraws the same seeded noise
+    chunks = [scenarios.iloc[start:start + chunk_size] for start in range(0, len(scenarios), chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parts = pool.map(evaluate_scenarios, chunks, [simulations] * len(chunks),
+                         [sigma] * len(chunks), [seed] * len(chunks))
+        return pd.concat(list(parts), ignore_index=True)
@@ -0,0 +1,27 @@
+import math
+import os
+import sys
+
+try:
+    import resource
+except ImportError:
+    # Unix only; on Windows the memory figures are reported as NaN
+    resource = None
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB (ru_maxrss is bytes on macOS, kilobytes elsewhere), NaN if unknown"""
+    if resource is None:
+        return math.nan
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 ** 2 if sys.platform == 'darwin' else peak / 1024
+
+
+def process_rss_mb():
+    """Current resident set size of this process in MB"""
+    try:
+        with open('/proc/self/statm') as handle:
+            return int(handle.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1024 ** 2
+    except (OSError, ValueError):
+        # Without /proc, fall back to the peak RSS
+        return peak_rss_mb()
@@ -0,0 +1,342 @@
+import heapq
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+# Slack at or below this many weeks counts as critical
+CRITICAL_TOLERANCE = 1e-9
+# Slack up to this many weeks counts as near-critical
+NEAR_CRITICAL_SLACK = 2
+# Dependency entries that mean "no dependency"
+NO_DEPENDENCY = {"", "None"}
+
+
+class ScheduleError(ValueError):
+    """Raised when a task plan cannot be scheduled"""
+
+
+def _dependency_names(dependencies):
+    """Dependencies as a list of names, from a list or a comma-separated string"""
+    if _blank(dependencies):
+        return []
+    if isinstance(dependencies, str):
+        dependencies = dependencies.split(',')
+    return [str(name).strip() for name in dependencies if str(name).strip() not in NO_DEPENDENCY]
+
+
+def _blank(value):
+    """Whether an editor cell was left empty"""
+    return value is None or (not isinstance(value, (list, tuple)) and pd.isna(value))
+
+
+def _cycle_members(unplaced, successors):
+    """Unplaced tasks that sit on a cycle, after peeling off those merely downstream of one"""
+    unplaced = set(unplaced)
+    peeled = True
+    while peeled:
+        peeled = {task for task in unplaced if not any(succ in unplaced for succ in successors[task])}
+        unplaced -= peeled
+    return sorted(unplaced)
+
+
+def topological_order(predecessors, names=None):
+    """Kahn's algorithm over predecessor index lists, keeping input order among ready tasks"""
+    remaining = [len(preds) for preds in predecessors]
+    successors = [[] for _ in predecessors]
+    for task, preds in enumerate(predecessors):
+        for pred in preds:
+            successors[pred].append(task)
+
+    ready = deque(task for task, count in enumerate(remaining) if count == 0)
+    order = []
+    while ready:
+        task = ready.popleft()
+        order.append(task)
+        for succ in successors[task]:
+            remaining[succ] -= 1
+            if remaining[succ] == 0:
+                ready.append(succ)
+
+    if len(order) < len(predecessors):
+        placed = set(order)
+        cycle = _cycle_members([task for task in range(len(predecessors)) if task not in placed], successors)
+        raise ScheduleError("Dependency cycle between: " + ", ".join(str(names[task] if names else task)
+                                                                     for task in cycle))
+    return np.array(order, dtype=np.int64), successors
+
+
+def _task_inputs(tasks):
+    """Names, durations, release weeks and dependency names of the named tasks"""
+    names, durations, release, dependencies = [], [], [], []
+    for task in tasks:
+        name = '' if _blank(task.get('Task')) else str(task['Task']).strip()
+        if not name:
+            continue
+        duration = 0.0 if _blank(task.get('Duration')) else float(task['Duration'])
+        if not np.isfinite(duration) or duration < 0:
+            raise ScheduleError(f"{name}: duration must be a non-negative number of weeks")
+        names.append(name)
+        durations.append(duration)
+        # The entered start week is a release date: the task may not begin earlier
+        release.append(0.0 if _blank(task.get('Start')) else max(float(task['Start']), 0.0))
+        dependencies.append(tuple(_dependency_names(task.get('Dependencies'))))
+    return tuple(names), np.array(durations, dtype=float), np.array(release, dtype=float), tuple(dependencies)
+
+
+def task_graph(tasks):
+    """Index tasks and resolve their dependencies; names that are not tasks are external gates"""
+    names, durations, release, dependencies = _task_inputs(tasks)
+    index = {}
+    for position, name in enumerate(names):
+        if name in index:
+            raise ScheduleError(f"Task names must be unique: {name} appears more than once")
+        index[name] = position
+
+    predecessors, external = [], {}
+    for name, deps in zip(names, dependencies):
+        if name in deps:
+            raise ScheduleError(f"{name} cannot depend on itself")
+        predecessors.append(tuple(dict.fromkeys(index[dep] for dep in deps if dep in index)))
+        gates = [dep for dep in deps if dep not in index]
+        if gates:
+            external[name] = gates
+
+    order, successors = topological_order(predecessors, names)
+    rank = np.empty(len(names), dtype=np.int64)
+    rank[order] = np.arange(len(names))
+
+    return {
+        'names': names,
+        'index': index,
+        'durations': durations,
+        'release': release,
+        'dependencies': dependencies,
+        'predecessors': tuple(predecessors),
+        'successors': tuple(tuple(succs) for succs in successors),
+        'order': order,
+        'rank': rank,
+        'external': external
+    }
+
+
+def forward_pass(graph, durations=None):
+    """Earliest start and finish of every task, honouring release dates"""
+    durations = graph['durations'] if durations is None else durations
+    earliest_start = graph['release'].copy()
+    earliest_finish = np.empty_like(earliest_start)
+    predecessors = graph['predecessors']
+    for task in graph['order']:
+        for pred in predecessors[task]:
+            if earliest_finish[pred] > earliest_start[task]:
+                earliest_start[task] = earliest_finish[pred]
+        earliest_finish[task] = earliest_start[task] + durations[task]
+    return earliest_start, earliest_finish
+
+
+def backward_pass(graph, project_end, durations=None):
+    """Latest start and finish that keep the project end date"""
+    durations = graph['durations'] if durations is None else durations
+    latest_finish = np.full(len(durations), float(project_end))
+    latest_start = np.empty_like(latest_finish)
+    successors = graph['successors']
+    for task in graph['order'][::-1]:
+        for succ in successors[task]:
+            if latest_start[succ] < latest_finish[task]:
+                latest_finish[task] = latest_start[succ]
+        latest_start[task] = latest_finish[task] - durations[task]
+    return latest_start, latest_finish
+
+
+def _propagate(seeds, key, neighbours, recompute):
+    """Recompute the seeds, then only the neighbours of tasks whose dates moved, in dependency order"""
+    queue = [(key[task], task) for task in seeds]
+    heapq.heapify(queue)
+    queued = set(seeds)
+    while queue:
+        task = heapq.heappop(queue)[1]
+        if recompute(task):
+            for neighbour in neighbours[task]:
+                if neighbour not in queued:
+                    queued.add(neighbour)
+                    heapq.heappush(queue, (key[neighbour], neighbour))
+    return queued
+
+
+def _forward_update(graph, earliest_start, earliest_finish, seeds):
+    """Update earliest dates in place from the changed tasks downstream; the tasks visited"""
+    durations, release, predecessors = graph['durations'], graph['release'], graph['predecessors']
+
+    def recompute(task):
+        start = max([release[task]] + [earliest_finish[pred] for pred in predecessors[task]])
+        moved = start + durations[task] != earliest_finish[task]
+        earliest_start[task], earliest_finish[task] = start, start + durations[task]
+        return moved
+
+    return _propagate(seeds, graph['rank'], graph['successors'], recompute)
+
+
+def _backward_update(graph, latest_start, latest_finish, project_end, seeds):
+    """Update latest dates in place from the changed tasks upstream; the tasks visited"""
+    durations, successors = graph['durations'], graph['successors']
+
+    def recompute(task):
+        finish = min([project_end] + [latest_start[succ] for succ in successors[task]])
+        moved = finish - durations[task] != latest_start[task]
+        latest_start[task], latest_finish[task] = finish - durations[task], finish
+        return moved
+
+    return _propagate(seeds, -graph['rank'], graph['predecessors'], recompute)
+
+
+def critical_chain(graph, earliest_start, earliest_finish, critical):
+    """Critical tasks from the start to the project end, following the predecessors that drive each start"""
+    if not len(earliest_finish):
+        return []
+    task = int(np.argmax(np.where(critical, earliest_finish, -np.inf)))
+    chain = [task]
+    while True:
+        driving = [pred for pred in graph['predecessors'][task]
+                   if critical[pred] and abs(earliest_finish[pred] - earliest_start[task]) <= CRITICAL_TOLERANCE]
+        if not driving:
+            break
+        task = max(driving, key=lambda pred: earliest_finish[pred])
+        chain.append(task)
+    return [graph['names'][task] for task in reversed(chain)]
+
+
+def schedule_frame(graph, earliest_start, earliest_finish, latest_start, latest_finish):
+    """One row per task, in input order, with its CPM dates and slack"""
+    slack = latest_start - earliest_start
+    names = graph['names']
+    return pd.DataFrame({
+        'Task': names,
+        'Duration': graph['durations'],
+        'Earliest Start': earliest_start,
+        'Earliest Finish': earliest_finish,
+        'Latest Start': latest_start,
+        'Latest Finish': latest_finish,
+        'Slack': slack,
+        'Critical': slack <= CRITICAL_TOLERANCE,
+        'Criticality': np.select([slack <= CRITICAL_TOLERANCE, slack <= NEAR_CRITICAL_SLACK],
+                                 ['Critical', 'Near-Critical'], 'Flexible'),
+        'Depends On': [', '.join(names[pred] for pred in preds) for preds in graph['predecessors']],
+        'External Gates': [', '.join(graph['external'].get(name, [])) for name in names]
+    })
+
+
+def dependency_frame(graph):
+    """Task by predecessor matrix: Required for scheduled tasks, External Gate for approvals outside the plan"""
+    names = list(graph['names'])
+    gates = list(dict.fromkeys(gate for name in names for gate in graph['external'].get(name, [])))
+    cells = np.full((len(names), len(names) + len(gates)), '', dtype=object)
+    for task, preds in enumerate(graph['predecessors']):
+        cells[task, list(preds)] = 'Required'
+        for gate in graph['external'].get(names[task], []):
+            cells[task, len(names) + gates.index(gate)] = 'External Gate'
+    return pd.DataFrame(cells, index=pd.Index(names, name='Task'), columns=names + gates)
+
+
+def _plan(graph, earliest_start, earliest_finish, latest_start, latest_finish, project_end, recomputed):
+    """Assemble a plan from the CPM dates"""
+    schedule = schedule_frame(graph, earliest_start, earliest_finish, latest_start, latest_finish)
+    return {
+        'graph': graph,
+        'schedule': schedule,
+        'duration': project_end,
+        'critical_path': critical_chain(graph, earliest_start, earliest_finish, schedule['Critical'].to_numpy()),
+        'recomputed': recomputed
+    }
+
+
+def critical_path_schedule(tasks):
+    """Topologically sort the tasks and run the CPM forward and backward passes"""
+    graph = task_graph(tasks)
+    earliest_start, earliest_finish = forward_pass(graph)
+    project_end = float(earliest_finish.max()) if len(earliest_finish) else 0.0
+    latest_start, latest_finish = backward_pass(graph, project_end)
+    return _plan(graph, earliest_start, earliest_finish, latest_start, latest_finish, project_end, len(graph['names']))
+
+
+def update_schedule(previous, tasks):
+    """CPM plan for the tasks; with the same graph as the previous plan, only tasks a change reaches are recomputed"""
+    names, durations, release, dependencies = _task_inputs(tasks)
+    graph = previous['graph'] if previous else None
+    if graph is None or graph['names'] != names or graph['dependencies'] != dependencies:
+        return critical_path_schedule(tasks)
+
+    retimed = durations != graph['durations']
+    changed = np.flatnonzero(retimed | (release != graph['release']))
+    if not len(changed):
+        return dict(previous, recomputed=0)
+
+    graph = dict(graph, durations=durations, release=release)
+    schedule = previous['schedule']
+    earliest_start = schedule['Earliest Start'].to_numpy(dtype=float, copy=True)
+    earliest_finish = schedule['Earliest Finish'].to_numpy(dtype=float, copy=True)
+    recomputed = _forward_update(graph, earliest_start, earliest_finish, changed)
+
+    project_end = float(earliest_finish.max())
+    if project_end != previous['duration']:
+        # A new finish date moves every latest date
+        latest_start, latest_finish = backward_pass(graph, project_end)
+        recomputed = set(range(len(names)))
+    else:
+        # Latest dates ignore release weeks, so only retimed tasks and their predecessors can move
+        latest_start = schedule['Latest Start'].to_numpy(dtype=float, copy=True)
+        latest_finish = schedule['Latest Finish'].to_numpy(dtype=float, copy=True)
+        recomputed |= _backward_update(graph, latest_start, latest_finish, project_end, np.flatnonzero(retimed))
+    return _plan(graph, earliest_start, earliest_finish, latest_start, latest_finish, project_end, len(recomputed))
+
+
+def schedule_insights(plan, limit=3):
+    """Plain-language findings on the critical path, the float of the other tasks and where work converges"""
+    schedule, graph = plan['schedule'], plan['graph']
+    path = plan['critical_path']
+    if not path:
+        return []
+
+    def names(tasks):
+        tasks = [f"**{task}**" for task in tasks]
+        more = len(tasks) - limit
+        tasks = tasks[:limit] + ([f"{more} more"] if more > 0 else [])
+        return tasks[0] if len(tasks) == 1 else ', '.join(tasks[:-1]) + ' and ' + tasks[-1]
+
+    insights = []
+    if len(path) == 1:
+        insights.append(f"**{path[0]}** alone sets the {plan['duration']:g}-week finish - any delay to it moves the end date")
+    else:
+        insights.append(f"**{path[0]}** heads the critical path - a delay to any of its {len(path)} tasks "
+                        f"moves the {plan['duration']:g}-week finish")
+    parallel = [task for task in schedule.loc[schedule['Critical'], 'Task'] if task not in path]
+    if parallel:
+        insights.append(f"{names(parallel)} {'is' if len(parallel) == 1 else 'are'} also critical on a parallel path")
+    head = graph['index'][path[0]]
+    if graph['release'][head] > 0:
+        insights.append(f"**{path[0]}** waits for its week-{graph['release'][head]:g} start, not for other work - "
+                        f"starting it earlier shortens the plan")
+
+    flexible = schedule[~schedule['Critical']].sort_values('Slack', ascending=False)
+    if len(flexible):
+        insights.append("Float without moving the finish: " + ', '.join(
+            f"**{task}** {slack:g} weeks" for task, slack in zip(flexible['Task'][:limit], flexible['Slack'][:limit])))
+    near = schedule[schedule['Criticality'] == 'Near-Critical']
+    if len(near):
+        insights.append(f"{names(near['Task'])} {'is' if len(near) == 1 else 'are'} near-critical, "
+                        f"with {NEAR_CRITICAL_SLACK} weeks of float or less")
+
+    # Only merges on the critical path: a late branch into one of them moves the finish
+    critical = set(schedule.loc[schedule['Critical'], 'Task'])
+    merges = [task for task, preds in enumerate(graph['predecessors'])
+              if len(preds) > 1 and graph['names'][task] in critical]
+    for task in merges[:limit]:
+        insights.append(f"**{graph['names'][task]}** depends on "
+                        f"{names(graph['names'][pred] for pred in graph['predecessors'][task])}")
+    gated = [name for name in path if name in graph['external']]
+    if gated:
+        insights.append(f"{names(gated)} on the critical path {'needs' if len(gated) == 1 else 'need'} "
+                        f"external approvals the schedule cannot see")
+
+    first = schedule.loc[schedule['Earliest Finish'].idxmin()]
+    insights.append(f"The first deliverable is **{first['Task']}**, finishing in week {first['Earliest Finish']:g}")
+    return insights
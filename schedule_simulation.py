@@ -0,0 +1,122 @@
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from schedule_engine import topological_order
+
+# Default Monte Carlo settings used by the implementation planner
+DEFAULT_SCHEDULE_RUNS = 10000
+DEFAULT_SCHEDULE_SEED = 42
+SCHEDULE_HISTOGRAM_BINS = 40
+# Number of distinct plans whose simulation is kept
+SCHEDULE_SIMULATION_CACHE_SIZE = 8
+# Durations are drawn by indexing a per-task quantile table; numpy's beta sampler is several times slower
+PERT_TABLE_SIZE = 4096
+PERT_GRID_SIZE = 16384
+# Weight of the most likely value in the PERT mean, (optimistic + 4 * likely + pessimistic) / 6
+PERT_WEIGHT = 4
+
+
+def three_point_estimates(graph, tasks):
+    """Optimistic, likely and pessimistic weeks per scheduled task; blanks fall back to the likely duration"""
+    by_name = {str(task.get('Task')).strip(): task for task in tasks}
+    likely = graph['durations']
+
+    def column(name):
+        values = [by_name[task].get(name) for task in graph['names']]
+        return np.array([np.nan if value is None or pd.isna(value) else float(value) for value in values])
+
+    optimistic, pessimistic = column('Optimistic'), column('Pessimistic')
+    optimistic = np.minimum(np.where(np.isnan(optimistic), likely, np.maximum(optimistic, 0)), likely)
+    pessimistic = np.maximum(np.where(np.isnan(pessimistic), likely, pessimistic), likely)
+    return optimistic, likely, pessimistic
+
+
+def pert_quantiles(optimistic, likely, pessimistic, size=PERT_TABLE_SIZE):
+    """Beta-PERT quantile table per task: column k holds the duration at probability (k + 0.5) / size"""
+    optimistic, likely, pessimistic = (np.asarray(values, dtype=float) for values in (optimistic, likely, pessimistic))
+    span = pessimistic - optimistic
+    spread = np.where(span > 0, span, 1)
+    alpha = 1 + PERT_WEIGHT * (likely - optimistic) / spread
+    beta = 1 + PERT_WEIGHT * (pessimistic - likely) / spread
+
+    grid = (np.arange(PERT_GRID_SIZE) + 0.5) / PERT_GRID_SIZE
+    log_density = np.outer(alpha - 1, np.log(grid)) + np.outer(beta - 1, np.log1p(-grid))
+    cdf = np.cumsum(np.exp(log_density - log_density.max(axis=1, keepdims=True)), axis=1)
+    cdf /= cdf[:, -1:]
+    probabilities = (np.arange(size) + 0.5) / size
+    shares = np.array([np.interp(probabilities, row, grid) for row in cdf]).reshape(len(span), size)
+    return (optimistic[:, None] + span[:, None] * shares).astype(np.float32)
+
+
+@lru_cache(maxsize=SCHEDULE_SIMULATION_CACHE_SIZE)
+def _cached_simulation(predecessors, release, optimistic, likely, pessimistic, runs, seed):
+    """Propagate every run through the task graph at once, one topological step per task"""
+    order, _ = topological_order(predecessors)
+    quantiles = pert_quantiles(optimistic, likely, pessimistic)
+    rng = np.random.default_rng(seed)
+    tasks = len(predecessors)
+    every_run = np.arange(runs)
+
+    finish = np.empty((tasks, runs), dtype=np.float32)
+    # The predecessor whose finish set each task's start in each run, or -1 when its start week did
+    driver = np.full((tasks, runs), -1, dtype=np.int16 if tasks < np.iinfo(np.int16).max else np.int32)
+    for task in order:
+        durations = np.take(quantiles[task], rng.integers(0, PERT_TABLE_SIZE, runs, dtype=np.int16))
+        preds = predecessors[task]
+        if not preds:
+            np.add(durations, release[task], out=finish[task])
+            continue
+        # Masks and reductions along each row; argmax across the rows is far slower
+        start = np.maximum.reduce(finish[list(preds)]) if len(preds) > 1 else finish[preds[0]]
+        driver[task] = preds[0]
+        for pred in preds[1:]:
+            driver[task][finish[pred] == start] = pred
+        if release[task] > 0:
+            driver[task][start <= release[task]] = -1
+        np.add(np.maximum(start, release[task]), durations, out=finish[task])
+
+    # Walk each run's critical chain back from the task that finished last
+    last = finish.argmax(axis=0)
+    end = finish[last, every_run]
+    critical = np.zeros((tasks, runs), dtype=bool)
+    critical[last, every_run] = True
+    for task in order[::-1]:
+        for pred in predecessors[task]:
+            critical[pred] |= critical[task] & (driver[task] == pred)
+
+    counts, edges = np.histogram(end, bins=SCHEDULE_HISTOGRAM_BINS)
+    return {
+        'finish': np.sort(end),
+        'counts': counts,
+        'edges': edges,
+        'criticality': critical.mean(axis=1),
+        'mean': float(end.mean())
+    }
+
+
+def _floats(values):
+    """Hashable copy of an array of weeks for the simulation cache"""
+    return tuple(float(value) for value in values)
+
+
+def simulate_schedule(graph, optimistic, likely, pessimistic, runs=DEFAULT_SCHEDULE_RUNS, seed=DEFAULT_SCHEDULE_SEED):
+    """Finish-week distribution and per-task criticality index of a plan with PERT durations"""
+    return _cached_simulation(graph['predecessors'], _floats(graph['release']), _floats(optimistic),
+                              _floats(likely), _floats(pessimistic), int(runs), int(seed))
+
+
+def finish_probability(simulation, weeks):
+    """Share of runs finishing within the given number of weeks"""
+    return np.searchsorted(simulation['finish'], weeks, side='right') / len(simulation['finish'])
+
+
+def finish_percentile(simulation, percent):
+    """Finish week that the given percentage of runs meet"""
+    return float(np.percentile(simulation['finish'], percent))
+
+
+def schedule_simulation_cache_info():
+    """Hit and miss statistics of the memoized schedule simulation"""
+    return _cached_simulation.cache_info()
@@ -0,0 +1,146 @@
+import hashlib
+import json
+import os
+import threading
+from types import MappingProxyType
+
+# Object fields that tag a schema node, and fields that name its EU AI Act article(s)
+TAG_KEYS = ('tags', 'eu_tags')
+ARTICLE_KEYS = ('article', 'articles', 'eu_article')
+# The sidecar holds plain JSON key paths, never executable data, so a tampered file can only fail to resolve
+SIDECAR_SUFFIX = '.index.json'
+SIDECAR_VERSION = 2
+
+_loaded = {}
+_lock = threading.Lock()
+
+
+class SchemaError(ValueError):
+    """Raised when the compliance schema does not have the expected shape"""
+
+
+def _labels(node, keys, path):
+    """Collect string labels from the given fields of a node, validating their type"""
+    labels = []
+    for key in keys:
+        value = node.get(key)
+        if value is None:
+            continue
+        values = [value] if isinstance(value, str) else value
+        if not isinstance(values, list) or not all(isinstance(item, str) for item in values):
+            raise SchemaError(f"{path}.{key} must be a string or a list of strings")
+        labels.extend(values)
+    return labels
+
+
+def _path_text(keys):
+    """JSONPath-style rendering of a key path for error messages"""
+    return '$' + ''.join(f"[{key}]" if isinstance(key, int) else f".{key}" for key in keys)
+
+
+def index_paths(schema):
+    """Validate the schema and collect the key path of every tagged node by tag and by article"""
+    if not isinstance(schema, dict):
+        raise SchemaError("schema root must be a JSON object")
+
+    by_tag, by_article = {}, {}
+    stack = [(schema, ())]
+    while stack:
+        node, keys = stack.pop()
+        if isinstance(node, dict):
+            for tag in _labels(node, TAG_KEYS, _path_text(keys)):
+                by_tag.setdefault(tag.lower(), []).append(keys)
+            for article in _labels(node, ARTICLE_KEYS, _path_text(keys)):
+                by_article.setdefault(article, []).append(keys)
+            stack.extend((child, keys + (key,)) for key, child in reversed(list(node.items())))
+        elif isinstance(node, list):
+            stack.extend((child, keys + (position,)) for position, child in reversed(list(enumerate(node))))
+    return {'by_tag': by_tag, 'by_article': by_article}
+
+
+def _node(schema, keys):
+    for key in keys:
+        schema = schema[key]
+    return schema
+
+
+def _resolve(schema, paths):
+    """Turn key paths back into the nodes of the parsed schema"""
+    return {
+        'schema': schema,
+        'by_tag': {tag: [_node(schema, keys) for keys in found] for tag, found in paths['by_tag'].items()},
+        'by_article': {article: [_node(schema, keys) for keys in found]
+                       for article, found in paths['by_article'].items()}
+    }
+
+
+def index_schema(schema):
+    """Validate the schema and index every tagged node by tag and by article"""
+    return _resolve(schema, index_paths(schema))
+
+
+def _read_sidecar(sidecar_path, digest):
+    """Return the indexed key paths if the sidecar was written for this exact file content"""
+    try:
+        with open(sidecar_path, 'r', encoding='utf-8') as handle:
+            sidecar = json.load(handle)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(sidecar, dict) or sidecar.get('version') != SIDECAR_VERSION or sidecar.get('digest') != digest:
+        return None
+    return sidecar.get('paths')
+
+
+def _write_sidecar(sidecar_path, digest, paths):
+    """Best-effort write of the index cache; read-only deployments simply skip it"""
+    temporary = f"{sidecar_path}.{os.getpid()}.tmp"
+    try:
+        with open(temporary, 'w', encoding='utf-8') as handle:
+            json.dump({'version': SIDECAR_VERSION, 'digest': digest, 'paths': paths}, handle)
+        os.replace(temporary, sidecar_path)
+    except OSError:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+
+
+def load_schema(path, sidecar=True):
+    """Load, validate and index the schema once per process, reloading only when the file changes"""
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+
+    with _lock:
+        cached = _loaded.get(path)
+        # Unchanged mtime and size: no read at all
+        if cached and cached['mtime_ns'] == stat.st_mtime_ns and cached['size'] == stat.st_size:
+            return cached['index']
+
+        with open(path, 'rb') as handle:
+            content = handle.read()
+        digest = hashlib.sha256(content).hexdigest()
+
+        if cached and cached['digest'] == digest:
+            index = cached['index']
+        else:
+            try:
+                schema = json.loads(content)
+            except ValueError as error:
+                raise SchemaError(f"{path} is not valid JSON: {error}") from error
+
+            # A sidecar written for this content skips validation and the tree walk
+            sidecar_path = path + SIDECAR_SUFFIX
+            raw = None
+            paths = _read_sidecar(sidecar_path, digest) if sidecar else None
+            if paths is not None:
+                try:
+                    raw = _resolve(schema, paths)
+                except (KeyError, IndexError, TypeError, AttributeError):
+                    raw = None
+            if raw is None:
+                paths = index_paths(schema)
+                raw = _resolve(schema, paths)
+                if sidecar:
+                    _write_sidecar(sidecar_path, digest, paths)
+            index = MappingProxyType(dict(raw, digest=digest))
+
+        _loaded[path] = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'digest': digest, 'index': index}
+        return index
@@ -0,0 +1,35 @@
+from datetime import datetime
+
+from compliance_report import render_html_report
+from compliance_scoring import score_compliance
+from compliance_store import answer_frame, answers_from_dicts
+
+ARTICLE = 'Article 9 <script>alert("x")</script> & Annex III'
+
+
+def _report(article=ARTICLE, org_name='Acme <b>Labs</b>'):
+    questions, codes = answers_from_dicts({
+        'q1': {
+            'question': 'Is there a <risk> & impact process?',
+            'article': article,
+            'risk_level': 'high',
+            'implementation_effort': 'medium',
+            'section': 'Risk & Oversight',
+            'answer': 'No - Not Compliant'
+        }
+    })
+    return render_html_report({'name': org_name}, answer_frame(questions, codes), 'both',
+                              score_compliance(questions, codes), datetime(2026, 1, 5))
+
+
+def test_article_markup_is_escaped():
+    html = _report()
+    assert '<script>' not in html
+    assert 'Article 9 &lt;script&gt;alert(&quot;x&quot;)&lt;/script&gt; &amp; Annex III' in html
+
+
+def test_question_and_org_fields_are_escaped():
+    html = _report()
+    assert 'Is there a &lt;risk&gt; &amp; impact process?' in html
+    assert 'Acme &lt;b&gt;Labs&lt;/b&gt;' in html
+    assert '<b>Labs</b>' not in html
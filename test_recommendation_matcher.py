@@ -0,0 +1,43 @@
+import pytest
+
+from assessment_catalog import build_catalog
+from recommendation_matcher import DEFAULT_RECOMMENDATION, get_atlan_recommendations, match_recommendations
+
+# Registration questions as the enhanced tool and the shared catalog ask them, with their clauses
+REGISTRATION_QUESTIONS = [
+    ("Article 60 – EU database for high-risk AI systems",
+     "Are AI systems registered in the EU database when required?"),
+    ("Article 53 – Obligations for providers of GPAI models",
+     "Have you registered your model with EU authorities?")
+]
+
+
+def _keywords(text):
+    return [keyword for keyword, _ in match_recommendations(text)]
+
+
+@pytest.mark.parametrize("clause, question", REGISTRATION_QUESTIONS)
+def test_registered_questions_get_the_registration_recommendation(clause, question):
+    assert "registration" in _keywords(f"{clause} {question}")
+    assert "registration" in _keywords(question)
+
+
+def test_catalog_registration_question_matches():
+    questions = [q['text'] for q in build_catalog()['questions'] if 'EU database' in q['text']]
+    assert questions
+    for question in questions:
+        assert "registration" in _keywords(question)
+
+
+@pytest.mark.parametrize("text, keyword", [
+    ("documented documents documentation", "documentation"),
+    ("compliant systems comply", "compliance"),
+    ("CE marking", "marking")
+])
+def test_inflections_share_a_keyword(text, keyword):
+    assert _keywords(text) == [keyword]
+
+
+def test_unrelated_words_fall_back_to_the_default():
+    assert _keywords("market analysis") == []
+    assert get_atlan_recommendations("market analysis") == DEFAULT_RECOMMENDATION